@@ -0,0 +1,159 @@
+"""
+Async (ASGI-native) versions of the read endpoints, mounted under
+``/api/async/``.
+
+DRF's ``@api_view`` only wraps sync functions, so under an ASGI server every
+request to ``api.views`` is handed to a worker thread for its whole life.
+These are plain ``async def`` Django views on the async ORM (``afirst``,
+``acount``, ``aaggregate``, ``async for``). They build their output from the
+same pieces as the sync views (``fieldsets``, ``fastpath``, ``pagination``,
+``conditional``), so response bodies match the sync endpoints. Django still
+runs each SQL statement through its database thread, but request handling,
+validation and rendering stay on the event loop.
+
+They are public reads: no JWT authentication runs, and the response cache is
+not consulted.
+"""
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+from rest_framework.request import Request
+
+from base.models import Event, Registration
+from base import stats
+from base.search import search_backend, search_events
+from . import conditional, fastpath, fieldsets, filters, pagination
+from .renderers import FastJSONRenderer
+
+
+def _json(data, status=200):
+    return HttpResponse(FastJSONRenderer().render(data), status=status, content_type='application/json')
+
+
+def _not_found():
+    return _json({'error': 'Event not found'}, status=404)
+
+
+async def _represent(rows, fields):
+    roster_map = None
+    if fieldsets.ROSTER in fields:
+        roster_map = await fastpath.arosters(fastpath.row_ids(rows))
+    return fastpath.represent(rows, fields, roster_map)
+
+
+async def _list_response(request, events, *ordering):
+    # Mirrors views._list_response; ``request`` is wrapped for query_params.
+    request = Request(request)
+    ordering = ordering or (pagination.TIEBREAKER,)
+    try:
+        fields = fieldsets.requested(request)
+    except fieldsets.FieldsetError as exc:
+        return _json({'error': str(exc)}, status=400)
+
+    etag, last_modified = await conditional.alist_validators(request)
+    not_modified = conditional.not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    rows = fastpath.event_rows(events, fields, ordering)
+    if not pagination.is_requested(request):
+        rows = [row async for row in rows.order_by(*pagination.order_by(ordering))]
+        return conditional.set_validators(_json(await _represent(rows, fields)), etag, last_modified)
+
+    try:
+        page_size = pagination.get_page_size(request)
+        rows, next_cursor = await pagination.apaginate(
+            rows, ordering, page_size, request.query_params.get('cursor')
+        )
+    except pagination.PaginationError as exc:
+        return _json({'error': str(exc)}, status=400)
+
+    data = {'results': await _represent(rows, fields), 'next_cursor': next_cursor, 'page_size': page_size}
+    return conditional.set_validators(_json(data), etag, last_modified)
+
+
+@require_GET
+async def getEvents(request):
+    return await _list_response(request, Event.objects.all(), 'event_end_date')
+
+
+@require_GET
+async def getEvent(request, eventID):
+    events = Event.objects.filter(eventID=eventID)
+    if conditional.is_conditional(request):
+        updated_at = await events.values_list('updated_at', flat=True).afirst()
+        if updated_at is None:
+            return _not_found()
+        not_modified = conditional.not_modified(request, *conditional.validators(request, updated_at))
+        if not_modified:
+            return not_modified
+
+    row = await fastpath.event_rows(events, fieldsets.ALL_FIELDS, []).afirst()
+    if row is None:
+        return _not_found()
+    (data,) = await _represent([row], fieldsets.ALL_FIELDS)
+    return conditional.set_validators(_json(data), *conditional.validators(request, row.updated_at))
+
+
+@require_GET
+async def getRegisteredStudents(request, eventID):
+    updated_at = await Event.objects.filter(eventID=eventID).values_list('updated_at', flat=True).afirst()
+    if updated_at is None:
+        return _not_found()
+    etag, last_modified = conditional.validators(request, updated_at)
+    not_modified = conditional.not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    students = (
+        Registration.objects.filter(event_id=eventID, status=Registration.REGISTERED)
+        .order_by('registered_at', 'id')
+        .values_list('student_id', flat=True)
+    )
+    data = {'registered_students': [student async for student in students]}
+    return conditional.set_validators(_json(data), etag, last_modified)
+
+
+@require_GET
+async def getEventCount(request):
+    return _json({'event_count': await stats.aevent_count()})
+
+
+@require_GET
+async def getUpcomingEvents(request):
+    events = Event.objects.filter(event_start_date__gte=timezone.now())
+    return await _list_response(request, events, 'event_start_date')
+
+
+@require_GET
+async def getPastEvents(request):
+    events = Event.objects.filter(event_end_date__lt=timezone.now())
+    return await _list_response(request, events, '-event_end_date')
+
+
+@require_GET
+async def getEventsByType(request, eventType):
+    return await _list_response(request, Event.objects.filter(eventType=eventType), 'event_start_date')
+
+
+@require_GET
+async def getEventsByMultipleFilters(request):
+    if request.GET.get('q'):
+        await sync_to_async(search_backend)(Event.objects.db)
+    try:
+        events, ordering = filters.build(request.GET)
+    except filters.QueryError as exc:
+        return _json({'error': str(exc)}, status=400)
+    return await _list_response(request, events, *ordering)
+
+
+@require_GET
+async def searchEvents(request):
+    # The backend is detected (schema introspection) on first use; keep that
+    # off the event loop. Later calls hit its cache, which is keyed on the
+    # alias search_events passes.
+    await sync_to_async(search_backend)(Event.objects.db)
+    events = search_events(Event.objects.all(), request.GET.get('q', ''))
+    return await _list_response(request, events, 'search_rank')
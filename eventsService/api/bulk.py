@@ -0,0 +1,185 @@
+"""
+Batch writes for importing and maintaining whole term calendars.
+
+The bulk endpoints take a JSON array, or NDJSON with one item per line.
+Every item is validated by a single ``EventSerializer`` instance. The valid
+items are then written in one transaction with ``bulk_create``,
+``bulk_update`` or one ``DELETE``. The response carries one result per
+input item, in input order. An item that fails validation or the ownership
+check is reported and skipped; it does not abort the rest of the batch.
+
+Bulk writes do not send ``post_save``, so the response cache is invalidated
+explicitly.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from base import registration
+from base.invalidation import invalidate_events
+from base.models import Event, Registration
+
+from .permissions import IsOwnerOrAdmin
+from .serializers import EventSerializer
+
+DEFAULT_MAX_ITEMS = 5000
+
+Result = Dict[str, Any]
+
+
+class BulkError(ValueError):
+    """Raised when the body is not a non-empty list within the size limit."""
+
+
+def max_items() -> int:
+    return getattr(settings, "EVENTS_API", {}).get("BULK_MAX_ITEMS", DEFAULT_MAX_ITEMS)
+
+
+def items(data) -> List[Any]:
+    if not isinstance(data, list):
+        raise BulkError("Expected a JSON array or an NDJSON body")
+    if not data:
+        raise BulkError("No items given")
+    limit = max_items()
+    if len(data) > limit:
+        raise BulkError(f"At most {limit} items per request")
+    return data
+
+
+def summary(results: List[Result], success: int) -> Tuple[Dict[str, Any], int]:
+    """
+    Response body and status for a batch: ``success`` if every item
+    succeeded, 400 if none did, otherwise 207 Multi-Status.
+    """
+    succeeded = sum(1 for result in results if result["status"] < 400)
+    failed = len(results) - succeeded
+    if not failed:
+        status = success
+    else:
+        status = 400 if not succeeded else 207
+    return {"results": results, "succeeded": succeeded, "failed": failed}, status
+
+
+def _result(index: int, status: int, **extra) -> Result:
+    return {"index": index, "status": status, **extra}
+
+
+def _event_id(item) -> Optional[int]:
+    raw = item.get("eventID") if isinstance(item, dict) else item
+    if isinstance(raw, bool):
+        return None
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def _targets(items: List[Any]) -> Tuple[List[Result], Dict[int, int]]:
+    # Map eventID -> item index; items without a usable or unique ID fail.
+    results: List[Result] = [None] * len(items)  # type: ignore[list-item]
+    targets: Dict[int, int] = {}
+    for index, item in enumerate(items):
+        event_id = _event_id(item)
+        if event_id is None:
+            results[index] = _result(index, 400, errors={"eventID": ["A valid integer is required."]})
+        elif event_id in targets:
+            results[index] = _result(index, 400, eventID=event_id, errors={"eventID": ["Duplicate eventID in batch."]})
+        else:
+            targets[event_id] = index
+    return results, targets
+
+
+def _not_allowed(request, event) -> bool:
+    return not IsOwnerOrAdmin().has_object_permission(request, view=None, obj=event)
+
+
+def create(items: List[Any], creator_id) -> List[Result]:
+    serializer = EventSerializer()
+    results: List[Result] = []
+    pending: List[Tuple[Result, Event]] = []
+    for index, item in enumerate(items):
+        try:
+            data = serializer.run_validation(item)
+        except ValidationError as exc:
+            results.append(_result(index, 400, errors=exc.detail))
+            continue
+        results.append(_result(index, 201))
+        # As in createEvent, the token's id wins over any creator_id sent.
+        pending.append((results[-1], Event(**{**data, 'creator_id': creator_id})))
+
+    if pending:
+        with transaction.atomic():
+            Event.objects.bulk_create([event for _, event in pending])
+            invalidate_events()
+        for result, event in pending:
+            result["eventID"] = event.eventID
+    return results
+
+
+def update(items: List[Any], request, partial: bool = False) -> List[Result]:
+    results, targets = _targets(items)
+    serializer = EventSerializer(partial=partial)
+    now = timezone.now()
+    with transaction.atomic():
+        events = Event.objects.select_for_update().in_bulk(list(targets))
+        # One bulk_update per set of submitted columns, so no row has a
+        # column written that its item did not send.
+        groups: Dict[Tuple[str, ...], List[Event]] = defaultdict(list)
+        resized: List[int] = []
+        for event_id, index in targets.items():
+            event = events.get(event_id)
+            if event is None:
+                results[index] = _result(index, 404, eventID=event_id, error="Event not found")
+                continue
+            if _not_allowed(request, event):
+                results[index] = _result(index, 403, eventID=event_id, error="You are not allowed to access this event.")
+                continue
+            try:
+                data = serializer.run_validation(items[index])
+            except ValidationError as exc:
+                results[index] = _result(index, 400, eventID=event_id, errors=exc.detail)
+                continue
+            for attr, value in data.items():
+                setattr(event, attr, value)
+            event.updated_at = now
+            groups[tuple(sorted(data))].append(event)
+            if "capacity" in data:
+                resized.append(event_id)
+            results[index] = _result(index, 200, eventID=event_id)
+
+        for fields, group in groups.items():
+            Event.objects.bulk_update(group, [*fields, "updated_at"])
+        # Only events with someone waiting can have seats to fill.
+        waiting = Registration.objects.filter(event_id__in=resized, status=Registration.WAITLISTED)
+        for event_id in waiting.values_list("event_id", flat=True).distinct():
+            registration.fill_open_seats(event_id)
+        if groups:
+            invalidate_events()
+    return results
+
+
+def delete(items: List[Any], request) -> List[Result]:
+    results, targets = _targets(items)
+    with transaction.atomic():
+        events = Event.objects.select_for_update().only("eventID", "creator_id").in_bulk(list(targets))
+        doomed: List[int] = []
+        for event_id, index in targets.items():
+            event = events.get(event_id)
+            if event is None:
+                results[index] = _result(index, 404, eventID=event_id, error="Event not found")
+            elif _not_allowed(request, event):
+                results[index] = _result(index, 403, eventID=event_id, error="You are not allowed to access this event.")
+            else:
+                doomed.append(event_id)
+                results[index] = _result(index, 204, eventID=event_id)
+        if doomed:
+            Event.objects.filter(eventID__in=doomed).delete()
+            invalidate_events()
+    return results
@@ -0,0 +1,94 @@
+"""
+Response cache for the read endpoints.
+
+``cached_response`` stores ``response.data`` keyed on the request path, the
+normalised query string and the events generation counter from
+``base.invalidation``. The backend is whichever Django cache alias
+``EVENTS_API['RESPONSE_CACHE']`` names (local memory by default), so moving
+to Redis or Memcached is a settings change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+
+from base.invalidation import current_generation, events_cache
+
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(outcome: str) -> None:
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def cache_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_cache_stats() -> None:
+    with _stats_lock:
+        for outcome in _stats:
+            _stats[outcome] = 0
+
+
+def _timeout() -> int:
+    return getattr(settings, "EVENTS_API", {}).get("RESPONSE_CACHE_TIMEOUT", 60)
+
+
+def cache_key(request) -> str:
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    digest = hashlib.md5(f"{request.path}?{query}".encode()).hexdigest()
+    return f"events:response:{current_generation()}:{digest}"
+
+
+def cached_response(view):
+    """
+    Cache successful ``GET`` responses of a function view.
+
+    Apply it directly above the ``def`` (below ``@api_view`` and
+    ``@permission_classes``) so permission checks still run on every hit.
+    """
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method != "GET":
+            return view(request, *args, **kwargs)
+
+        cache = events_cache()
+        key = cache_key(request)
+        entry = cache.get(key)
+        if entry is not None:
+            _count("hits")
+            data, headers = entry
+            not_modified = get_conditional_response(
+                request,
+                etag=headers.get("ETag"),
+                last_modified=parse_http_date_safe(headers.get("Last-Modified", "")),
+            )
+            if not_modified is not None:
+                for header, value in headers.items():
+                    not_modified.headers[header] = value
+                return not_modified
+            return Response(data, headers=headers)
+
+        _count("misses")
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200:
+            headers = {h: response.headers[h] for h in VALIDATOR_HEADERS if h in response.headers}
+            cache.set(key, (response.data, headers), _timeout())
+        return response
+
+    return wrapper
@@ -0,0 +1,81 @@
+"""
+ETag / Last-Modified support for event endpoints.
+
+Validators come from ``Event.updated_at``, which every write path (including
+registration) bumps, so a ``304 Not Modified`` can be answered from a single
+indexed lookup before anything is serialised.
+
+Lists get an ETag only: the full request path plus the events generation
+from ``base.invalidation``, which every write to ``Event`` or
+``Registration`` bumps (the same counter the response cache is keyed on).
+That costs one cache read instead of an aggregate over the filtered set,
+so each keyset page stays a single indexed query. There is no timestamp to
+give, so list responses send no ``Last-Modified``; with a cache backend
+that stores nothing (``DummyCache``) there is no generation either, and they
+send no validators at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from calendar import timegm
+from typing import Optional, Tuple
+
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+from base.invalidation import acurrent_generation, current_generation
+
+CONDITIONAL_HEADERS = ("HTTP_IF_NONE_MATCH", "HTTP_IF_MODIFIED_SINCE")
+
+
+def is_conditional(request) -> bool:
+    return any(header in request.META for header in CONDITIONAL_HEADERS)
+
+
+def validators(request, updated_at, *parts) -> Tuple[str, Optional[int]]:
+    """
+    Build ``(etag, last_modified)`` for a representation.
+
+    The query string is folded into the ETag because it selects the page and
+    shape of the response.
+    """
+    stamp = updated_at.isoformat() if updated_at else ""
+    seed = "|".join([request.get_full_path(), stamp, *map(str, parts)])
+    etag = quote_etag(hashlib.md5(seed.encode()).hexdigest())
+    last_modified = timegm(updated_at.utctimetuple()) if updated_at else None
+    return etag, last_modified
+
+
+def _list_etag(request, generation) -> Tuple[Optional[str], None]:
+    if generation is None:
+        return None, None
+    etag, _ = validators(request, None, generation)
+    return etag, None
+
+
+def list_validators(request) -> Tuple[Optional[str], None]:
+    """``(etag, None)`` for a list: changes with any write to the events."""
+    return _list_etag(request, current_generation())
+
+
+async def alist_validators(request) -> Tuple[Optional[str], None]:
+    return _list_etag(request, await acurrent_generation())
+
+
+def not_modified(request, etag: Optional[str], last_modified: Optional[int]):
+    """Return a 304 response when the client's copy is current, else ``None``."""
+    if etag is None and last_modified is None:
+        return None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag: Optional[str], last_modified: Optional[int]):
+    if etag is not None:
+        response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+    return response
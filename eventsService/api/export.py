@@ -0,0 +1,53 @@
+"""
+Streaming export of the event catalogue.
+
+The export views hand ``StreamingHttpResponse`` a generator that reads
+events with ``QuerySet.iterator(chunk_size=...)``, converts one chunk at a
+time through ``api.fastpath`` (one roster query per chunk) and renders it
+straight to bytes. Only a single chunk is ever held in memory, however
+large the table is.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import Iterator, Sequence
+
+from django.conf import settings
+from . import fastpath
+from .renderers import FastJSONRenderer
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def chunk_size() -> int:
+    return getattr(settings, 'EVENTS_API', {}).get('EXPORT_CHUNK_SIZE', DEFAULT_CHUNK_SIZE)
+
+
+def _chunks(queryset, fields: Sequence[str], ordering: Sequence[str]) -> Iterator[list]:
+    size = chunk_size()
+    rows = fastpath.event_rows(queryset, fields, ordering).order_by(*ordering).iterator(chunk_size=size)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield fastpath.represent(chunk, fields)
+
+
+def json_array(queryset, fields: Sequence[str], ordering: Sequence[str]) -> Iterator[bytes]:
+    """Yield one JSON array, a chunk of elements at a time."""
+    renderer = FastJSONRenderer()
+    yield b'['
+    separator = b''
+    for items in _chunks(queryset, fields, ordering):
+        # Render the chunk as an array and splice its elements in.
+        yield separator + renderer.render(items)[1:-1]
+        separator = b','
+    yield b']'
+
+
+def ndjson(queryset, fields: Sequence[str], ordering: Sequence[str]) -> Iterator[bytes]:
+    """Yield newline-delimited JSON: one event object per line."""
+    renderer = FastJSONRenderer()
+    for items in _chunks(queryset, fields, ordering):
+        yield b''.join(renderer.render(item) + b'\n' for item in items)
@@ -0,0 +1,147 @@
+"""
+Fast read path for the event list endpoints.
+
+``EventSerializer(many=True)`` resolves every field of every row through
+``get_attribute`` and ``to_representation``. Lists instead pull plain rows
+with ``values_list()`` and pass each column through a converter compiled
+from the serializer's own field objects, so the output (and the rendered
+JSON) is identical to what the serializer would produce:
+
+* integers and strings already come out of the database in their output
+  form and are passed through untouched;
+* ISO-8601 datetimes get an inlined copy of DRF's conversion (current
+  timezone, ``+00:00`` written as ``Z``);
+* any other field falls back to its own ``to_representation``.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from rest_framework import serializers
+from rest_framework.fields import ISO_8601
+from rest_framework.settings import api_settings
+
+from base.models import Event, Registration
+from .fieldsets import ROSTER
+from .serializers import EventSerializer
+
+# Rosters are fetched with ``event_id IN (...)``; stay well under SQLite's
+# bound-parameter limit for unpaginated lists.
+ROSTER_BATCH_SIZE = 500
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+@lru_cache(maxsize=64)
+def _serializer_fields(fields: Tuple[str, ...]):
+    return EventSerializer(fields=fields).fields
+
+
+def _datetime_converter(field: serializers.DateTimeField) -> Callable[[Any], Any]:
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    tz = field.default_timezone()
+    if hasattr(field, 'timezone') or tz is None or output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+
+    def convert(value):
+        if value.tzinfo is None:
+            return field.to_representation(value)
+        text = value.astimezone(tz).isoformat()
+        return text[:-6] + 'Z' if text.endswith('+00:00') else text
+
+    return convert
+
+
+def _converter(field) -> Converter:
+    if isinstance(field, serializers.DateTimeField):
+        return _datetime_converter(field)
+    if isinstance(field, (serializers.IntegerField, serializers.CharField)):
+        return None
+    return field.to_representation
+
+
+def event_rows(queryset, fields: Sequence[str], ordering: Sequence[str]):
+    """
+    ``values_list`` rows for ``fields``: the output columns first, in output
+    order, then any sort key or primary key the caller still needs (the
+    paginator reads sort keys off the rows by name to build its cursor).
+    """
+    pk = Event._meta.pk.name
+    names = [name for name in _serializer_fields(tuple(fields)) if name != ROSTER]
+    for name in [*(key.lstrip('-') for key in ordering), pk]:
+        if name not in names:
+            names.append(name)
+    return queryset.values_list(*names, named=True)
+
+
+def _roster_batches(event_ids: List[int]):
+    for start in range(0, len(event_ids), ROSTER_BATCH_SIZE):
+        batch = event_ids[start:start + ROSTER_BATCH_SIZE]
+        yield (
+            Registration.objects.filter(event_id__in=batch, status=Registration.REGISTERED)
+            .order_by('registered_at', 'id')
+            .values_list('event_id', 'student_id')
+        )
+
+
+def rosters(event_ids: List[int]) -> Dict[int, List[int]]:
+    """Registered student ids per event, in registration order."""
+    result: Dict[int, List[int]] = defaultdict(list)
+    for registrations in _roster_batches(event_ids):
+        for event_id, student_id in registrations:
+            result[event_id].append(student_id)
+    return result
+
+
+async def arosters(event_ids: List[int]) -> Dict[int, List[int]]:
+    result: Dict[int, List[int]] = defaultdict(list)
+    for registrations in _roster_batches(event_ids):
+        async for event_id, student_id in registrations:
+            result[event_id].append(student_id)
+    return result
+
+
+def row_ids(rows) -> List[int]:
+    pk = Event._meta.pk.name
+    return [getattr(row, pk) for row in rows]
+
+
+def represent(rows, fields: Sequence[str], roster_map: Optional[Dict[int, List[int]]] = None) -> List[Dict[str, Any]]:
+    """
+    Turn ``event_rows`` results into the serializer's list output.
+
+    Async callers fetch rosters themselves (``arosters``) and pass them in as
+    ``roster_map``; otherwise they are read here when the roster is selected.
+    """
+    fields = tuple(fields)
+    declared = _serializer_fields(fields)
+    names = [name for name in declared if name != ROSTER]
+    converters = [(name, convert) for name in names if (convert := _converter(declared[name])) is not None]
+
+    rows = list(rows)
+    if ROSTER not in declared:
+        roster_map = None
+    else:
+        pk = Event._meta.pk.name
+        if roster_map is None:
+            roster_map = rosters(row_ids(rows))
+        split = list(declared).index(ROSTER)
+        head, tail = names[:split], names[split:]
+
+    results = []
+    for row in rows:
+        if roster_map is None:
+            item = dict(zip(names, row))
+        else:
+            item = dict(zip(head, row))
+            item[ROSTER] = roster_map.get(getattr(row, pk), [])
+            item.update(zip(tail, row[split:]))
+        for name, convert in converters:
+            value = item[name]
+            if value is not None:
+                item[name] = convert(value)
+        results.append(item)
+    return results
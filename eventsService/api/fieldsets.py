@@ -0,0 +1,49 @@
+"""
+Sparse fieldsets for the event list endpoints.
+
+A list request with neither parameter gets the compact ``LIST_FIELDS``
+representation. ``?fields=title,location`` picks exactly those fields, and
+``?exclude=description`` drops fields from ``fields`` when given, otherwise
+from the full representation. The chosen names also decide which columns are
+read (see ``api.fastpath``) and whether the registration roster is fetched
+at all, so an unused field costs neither a column read nor a conversion.
+"""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from .serializers import EventSerializer
+
+ALL_FIELDS: Tuple[str, ...] = tuple(EventSerializer.Meta.fields)
+LIST_FIELDS: Tuple[str, ...] = (
+    'eventID', 'title', 'eventType', 'location', 'capacity', 'registered_count',
+    'event_start_date', 'event_end_date',
+)
+ROSTER = 'registered_students'
+
+
+class FieldsetError(ValueError):
+    """Raised for an unknown or empty ``fields``/``exclude`` selection."""
+
+
+def _names(raw: str) -> List[str]:
+    return [name.strip() for name in raw.split(',') if name.strip()]
+
+
+def requested(request, default: Tuple[str, ...] = LIST_FIELDS) -> Tuple[str, ...]:
+    params = request.query_params
+    fields, exclude = params.get('fields'), params.get('exclude')
+    if fields is None and exclude is None:
+        return default
+
+    chosen = set(_names(fields)) if fields is not None else set(ALL_FIELDS)
+    dropped = set(_names(exclude or ''))
+    unknown = sorted((chosen | dropped) - set(ALL_FIELDS))
+    if unknown:
+        raise FieldsetError(f"Unknown field(s): {', '.join(unknown)}")
+    selected = tuple(name for name in ALL_FIELDS if name in chosen - dropped)
+    if not selected:
+        raise FieldsetError("No fields selected")
+    return selected
+
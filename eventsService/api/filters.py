@@ -0,0 +1,180 @@
+"""
+The composable event query behind ``/api/events/filters/`` (and the export).
+
+Every predicate the single-purpose list views offer can be combined in one
+request; they are ANDed into one queryset, so the page is answered by one
+``SELECT`` over whichever index the planner prefers:
+
+* ``creator``, ``creator_id``, ``eventType`` (comma-separated for several)
+* ``location``, ``host`` (substring matches)
+* ``min_capacity``, ``max_capacity``
+* ``start_after``, ``start_before``, ``end_after``, ``end_before``,
+  ``created_after`` (ISO dates or datetimes)
+* ``when=upcoming|past`` (relative to now, as the date views)
+* ``availability=available|full``
+* ``has_link``, ``has_zoom_link`` (``true``/``false``)
+* ``q``: the ranked full-text search of ``base.search``
+
+``sort`` picks one of ``SORT_KEYS`` (``-`` prefix for descending). The
+default is ``relevance`` with ``q`` and ``eventID`` otherwise; keyset
+pagination appends the ``eventID`` tiebreaker as on every list endpoint.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, time
+from typing import Optional, Tuple
+
+from django.db import models
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from base.models import Event
+from base.search import search_events
+
+from .pagination import TIEBREAKER
+
+# Same expression as the ``event_seats_left_idx`` index on Event.
+SEATS_LEFT = models.F('capacity') - models.F('registered_count')
+
+SORT_KEYS = {
+    'eventID': 'eventID',
+    'event_start_date': 'event_start_date',
+    'event_end_date': 'event_end_date',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+    'capacity': 'capacity',
+    'seats_left': 'seats_left',
+    'relevance': 'search_rank',
+}
+_DATE_FILTERS = {
+    'start_after': 'event_start_date__gte',
+    'start_before': 'event_start_date__lt',
+    'end_after': 'event_end_date__gt',
+    'end_before': 'event_end_date__lte',
+    'created_after': 'created_at__gte',
+}
+_TRUE, _FALSE = ('1', 'true', 'yes'), ('0', 'false', 'no')
+
+
+class QueryError(ValueError):
+    """Raised for a malformed or unknown filter or sort parameter."""
+
+
+def _integer(params, name: str) -> Optional[int]:
+    raw = params.get(name)
+    if not raw:
+        return None
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise QueryError(f"{name} must be an integer") from exc
+
+
+def _moment(params, name: str) -> Optional[datetime]:
+    raw = params.get(name)
+    if not raw:
+        return None
+    try:
+        value = parse_datetime(raw)
+        if value is None:
+            day = parse_date(raw)
+            value = datetime.combine(day, time.min) if day else None
+    except ValueError:
+        value = None
+    if value is None:
+        raise QueryError(f"{name} must be an ISO date or datetime")
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def _flag(params, name: str) -> Optional[bool]:
+    raw = params.get(name)
+    if not raw:
+        return None
+    if raw.lower() in _TRUE:
+        return True
+    if raw.lower() in _FALSE:
+        return False
+    raise QueryError(f"{name} must be true or false")
+
+
+def _choice(params, name: str, choices: Tuple[str, ...]) -> Optional[str]:
+    raw = params.get(name)
+    if raw and raw not in choices:
+        raise QueryError(f"{name} must be one of: {', '.join(choices)}")
+    return raw or None
+
+
+def _has_url(field: str, present: bool) -> models.Q:
+    # ``> ''`` skips both NULL and blank, and matches the partial indexes.
+    condition = models.Q(**{f'{field}__gt': ''})
+    return condition if present else ~condition
+
+
+def ordering(params, searching: bool) -> Tuple[str, ...]:
+    raw = params.get('sort') or ('relevance' if searching else TIEBREAKER)
+    name = raw.lstrip('-')
+    if name not in SORT_KEYS:
+        raise QueryError(f"sort must be one of: {', '.join(SORT_KEYS)}")
+    if name == 'relevance' and not searching:
+        raise QueryError("sort=relevance needs a q search term")
+    return (('-' if raw.startswith('-') else '') + SORT_KEYS[name],)
+
+
+def build(params) -> Tuple[models.QuerySet, Tuple[str, ...]]:
+    """Return ``(queryset, ordering)`` for the query parameters ``params``."""
+    events = Event.objects.all()
+    conditions = models.Q()
+
+    if params.get('creator'):
+        conditions &= models.Q(creator=params['creator'])
+    creator_id = _integer(params, 'creator_id')
+    if creator_id is not None:
+        conditions &= models.Q(creator_id=creator_id)
+    types = [name.strip() for name in params.get('eventType', '').split(',') if name.strip()]
+    if len(types) == 1:
+        conditions &= models.Q(eventType=types[0])
+    elif types:
+        conditions &= models.Q(eventType__in=types)
+    if params.get('location'):
+        conditions &= models.Q(location__icontains=params['location'])
+    if params.get('host'):
+        conditions &= models.Q(hosted_by__icontains=params['host'])
+
+    min_capacity = _integer(params, 'min_capacity')
+    if min_capacity is not None:
+        conditions &= models.Q(capacity__gte=min_capacity)
+    max_capacity = _integer(params, 'max_capacity')
+    if max_capacity is not None:
+        conditions &= models.Q(capacity__lte=max_capacity)
+
+    for name, lookup in _DATE_FILTERS.items():
+        moment = _moment(params, name)
+        if moment is not None:
+            conditions &= models.Q(**{lookup: moment})
+    when = _choice(params, 'when', ('upcoming', 'past'))
+    if when == 'upcoming':
+        conditions &= models.Q(event_start_date__gte=timezone.now())
+    elif when == 'past':
+        conditions &= models.Q(event_end_date__lt=timezone.now())
+
+    for name, field in (('has_link', 'link'), ('has_zoom_link', 'zoom_link')):
+        present = _flag(params, name)
+        if present is not None:
+            conditions &= _has_url(field, present)
+
+    availability = _choice(params, 'availability', ('available', 'full'))
+    sort = ordering(params, searching=bool(params.get('q')))
+    if availability or sort[0].lstrip('-') == 'seats_left':
+        events = events.annotate(seats_left=SEATS_LEFT)
+    if availability == 'available':
+        conditions &= models.Q(seats_left__gt=0)
+    elif availability == 'full':
+        conditions &= models.Q(seats_left__lte=0)
+
+    events = events.filter(conditions)
+    if params.get('q'):
+        events = search_events(events, params['q'])
+    return events, sort
@@ -0,0 +1,278 @@
+"""
+Per-route performance metrics in the Prometheus text format.
+
+``MetricsMiddleware`` times every request and records, labelled with the
+route name:
+
+- ``events_http_requests_total`` — requests by method, route and status;
+- ``events_http_request_duration_seconds`` — wall-clock latency;
+- ``events_db_queries_per_request`` and ``events_db_duration_seconds`` —
+  query count and total query time of each request. A route whose query
+  count grows with its page size has an N+1;
+- ``events_serialization_duration_seconds`` — time spent rendering DRF
+  responses. Cached responses and the async views, which return
+  pre-rendered JSON, have no render step and are not sampled;
+- ``events_http_response_size_bytes`` — size of the rendered body.
+
+Queries are counted by a wrapper in each connection's ``execute_wrappers``
+(the hook behind ``connection.execute_wrapper``). It is added once per
+connection, when the connection opens, and charges each query to the
+request running in the current context, so ORM calls that async views hand
+to a worker thread are counted as well. Outside a request it only forwards
+the call.
+
+``GET /metrics`` serves the registry. Values live in process memory, so
+each worker reports its own. Set ``EVENTS_API['METRICS']`` to False to turn
+off both the middleware and the route.
+"""
+
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+_METHODS = frozenset(('GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'))
+
+
+def enabled():
+    return getattr(settings, 'EVENTS_API', {}).get('METRICS', True)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names, values):
+    return ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def expose(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        with self._lock:
+            values = sorted(self._values.items())
+            lines.extend(self._samples(values))
+        return lines
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def _samples(self, values):
+        for labels, value in values:
+            yield f'{self.name}{{{_labels(self.labelnames, labels)}}} {value}'
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames, buckets):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(float(bound) for bound in buckets)
+
+    def observe(self, value, *labels):
+        # Index of the first bucket whose upper bound is >= value; the last
+        # slot is +Inf.
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def _samples(self, values):
+        for labels, (counts, total) in values:
+            base = _labels(self.labelnames, labels)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else str(bound)
+                yield f'{self.name}_bucket{{{base},le="{le}"}} {cumulative}'
+            yield f'{self.name}_sum{{{base}}} {total}'
+            yield f'{self.name}_count{{{base}}} {cumulative}'
+
+
+REGISTRY = []
+
+REQUESTS = Counter(
+    'events_http_requests_total', 'HTTP requests handled.', ('method', 'route', 'status'),
+)
+LATENCY = Histogram(
+    'events_http_request_duration_seconds', 'Time from request to response.', ('method', 'route'),
+    LATENCY_BUCKETS,
+)
+QUERIES = Histogram(
+    'events_db_queries_per_request', 'Database queries run per request.', ('route',), QUERY_BUCKETS,
+)
+DB_TIME = Histogram(
+    'events_db_duration_seconds', 'Time spent in database queries per request.', ('route',),
+    LATENCY_BUCKETS,
+)
+SERIALIZATION = Histogram(
+    'events_serialization_duration_seconds', 'Time spent rendering the response body.', ('route',),
+    LATENCY_BUCKETS,
+)
+RESPONSE_SIZE = Histogram(
+    'events_http_response_size_bytes', 'Size of the rendered response body.', ('route',), SIZE_BUCKETS,
+)
+
+
+def render():
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.expose())
+    return '\n'.join(lines) + '\n'
+
+
+def reset():
+    for metric in REGISTRY:
+        metric.reset()
+
+
+class _RequestStats:
+    __slots__ = ('queries', 'db_seconds', 'render_seconds')
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.render_seconds = None
+
+
+_current = ContextVar('events_request_stats', default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started
+
+
+def track_queries(connection):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def _connection_created(sender, connection, **kwargs):
+    track_queries(connection)
+
+
+connection_created.connect(_connection_created, dispatch_uid='api.metrics.track_queries')
+
+
+def _route(request):
+    match = request.resolver_match
+    if match is None:
+        return 'unmatched'
+    return match.url_name or match.route
+
+
+def _time_render(response):
+    # The outermost middleware's hook runs right before the body is
+    # rendered; the post-render callback closes the timer.
+    stats = _current.get()
+    if stats is not None:
+        started = time.perf_counter()
+
+        def rendered(response):
+            stats.render_seconds = time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+    return response
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # A sync hook would be run through a thread on the async stack.
+            self.process_template_response = self._aprocess_template_response
+        # Connections opened before the signal receiver was connected.
+        for connection in connections.all(initialized_only=True):
+            track_queries(connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = _RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.observe(request, response, stats, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        stats = _RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.observe(request, response, stats, time.perf_counter() - started)
+        return response
+
+    def process_template_response(self, request, response):
+        return _time_render(response)
+
+    async def _aprocess_template_response(self, request, response):
+        # Replaces process_template_response on the async stack, so it must
+        # not call it.
+        return _time_render(response)
+
+    def observe(self, request, response, stats, seconds):
+        route = _route(request)
+        method = request.method if request.method in _METHODS else 'other'
+        REQUESTS.inc(method, route, str(response.status_code))
+        LATENCY.observe(seconds, method, route)
+        QUERIES.observe(stats.queries, route)
+        DB_TIME.observe(stats.db_seconds, route)
+        if stats.render_seconds is not None:
+            SERIALIZATION.observe(stats.render_seconds, route)
+        if not response.streaming:
+            RESPONSE_SIZE.observe(len(response.content), route)
@@ -0,0 +1,92 @@
+"""
+Structured request logging.
+
+``RequestLogMiddleware`` emits one ``api.requests`` record per request. It
+carries the HTTP method, route name, status, latency and the caller's JWT
+role as ``extra`` fields, which ``eventsService.log.JSONFormatter`` writes
+out as JSON. Successful responses on busy routes can be sampled with
+``EVENTS_API['REQUEST_LOG_SAMPLE_RATES']``, a map of route name to the
+fraction to keep (default 1.0). 4xx and 5xx responses are always logged.
+Every record notes the rate it was sampled at, so counts can be re-weighted
+downstream.
+"""
+
+import logging
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.functional import LazyObject, empty
+
+from eventsService.authentication import ExternalJWTUser
+
+logger = logging.getLogger('api.requests')
+
+
+def _sample_rate(route):
+    rates = getattr(settings, 'EVENTS_API', {}).get('REQUEST_LOG_SAMPLE_RATES', {})
+    return rates.get(route, 1.0)
+
+
+class RequestLogMiddleware:
+    # Runs natively in both stacks, so async views are not pushed to a thread.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        # For streamed responses this is the time to the first byte.
+        self.log(request, response, (time.perf_counter() - started) * 1000)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self.log(request, response, (time.perf_counter() - started) * 1000)
+        return response
+
+    def log(self, request, response, latency_ms):
+        status = response.status_code
+        if status >= 500:
+            level, rate = logging.ERROR, 1.0
+        elif status >= 400:
+            level, rate = logging.WARNING, 1.0
+        else:
+            level = logging.INFO
+            rate = _sample_rate(getattr(request.resolver_match, 'url_name', None))
+        if not logger.isEnabledFor(level) or (rate < 1.0 and random.random() >= rate):
+            return
+
+        route = getattr(request.resolver_match, 'url_name', None)
+        # DRF stores the authenticated user on the request. Anything else has
+        # AuthenticationMiddleware's lazy user, and even isinstance() on that
+        # runs the session lookup, so leave it alone unless already resolved.
+        user = request.__dict__.get('user')
+        if isinstance(user, LazyObject):
+            user = None if user._wrapped is empty else user._wrapped
+        role = user.role if isinstance(user, ExternalJWTUser) else None
+        logger.log(
+            level,
+            '%s %s %s',
+            request.method,
+            route or request.path,
+            status,
+            extra={
+                'method': request.method,
+                'route': route,
+                'path': request.path,
+                'status': status,
+                'latency_ms': round(latency_ms, 2),
+                'role': role,
+                'sample_rate': rate,
+            },
+        )
@@ -0,0 +1,173 @@
+"""
+Keyset (cursor) pagination for the event list endpoints.
+
+A client opts in by sending ``?page_size=`` and/or ``?cursor=``. Each page is
+ordered by the view's sort column plus ``eventID`` as a tiebreaker, and the
+opaque cursor encodes the sort key of the last row served. The next page is
+then fetched with an indexed ``WHERE (col, eventID) > (...) LIMIT n`` instead
+of an ``OFFSET``, so page N costs the same as page 1.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+from django.utils.dateparse import parse_datetime
+
+TIEBREAKER = "eventID"
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_MAX_PAGE_SIZE = 200
+
+
+class PaginationError(ValueError):
+    """Raised for a malformed ``cursor`` or ``page_size`` query parameter."""
+
+
+def _setting(name: str, default: int) -> int:
+    return getattr(settings, "EVENTS_API", {}).get(name, default)
+
+
+def is_requested(request) -> bool:
+    params = request.query_params
+    return "cursor" in params or "page_size" in params
+
+
+def get_page_size(request) -> int:
+    raw = request.query_params.get("page_size")
+    if raw in (None, ""):
+        return _setting("PAGE_SIZE", DEFAULT_PAGE_SIZE)
+    try:
+        size = int(raw)
+    except ValueError as exc:
+        raise PaginationError("page_size must be an integer") from exc
+    if size < 1:
+        raise PaginationError("page_size must be positive")
+    return min(size, _setting("MAX_PAGE_SIZE", DEFAULT_MAX_PAGE_SIZE))
+
+
+def sort_keys(ordering: Sequence[str]) -> List[Tuple[str, bool]]:
+    """
+    Normalise an ``order_by``-style sequence into ``(field, descending)``
+    pairs that always end with the ``eventID`` tiebreaker.
+    """
+    keys = [(name.lstrip("-"), name.startswith("-")) for name in ordering]
+    if not keys or keys[-1][0] != TIEBREAKER:
+        descending = keys[-1][1] if keys else False
+        keys.append((TIEBREAKER, descending))
+    return keys
+
+
+def order_by(ordering: Sequence[str]) -> List[str]:
+    return [("-" if desc else "") + name for name, desc in sort_keys(ordering)]
+
+
+def _row_value(row: Any, name: str) -> Any:
+    if isinstance(row, dict):
+        return row[name]
+    return getattr(row, name)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _decode_value(model, name: str, value: Any) -> Any:
+    # Every value goes into the keyset filter, so check it against the sort
+    # key's type here rather than let the ORM fail on it.
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        # Annotations (``seats_left``, ``search_rank``) are numeric.
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise PaginationError("Invalid cursor")
+        return value
+    if value is None or isinstance(value, (bool, list, dict)):
+        raise PaginationError("Invalid cursor")
+    if isinstance(field, models.DateTimeField):
+        parsed = parse_datetime(value) if isinstance(value, str) else None
+        if parsed is None:
+            raise PaginationError("Invalid cursor")
+        return parsed
+    try:
+        return field.to_python(value)
+    except (ValidationError, ValueError, TypeError) as exc:
+        raise PaginationError("Invalid cursor") from exc
+
+
+def encode_cursor(values: Iterable[Any]) -> str:
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, model, keys: Sequence[Tuple[str, bool]]) -> List[Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError) as exc:
+        raise PaginationError("Invalid cursor") from exc
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise PaginationError("Invalid cursor")
+    return [_decode_value(model, name, value) for (name, _), value in zip(keys, values)]
+
+
+def _after(keys: Sequence[Tuple[str, bool]], values: Sequence[Any]) -> models.Q:
+    """
+    Build the lexicographic ``(k1, k2, ...) > (v1, v2, ...)`` predicate.
+
+    The redundant leading ``k1 >= v1`` gives the planner a plain range on the
+    first sort column, so it can walk the index in order instead of
+    splitting the OR into separate lookups and sorting the union.
+    """
+    condition = models.Q()
+    for i, (name, descending) in enumerate(keys):
+        clause = models.Q(**{f"{name}__{'lt' if descending else 'gt'}": values[i]})
+        for j, (prev_name, _) in enumerate(keys[:i]):
+            clause &= models.Q(**{prev_name: values[j]})
+        condition |= clause
+    if len(keys) > 1:
+        name, descending = keys[0]
+        condition &= models.Q(**{f"{name}__{'lte' if descending else 'gte'}": values[0]})
+    return condition
+
+
+def _page_query(queryset, ordering: Sequence[str], page_size: int, cursor: Optional[str]):
+    keys = sort_keys(ordering)
+    queryset = queryset.order_by(*order_by(ordering))
+    if cursor:
+        values = decode_cursor(cursor, queryset.model, keys)
+        queryset = queryset.filter(_after(keys, values))
+    return queryset[: page_size + 1], keys
+
+
+def _page(rows: List[Any], keys, page_size: int):
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(_row_value(rows[-1], name) for name, _ in keys)
+    return rows, next_cursor
+
+
+def paginate(queryset, ordering: Sequence[str], page_size: int, cursor: Optional[str] = None):
+    """
+    Return ``(rows, next_cursor)`` for one page of ``queryset``.
+
+    Only ``page_size + 1`` rows are ever fetched; the extra row tells us
+    whether another page exists without issuing a ``COUNT``.
+    """
+    queryset, keys = _page_query(queryset, ordering, page_size, cursor)
+    return _page(list(queryset), keys, page_size)
+
+
+async def apaginate(queryset, ordering: Sequence[str], page_size: int, cursor: Optional[str] = None):
+    """``paginate`` for async views, reading the page with ``async for``."""
+    queryset, keys = _page_query(queryset, ordering, page_size, cursor)
+    return _page([row async for row in queryset], keys, page_size)
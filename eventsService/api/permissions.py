@@ -12,6 +12,18 @@ class IsStaff(BasePermission):
     def has_permission(self, request, view):
         return (request.user.role == "STAFF") or (request.user.role == "ADMIN") 
 
+class IsSelfOrStaff(BasePermission):
+    """
+    Students can only read routes for their own ``student_id``.
+    Staff and admins can read any student's.
+    """
+
+    def has_permission(self, request, view):
+        role = getattr(request.user, "role", None)
+        if role in ("STAFF", "ADMIN"):
+            return True
+        return role == "STUDENT" and view.kwargs.get("student_id") == request.user.id
+
 class IsOwnerOrAdmin(BasePermission):
     """
     User can modify their own events.
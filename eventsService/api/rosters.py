@@ -0,0 +1,76 @@
+"""
+Student-ID batches for the bulk registration endpoints.
+
+The IDs can be sent as a JSON list, as ``{"student_ids": [...]}``, as CSV
+text (``Content-Type: text/csv``) or as a CSV file in the ``file`` field of
+a multipart upload. A CSV may start with a header row; its ``student_id``
+column is used if it has one, otherwise the first column.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from typing import Any, List
+
+from .bulk import max_items
+
+
+class RosterError(ValueError):
+    """Raised for a missing, malformed or oversized list of student IDs."""
+
+
+def _csv_values(text: str) -> List[str]:
+    rows = [row for row in csv.reader(io.StringIO(text)) if any(cell.strip() for cell in row)]
+    if not rows:
+        return []
+    header = [cell.strip().lower() for cell in rows[0]]
+    column = 0
+    if 'student_id' in header:
+        column = header.index('student_id')
+        rows = rows[1:]
+    elif not header[0].lstrip('-').isdigit():
+        rows = rows[1:]
+    return [row[column] if column < len(row) else '' for row in rows]
+
+
+def _raw_values(request) -> List[Any]:
+    upload = request.FILES.get('file')
+    if upload is not None:
+        try:
+            return _csv_values(upload.read().decode('utf-8-sig'))
+        except UnicodeDecodeError as exc:
+            raise RosterError("CSV upload must be UTF-8") from exc
+    data = request.data
+    if isinstance(data, str):
+        return _csv_values(data)
+    if isinstance(data, list):
+        return data
+    raw = data.get('student_ids') if hasattr(data, 'get') else None
+    if isinstance(raw, str):
+        return _csv_values(raw.replace(',', '\n'))
+    if isinstance(raw, list):
+        return raw
+    raise RosterError("Send student_ids as a list, CSV text or a CSV file upload")
+
+
+def student_ids(request) -> List[int]:
+    values = _raw_values(request)
+    ids, invalid = [], []
+    for value in values:
+        if isinstance(value, bool):
+            invalid.append(value)
+            continue
+        try:
+            ids.append(int(str(value).strip()))
+        except ValueError:
+            invalid.append(value)
+    if invalid:
+        shown = ', '.join(repr(value) for value in invalid[:5])
+        raise RosterError(f"Student IDs must be integers (got {shown})")
+    if not ids:
+        raise RosterError("No student IDs given")
+    limit = max_items()
+    if len(ids) > limit:
+        raise RosterError(f"At most {limit} student IDs per request")
+    return ids
@@ -2,6 +2,29 @@ from rest_framework import serializers
 from base.models import Event
 
 class EventSerializer(serializers.ModelSerializer):
+    registered_students = serializers.ListField(child=serializers.IntegerField(), read_only=True)
+
     class Meta:
         model = Event
-        fields = '__all__'
\ No newline at end of file
+        fields = [
+            'eventID', 'creator_id', 'title', 'description', 'creator', 'eventType',
+            'location', 'capacity', 'registered_count', 'image_url', 'link', 'zoom_link', 'hosted_by',
+            'registered_students', 'event_start_date', 'event_end_date',
+            'created_at', 'updated_at',
+        ]
+        read_only_fields = ['registered_count']
+
+    def __init__(self, *args, fields=None, **kwargs):
+        # ``fields`` narrows the output to a sparse fieldset (see api.fieldsets).
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    def update(self, instance, validated_data):
+        # Write only the submitted columns so a concurrent registration's
+        # registered_count is never overwritten with a stale value.
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
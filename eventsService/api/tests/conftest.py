@@ -0,0 +1,81 @@
+import pytest
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.backends import TokenBackend
+
+from api.cache import reset_cache_stats
+from base.models import Event, Registration
+from eventsService.authentication import clear_token_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    cache.clear()
+    reset_cache_stats()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_verified_tokens():
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def token_backend():
+    return TokenBackend(
+        signing_key=settings.SIMPLE_JWT["SIGNING_KEY"],
+        algorithm=settings.SIMPLE_JWT["ALGORITHM"],
+    )
+
+
+@pytest.fixture
+def auth_headers(token_backend):
+    def _make(role="STUDENT", user_id=1):
+        payload = {"user_id": user_id, "role": role}
+        token = token_backend.encode(payload)
+        return {"HTTP_AUTHORIZATION": f"bearer {token}"}
+
+    return _make
+
+
+@pytest.fixture
+def make_event():
+    def _create(**overrides):
+        now = timezone.now()
+        defaults = {
+            "creator_id": 1,
+            "title": "Sample Event",
+            "description": "Desc",
+            "creator": "creator@example.com",
+            "eventType": "Workshop",
+            "location": "Campus",
+            "capacity": 50,
+            "image_url": "",
+            "link": "",
+            "zoom_link": "",
+            "hosted_by": "CS Department",
+            "registered_students": [],
+            "event_start_date": now + timedelta(days=1),
+            "event_end_date": now + timedelta(days=2),
+        }
+        defaults.update(overrides)
+        students = defaults.pop("registered_students")
+        defaults.setdefault("registered_count", len(students))
+        event = Event.objects.create(**defaults)
+        Registration.objects.bulk_create(
+            Registration(event=event, student_id=student_id) for student_id in students
+        )
+        return event
+
+    return _create
@@ -1,64 +1,12 @@
 import pytest
 from datetime import timedelta
-from django.conf import settings
 from django.utils import timezone
-from rest_framework.test import APIClient
-from rest_framework_simplejwt.backends import TokenBackend
 
 from base.models import Event
 
 pytestmark = pytest.mark.django_db
 
 
-@pytest.fixture
-def api_client():
-    return APIClient()
-
-
-@pytest.fixture
-def token_backend():
-    return TokenBackend(
-        signing_key=settings.SIMPLE_JWT["SIGNING_KEY"],
-        algorithm=settings.SIMPLE_JWT["ALGORITHM"],
-    )
-
-
-@pytest.fixture
-def auth_headers(token_backend):
-    def _make(role="STUDENT", user_id=1):
-        payload = {"user_id": user_id, "role": role}
-        token = token_backend.encode(payload)
-        return {"HTTP_AUTHORIZATION": f"bearer {token}"}
-
-    return _make
-
-
-@pytest.fixture
-def make_event():
-    def _create(**overrides):
-        now = timezone.now()
-        defaults = {
-            "creator_id": 1,
-            "title": "Sample Event",
-            "description": "Desc",
-            "creator": "creator@example.com",
-            "eventType": "Workshop",
-            "location": "Campus",
-            "capacity": 50,
-            "image_url": "",
-            "link": "",
-            "zoom_link": "",
-            "hosted_by": "CS Department",
-            "registered_students": [],
-            "event_start_date": now + timedelta(days=1),
-            "event_end_date": now + timedelta(days=2),
-        }
-        defaults.update(overrides)
-        return Event.objects.create(**defaults)
-
-    return _create
-
-
 def event_payload_from_instance(event, **overrides):
     payload = {
         "eventID": event.eventID,
@@ -0,0 +1,92 @@
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+
+pytestmark = pytest.mark.django_db
+
+PARITY_PATHS = [
+    ("/api/events/", {}),
+    ("/api/events/", {"exclude": ""}),
+    ("/api/events/", {"fields": "title,registered_students", "page_size": 2}),
+    ("/api/events/{id}/", {}),
+    ("/api/events/{id}/registered_students/", {}),
+    ("/api/events/count/", {}),
+    ("/api/events/upcoming/", {}),
+    ("/api/events/past/", {}),
+    ("/api/events/by_type/Seminar/", {}),
+    ("/api/events/filters/", {"eventType": "Workshop", "min_capacity": 5}),
+    ("/api/events/filters/", {"q": "robot", "when": "upcoming", "sort": "-capacity"}),
+    ("/api/events/search/", {"q": "robot"}),
+]
+
+
+@pytest.fixture
+def async_get():
+    client = AsyncClient()
+    return async_to_sync(client.get)
+
+
+@pytest.fixture
+def catalogue(make_event):
+    events = [
+        make_event(title="Robotics night", eventType="Seminar", registered_students=[3, 1]),
+        make_event(title="Study group", capacity=4),
+        make_event(title="Robot build", registered_students=[2]),
+    ]
+    return events[0]
+
+
+@pytest.mark.parametrize("path,params", PARITY_PATHS)
+def test_async_endpoints_match_sync(api_client, async_get, catalogue, path, params):
+    path = path.format(id=catalogue.eventID)
+    sync = api_client.get(path, params)
+    response = async_get(path.replace("/api/", "/api/async/", 1), params)
+
+    assert response.status_code == sync.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert response.content == sync.content
+
+
+def test_async_pages_follow_the_cursor(async_get, catalogue):
+    first = async_get("/api/async/events/", {"page_size": 2}).json()
+    second = async_get("/api/async/events/", {"page_size": 2, "cursor": first["next_cursor"]}).json()
+    titles = [e["title"] for e in first["results"] + second["results"]]
+    assert len(titles) == 3 and second["next_cursor"] is None
+
+
+def test_async_conditional_get(async_get, catalogue):
+    path = f"/api/async/events/{catalogue.eventID}/"
+    etag = async_get(path)["ETag"]
+    assert async_get(path, headers={"If-None-Match": etag}).status_code == 304
+    assert async_get("/api/async/events/", headers={"If-None-Match": async_get("/api/async/events/")["ETag"]}).status_code == 304
+
+
+@pytest.mark.parametrize(
+    "path,params,status",
+    [
+        ("/api/async/events/999/", {}, 404),
+        ("/api/async/events/999/registered_students/", {}, 404),
+        ("/api/async/events/", {"cursor": "bogus"}, 400),
+        ("/api/async/events/", {"fields": "nope"}, 400),
+    ],
+)
+def test_async_errors(async_get, path, params, status):
+    response = async_get(path, params)
+    assert response.status_code == status
+    assert "error" in response.json()
+
+
+def test_async_views_are_read_only(catalogue):
+    client = AsyncClient()
+    assert async_to_sync(client.post)("/api/async/events/").status_code == 405
+
+
+def test_middleware_stack_stays_async(caplog, settings):
+    # Django logs each middleware it has to wrap in sync_to_async, but only
+    # when DEBUG is on; a fresh client loads the middleware chain again.
+    settings.DEBUG = True
+    with caplog.at_level(logging.DEBUG, logger="django.request"):
+        async_to_sync(AsyncClient().get)("/api/async/events/count/")
+    assert not [r for r in caplog.records if "adapted" in r.getMessage()]
@@ -0,0 +1,84 @@
+import time
+
+import pytest
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.backends import TokenBackend
+
+from eventsService import authentication
+from eventsService.authentication import ExternalJWTAuthentication, get_token_backend
+
+
+def request_with(token):
+    return APIRequestFactory().get("/api/events/", HTTP_AUTHORIZATION=f"bearer {token}")
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    calls = []
+    original = TokenBackend.decode
+
+    def counting(self, token, verify=True):
+        calls.append(token)
+        return original(self, token, verify)
+
+    monkeypatch.setattr(TokenBackend, "decode", counting)
+    return calls
+
+
+def test_backend_is_shared_between_instances():
+    assert ExternalJWTAuthentication().token_backend is ExternalJWTAuthentication().token_backend
+
+
+def test_repeat_token_is_verified_once(token_backend, decode_calls):
+    token = token_backend.encode({"user_id": 4, "role": "STAFF"})
+    first, _ = ExternalJWTAuthentication().authenticate(request_with(token))
+    second, payload = ExternalJWTAuthentication().authenticate(request_with(token))
+
+    assert len(decode_calls) == 1
+    assert (second.id, second.role) == (4, "STAFF")
+    assert payload == {"user_id": 4, "role": "STAFF"}
+    assert second is first
+
+
+def test_cache_entries_never_outlive_exp(token_backend, decode_calls, monkeypatch):
+    now = time.time()
+    token = token_backend.encode({"user_id": 4, "exp": int(now) + 30})
+    ExternalJWTAuthentication().authenticate(request_with(token))
+
+    # Past ``exp`` by the cache's clock: the token must be verified again
+    # (PyJWT checks expiry against its own clock).
+    monkeypatch.setattr(authentication.time, "time", lambda: now + 60)
+    ExternalJWTAuthentication().authenticate(request_with(token))
+    assert len(decode_calls) == 2
+
+
+def test_cache_is_bounded_lru(token_backend, decode_calls, settings):
+    settings.EVENTS_API = {**settings.EVENTS_API, "TOKEN_CACHE_SIZE": 2}
+    tokens = [token_backend.encode({"user_id": i}) for i in range(3)]
+    auth = ExternalJWTAuthentication()
+    for token in (tokens[0], tokens[1], tokens[0], tokens[2]):
+        auth.authenticate(request_with(token))
+    assert len(decode_calls) == 3
+
+    auth.authenticate(request_with(tokens[0]))  # still cached: recently used
+    assert len(decode_calls) == 3
+    auth.authenticate(request_with(tokens[1]))  # evicted by tokens[2]
+    assert len(decode_calls) == 4
+
+
+def test_invalid_tokens_are_not_cached(decode_calls):
+    for _ in range(2):
+        with pytest.raises(AuthenticationFailed):
+            ExternalJWTAuthentication().authenticate(request_with("not-a-jwt"))
+    assert len(decode_calls) == 2
+
+
+def test_signing_key_change_drops_cached_tokens(token_backend, settings):
+    token = token_backend.encode({"user_id": 4})
+    ExternalJWTAuthentication().authenticate(request_with(token))
+
+    settings.SIMPLE_JWT = {**settings.SIMPLE_JWT, "SIGNING_KEY": "rotated"}
+    assert get_token_backend().signing_key == "rotated"
+    with pytest.raises(AuthenticationFailed):
+        ExternalJWTAuthentication().authenticate(request_with(token))
@@ -0,0 +1,155 @@
+import json
+
+import pytest
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from base.models import Event, Registration
+
+pytestmark = pytest.mark.django_db
+
+
+def payload(title, **overrides):
+    start = timezone.now() + timedelta(days=1)
+    data = {
+        "title": title,
+        "description": "Imported",
+        "creator": "registrar@example.com",
+        "eventType": "Class",
+        "location": "Campus",
+        "capacity": 30,
+        "hosted_by": "Registrar",
+        "event_start_date": start.isoformat(),
+        "event_end_date": (start + timedelta(hours=1)).isoformat(),
+    }
+    data.update(overrides)
+    return data
+
+
+def test_bulk_create_writes_one_batch(api_client, auth_headers):
+    items = [payload(f"Lecture {i}") for i in range(20)]
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.post("/api/events/bulk/create/", items, format="json", **auth_headers(user_id=9))
+
+    assert response.status_code == 201, response.data
+    assert response.data["succeeded"] == 20
+    ids = [result["eventID"] for result in response.data["results"]]
+    assert list(Event.objects.order_by("eventID").values_list("eventID", flat=True)) == ids
+    assert set(Event.objects.values_list("creator_id", flat=True)) == {9}
+    inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+    assert len(inserts) == 1
+
+
+def test_bulk_create_replaces_a_foreign_creator_id(api_client, auth_headers):
+    # Export output carries creator_id; re-importing it must not fail.
+    response = api_client.post(
+        "/api/events/bulk/create/", [payload("Imported", creator_id=42)], format="json", **auth_headers(user_id=9)
+    )
+    assert response.status_code == 201, response.data
+    assert list(Event.objects.values_list("creator_id", flat=True)) == [9]
+
+
+def test_bulk_create_reports_invalid_items_and_keeps_the_rest(api_client, auth_headers):
+    items = [payload("Good"), payload("Bad", capacity="many"), "not an event"]
+    response = api_client.post("/api/events/bulk/create/", items, format="json", **auth_headers())
+
+    assert response.status_code == 207
+    statuses = [result["status"] for result in response.data["results"]]
+    assert statuses == [201, 400, 400]
+    assert "capacity" in response.data["results"][1]["errors"]
+    assert list(Event.objects.values_list("title", flat=True)) == ["Good"]
+
+
+def test_bulk_create_accepts_ndjson(api_client, auth_headers):
+    body = "\n".join(json.dumps(payload(f"Line {i}")) for i in range(3)) + "\n"
+    response = api_client.post(
+        "/api/events/bulk/create/", body, content_type="application/x-ndjson", **auth_headers()
+    )
+    assert response.status_code == 201
+    assert Event.objects.count() == 3
+
+
+def test_bulk_create_invalidates_cached_lists(api_client, auth_headers):
+    assert api_client.get("/api/events/count/").data["event_count"] == 0
+    api_client.post("/api/events/bulk/create/", [payload("New")], format="json", **auth_headers())
+    assert api_client.get("/api/events/count/").data["event_count"] == 1
+
+
+@pytest.mark.parametrize("body,content_type", [
+    ({"title": "not a list"}, None),
+    ([], None),
+    ('{"title": "ok"}\n{broken', "application/x-ndjson"),
+])
+def test_bulk_rejects_malformed_bodies(api_client, auth_headers, body, content_type):
+    kwargs = {"content_type": content_type} if content_type else {"format": "json"}
+    response = api_client.post("/api/events/bulk/create/", body, **kwargs, **auth_headers())
+    assert response.status_code == 400
+
+
+def test_bulk_rejects_oversized_batches(api_client, auth_headers, settings):
+    settings.EVENTS_API = {**settings.EVENTS_API, "BULK_MAX_ITEMS": 2}
+    items = [payload(str(i)) for i in range(3)]
+    response = api_client.post("/api/events/bulk/create/", items, format="json", **auth_headers())
+    assert response.status_code == 400
+
+
+def test_bulk_update_writes_submitted_columns_and_fills_seats(api_client, auth_headers, make_event):
+    first = make_event(title="One", capacity=1, registered_students=[1])
+    second = make_event(title="Two")
+    Registration.objects.create(event=first, student_id=2, status=Registration.WAITLISTED)
+    # Raising the capacity seats the waitlist, as updateEvent does.
+    items = [{"eventID": first.eventID, "capacity": 2}, {"eventID": second.eventID, "title": "Renamed"}]
+    response = api_client.patch("/api/events/bulk/update/", items, format="json", **auth_headers())
+
+    assert response.status_code == 200, response.data
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert (first.title, first.capacity, first.registered_count) == ("One", 2, 2)
+    assert second.title == "Renamed" and second.capacity == 50
+    assert second.updated_at > second.created_at
+
+
+def test_bulk_update_checks_each_item(api_client, auth_headers, make_event):
+    mine = make_event(creator_id=1)
+    theirs = make_event(creator_id=2)
+    items = [
+        {"eventID": mine.eventID, "capacity": "x"},
+        {"eventID": theirs.eventID, "title": "Hijacked"},
+        {"eventID": 9999, "title": "Missing"},
+        {"title": "No id"},
+        {"eventID": mine.eventID, "title": "Twice"},
+    ]
+    response = api_client.patch("/api/events/bulk/update/", items, format="json", **auth_headers(user_id=1))
+
+    assert response.status_code == 400
+    assert [r["status"] for r in response.data["results"]] == [400, 403, 404, 400, 400]
+    theirs.refresh_from_db()
+    assert theirs.title == "Sample Event"
+
+
+def test_bulk_put_requires_full_representations(api_client, auth_headers, make_event):
+    event = make_event()
+    response = api_client.put("/api/events/bulk/update/", [{"eventID": event.eventID, "title": "Only"}],
+                              format="json", **auth_headers())
+    assert response.status_code == 400
+    response = api_client.put("/api/events/bulk/update/", [{"eventID": event.eventID, **payload("Full")}],
+                              format="json", **auth_headers())
+    assert response.status_code == 200
+
+
+def test_bulk_delete(api_client, auth_headers, make_event):
+    mine = [make_event(creator_id=1, registered_students=[5]) for _ in range(3)]
+    theirs = make_event(creator_id=2)
+    ids = [event.eventID for event in mine] + [{"eventID": theirs.eventID}]
+    response = api_client.delete("/api/events/bulk/delete/", ids, format="json", **auth_headers(user_id=1))
+
+    assert response.status_code == 207
+    assert [r["status"] for r in response.data["results"]] == [204, 204, 204, 403]
+    assert list(Event.objects.values_list("eventID", flat=True)) == [theirs.eventID]
+    assert not Registration.objects.exists()
+
+    admin = api_client.delete("/api/events/bulk/delete/", [theirs.eventID], format="json", **auth_headers(role="ADMIN"))
+    assert admin.status_code == 200
+    assert not Event.objects.exists()
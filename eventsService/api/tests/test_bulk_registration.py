@@ -0,0 +1,93 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from base.models import Event, Registration
+
+pytestmark = pytest.mark.django_db
+
+
+def bulk(api_client, auth_headers, event, data, action="register", role="STAFF", **kwargs):
+    kwargs = kwargs or {"format": "json"}
+    return api_client.post(
+        f"/api/events/{event.eventID}/{action}/bulk/", data, **kwargs, **auth_headers(role=role)
+    )
+
+
+def roster(event):
+    return list(
+        Registration.objects.filter(event=event).order_by("registered_at", "id").values_list("student_id", "status")
+    )
+
+
+def test_batch_fills_seats_then_waitlists(api_client, auth_headers, make_event):
+    event = make_event(capacity=3, registered_students=[1])
+    with CaptureQueriesContext(connection) as ctx:
+        response = bulk(api_client, auth_headers, event, {"student_ids": [2, 3, 1, 4, 2, 5]})
+
+    assert response.status_code == 200, response.data
+    assert response.data == {"added": [2, 3], "waitlisted": [4, 5], "skipped": [1]}
+    event.refresh_from_db()
+    assert event.registered_count == 3
+    assert roster(event) == [(1, "registered"), (2, "registered"), (3, "registered"),
+                             (4, "waitlisted"), (5, "waitlisted")]
+    inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+    assert len(inserts) == 1
+
+
+def test_newcomers_queue_behind_an_existing_waitlist(api_client, auth_headers, make_event):
+    event = make_event(capacity=1, registered_students=[1])
+    Registration.objects.create(event=event, student_id=2, status=Registration.WAITLISTED)
+    response = bulk(api_client, auth_headers, event, [3])
+    assert response.data["waitlisted"] == [3]
+
+
+@pytest.mark.parametrize("body,kwargs", [
+    ("student_id,name\n7,Ada\n8,Grace\n", {"content_type": "text/csv"}),
+    ("7\n8\n", {"content_type": "text/csv"}),
+    ({"student_ids": "7, 8"}, {"format": "json"}),
+    ({"file": SimpleUploadedFile("class.csv", b"\xef\xbb\xbfname,student_id\nAda,7\nGrace,8\n")}, {"format": "multipart"}),
+])
+def test_csv_and_other_id_formats(api_client, auth_headers, make_event, body, kwargs):
+    event = make_event()
+    response = bulk(api_client, auth_headers, event, body, **kwargs)
+    assert response.status_code == 200, response.data
+    assert response.data["added"] == [7, 8]
+
+
+@pytest.mark.parametrize("body", [[], ["abc"], {"student_ids": [1, True]}, {"other": 1}])
+def test_bad_batches_are_rejected(api_client, auth_headers, make_event, body):
+    event = make_event()
+    assert bulk(api_client, auth_headers, event, body).status_code == 400
+    assert not Registration.objects.exists()
+
+
+def test_bulk_registration_needs_staff(api_client, auth_headers, make_event):
+    event = make_event()
+    assert bulk(api_client, auth_headers, event, [1], role="STUDENT").status_code == 403
+
+
+def test_missing_event(api_client, auth_headers):
+    response = bulk(api_client, auth_headers, Event(eventID=999), [1])
+    assert response.status_code == 404
+
+
+def test_bulk_unregister_promotes_the_waitlist(api_client, auth_headers, make_event):
+    event = make_event(capacity=2)
+    bulk(api_client, auth_headers, event, [1, 2, 3, 4])
+
+    response = bulk(api_client, auth_headers, event, [1, 4, 9], action="unregister")
+    assert response.status_code == 200
+    assert response.data == {"removed": [1, 4], "skipped": [9], "promoted": [3]}
+    event.refresh_from_db()
+    assert event.registered_count == 2
+    assert roster(event) == [(2, "registered"), (3, "registered")]
+
+
+def test_bulk_registration_invalidates_cached_rosters(api_client, auth_headers, make_event):
+    event = make_event()
+    url = f"/api/events/{event.eventID}/registered_students/"
+    assert api_client.get(url).data["registered_students"] == []
+    bulk(api_client, auth_headers, event, [5, 6])
+    assert api_client.get(url).data["registered_students"] == [5, 6]
@@ -0,0 +1,169 @@
+import pytest
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from base import stats
+
+pytestmark = pytest.mark.django_db
+
+URL = "/api/events/calendar/"
+
+
+def at(day, hour=0):
+    return datetime(2026, 3, day, hour, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def march(make_event):
+    return {
+        "inside": make_event(title="Inside", event_start_date=at(10, 9), event_end_date=at(10, 11)),
+        "spanning": make_event(title="Spanning", event_start_date=at(30, 18), event_end_date=at(30, 18) + timedelta(days=4)),
+        "carried_in": make_event(title="Carried in", event_start_date=at(1) - timedelta(days=2), event_end_date=at(2, 12)),
+        "ended_before": make_event(title="Ended before", event_start_date=at(1) - timedelta(hours=3), event_end_date=at(1)),
+        "later": make_event(title="Later", event_start_date=at(1) + timedelta(days=31), event_end_date=at(1) + timedelta(days=32)),
+    }
+
+
+def days(data):
+    return {day["date"]: day["count"] for day in data["days"] if day["count"]}
+
+
+def test_month_view_returns_events_overlapping_the_window(api_client, auth_headers, march):
+    response = api_client.get(URL, {"view": "month", "date": "2026-03-15"}, **auth_headers())
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["start"], data["end"], data["timezone"]) == (
+        "2026-03-01T00:00:00+00:00", "2026-04-01T00:00:00+00:00", "UTC",
+    )
+    assert [event["title"] for event in data["events"]] == ["Carried in", "Inside", "Spanning"]
+    assert len(data["days"]) == 31
+    # Multi-day events count on every day they cover inside the window.
+    assert days(data) == {"2026-03-01": 1, "2026-03-02": 1, "2026-03-10": 1, "2026-03-30": 1, "2026-03-31": 1}
+
+
+def test_week_and_day_views(api_client, auth_headers, march):
+    week = api_client.get(URL, {"view": "week", "date": "2026-03-12"}, **auth_headers()).json()
+    assert (week["start"], week["end"]) == ("2026-03-09T00:00:00+00:00", "2026-03-16T00:00:00+00:00")
+    assert [event["title"] for event in week["events"]] == ["Inside"]
+    day = api_client.get(URL, {"view": "day", "date": "2026-03-01"}, **auth_headers()).json()
+    assert [event["title"] for event in day["events"]] == ["Carried in"]
+
+
+def test_events_are_paged_and_counted_once(api_client, auth_headers, march):
+    params = {"date": "2026-03-15", "page_size": 2}
+    first = api_client.get(URL, params, **auth_headers()).json()
+    assert [event["title"] for event in first["events"]] == ["Carried in", "Inside"]
+    assert days(first)["2026-03-31"] == 1
+    second = api_client.get(URL, {**params, "cursor": first["next_cursor"]}, **auth_headers()).json()
+    assert [event["title"] for event in second["events"]] == ["Spanning"]
+    assert second["next_cursor"] is None
+    # The counts came with the first page.
+    assert "days" not in second
+
+
+def test_counts_only_is_one_indexed_query(api_client, auth_headers, march):
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(URL, {"start": "2026-03-01", "end": "2026-03-31", "events": "false"}, **auth_headers())
+    data = response.json()
+    assert "events" not in data
+    # A date-only end includes that day.
+    assert data["end"] == "2026-04-01T00:00:00+00:00"
+    assert days(data)["2026-03-10"] == 1
+    event_queries = [query["sql"] for query in ctx.captured_queries if 'FROM "base_event"' in query["sql"]]
+    assert len(event_queries) == 1
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN QUERY PLAN " + event_queries[0])
+            plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+        assert "COVERING INDEX event_window_idx" in plan
+
+
+def test_long_events_are_not_cut_off_by_the_duration_bound(api_client, auth_headers, make_event):
+    make_event(title="Semester", event_start_date=at(1) - timedelta(days=60), event_end_date=at(1) + timedelta(days=60))
+    if stats.tracked():
+        assert stats.longest_duration() == timedelta(hours=stats.DURATION_BUCKETS[-1])
+    make_event(title="Residency", event_start_date=at(1) - timedelta(days=400), event_end_date=at(20))
+    if stats.tracked():
+        assert stats.longest_duration() is None
+    data = api_client.get(URL, {"date": "2026-03-05"}, **auth_headers()).json()
+    assert [event["title"] for event in data["events"]] == ["Residency", "Semester"]
+
+
+def test_days_are_bucketed_in_the_requested_timezone(api_client, auth_headers, make_event):
+    # 02:00 UTC on the 10th is still the 9th in New York.
+    make_event(title="Late", event_start_date=at(10, 2), event_end_date=at(10, 3))
+    data = api_client.get(
+        URL, {"view": "week", "date": "2026-03-09", "tz": "America/New_York"}, **auth_headers()
+    ).json()
+    assert data["start"] == "2026-03-09T00:00:00-04:00"
+    assert days(data) == {"2026-03-09": 1}
+
+
+def test_fieldsets_apply_to_calendar_events(api_client, auth_headers, march):
+    data = api_client.get(URL, {"date": "2026-03-01", "fields": "eventID,title"}, **auth_headers()).json()
+    assert set(data["events"][0]) == {"eventID", "title"}
+
+
+@pytest.mark.parametrize("params", [
+    {"view": "year"},
+    {"date": "March"},
+    {"tz": "Mars/Olympus"},
+    {"start": "2026-03-01"},
+    {"start": "2026-03-10", "end": "2026-03-01"},
+    {"start": "2026-01-01", "end": "2026-06-30"},
+    {"events": "maybe"},
+    {"cursor": "not-a-cursor"},
+    {"page_size": "0"},
+])
+def test_rejects_bad_windows(api_client, auth_headers, params):
+    response = api_client.get(URL, params, **auth_headers())
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+@pytest.mark.parametrize("params", [
+    {"view": "month", "date": "9999-12-15"},
+    {"view": "day", "date": "9999-12-31"},
+    {"start": "9999-12-01", "end": "9999-12-31"},
+    {"start": "0001-01-01", "end": "0001-01-02", "tz": "Asia/Tokyo"},
+])
+def test_windows_at_the_ends_of_the_calendar_are_rejected(api_client, auth_headers, params):
+    response = api_client.get(URL, params, **auth_headers())
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+def test_huge_windows_are_rejected_before_their_days_are_built(monkeypatch):
+    from django.http import QueryDict
+    from api import windows
+
+    def days(window):
+        raise AssertionError("days() built for an oversized window")
+
+    monkeypatch.setattr(windows.Window, "days", days)
+    with pytest.raises(windows.CalendarError):
+        windows.requested(QueryDict("start=0001-01-01&end=9999-12-30"))
+
+
+def test_windows_near_year_one_still_work(api_client, auth_headers, make_event):
+    make_event(title="Long", event_start_date=at(1) - timedelta(days=2), event_end_date=at(2))
+    response = api_client.get(URL, {"start": "0001-01-01", "end": "0001-01-31"}, **auth_headers())
+    assert response.status_code == 200
+    assert response.json()["events"] == []
+
+
+def test_window_cap_follows_settings(api_client, auth_headers, settings):
+    settings.EVENTS_API = {**settings.EVENTS_API, "CALENDAR_MAX_DAYS": 7}
+    assert api_client.get(URL, {"view": "week"}, **auth_headers()).status_code == 200
+    assert api_client.get(URL, {"view": "month"}, **auth_headers()).status_code == 400
+
+
+def test_date_range_can_match_overlapping_events(api_client, auth_headers, march):
+    params = {"start_date": "2026-03-01T00:00:00Z", "end_date": "2026-03-31T00:00:00Z"}
+    inside = api_client.get("/api/events/by_date_range/", params, **auth_headers()).json()
+    assert [event["title"] for event in inside] == ["Inside"]
+    overlap = api_client.get("/api/events/by_date_range/", {**params, "overlap": "true"}, **auth_headers()).json()
+    assert [event["title"] for event in overlap] == ["Carried in", "Inside", "Spanning"]
+    bad = api_client.get("/api/events/by_date_range/", {**params, "overlap": "true", "start_date": "soon"}, **auth_headers())
+    assert bad.status_code == 400
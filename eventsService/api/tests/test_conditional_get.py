@@ -0,0 +1,109 @@
+import pytest
+
+from api.serializers import EventSerializer
+
+pytestmark = pytest.mark.django_db
+
+NO_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+@pytest.fixture
+def uncached(settings):
+    # Exercise the views themselves rather than the response cache: nothing
+    # is stored for a response, but the write generation still is.
+    settings.EVENTS_API = {**settings.EVENTS_API, "RESPONSE_CACHE_TIMEOUT": 0}
+
+
+@pytest.fixture
+def forbid_serialization(monkeypatch):
+    def explode(self, instance):
+        raise AssertionError("a 304 must not serialise the event")
+
+    monkeypatch.setattr(EventSerializer, "to_representation", explode)
+
+
+@pytest.mark.parametrize("path", ["/api/events/{id}/", "/api/events/{id}/registered_students/", "/api/events/"])
+def test_etag_revalidation_returns_304(api_client, make_event, uncached, path, request):
+    event = make_event()
+    url = path.format(id=event.eventID)
+
+    first = api_client.get(url)
+    assert first.status_code == 200
+    assert first["ETag"]
+
+    request.getfixturevalue("forbid_serialization")
+    second = api_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert second.status_code == 304
+    assert second["ETag"] == first["ETag"]
+
+
+def test_if_modified_since(api_client, make_event, uncached):
+    event = make_event()
+    first = api_client.get(f"/api/events/{event.eventID}/")
+    assert api_client.get(f"/api/events/{event.eventID}/", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code == 304
+
+
+def test_lists_send_no_last_modified(api_client, make_event, uncached):
+    make_event(title="Keep")
+    doomed = make_event(title="Doomed")
+    detail = api_client.get(f"/api/events/{doomed.eventID}/")
+    first = api_client.get("/api/events/")
+    assert "Last-Modified" not in first
+
+    # Deleting a row leaves MAX(updated_at) unchanged, so If-Modified-Since
+    # must never be answered with 304 on a list.
+    doomed.delete()
+    response = api_client.get("/api/events/", HTTP_IF_MODIFIED_SINCE=detail["Last-Modified"])
+    assert response.status_code == 200
+    assert [e["title"] for e in response.data] == ["Keep"]
+
+
+def test_registration_changes_detail_etag(api_client, make_event, auth_headers, uncached):
+    event = make_event()
+    etag = api_client.get(f"/api/events/{event.eventID}/registered_students/")["ETag"]
+
+    api_client.post(f"/api/events/{event.eventID}/register/", data={"student_id": 4}, format="json", **auth_headers())
+
+    response = api_client.get(f"/api/events/{event.eventID}/registered_students/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data["registered_students"] == [4]
+
+
+def test_list_etag_notices_deletions(api_client, make_event, uncached):
+    make_event(title="Keep")
+    doomed = make_event(title="Doomed")
+    etag = api_client.get("/api/events/")["ETag"]
+
+    doomed.delete()
+    response = api_client.get("/api/events/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert [e["title"] for e in response.data] == ["Keep"]
+
+
+def test_list_etag_needs_no_query(api_client, make_event, uncached, django_assert_num_queries):
+    make_event()
+    etag = api_client.get("/api/events/", {"page_size": 1})["ETag"]
+    # Revalidating a page touches no table at all.
+    with django_assert_num_queries(0):
+        response = api_client.get("/api/events/", {"page_size": 1}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    # Another page is another representation.
+    assert api_client.get("/api/events/", {"page_size": 2})["ETag"] != etag
+
+
+def test_lists_without_a_cache_send_no_etag(api_client, make_event, settings):
+    # A backend that stores nothing cannot hold the generation.
+    settings.CACHES = NO_CACHE
+    make_event()
+    response = api_client.get("/api/events/")
+    assert response.status_code == 200
+    assert "ETag" not in response
+    assert api_client.get("/api/events/", HTTP_IF_NONE_MATCH='"anything"').status_code == 200
+
+
+def test_cache_hit_revalidates(api_client, make_event):
+    make_event()
+    first = api_client.get("/api/events/")
+    second = api_client.get("/api/events/", HTTP_IF_NONE_MATCH=first["ETag"])
+    assert second.status_code == 304
+    assert api_client.get("/api/health/").data["cache"]["hits"] == 1
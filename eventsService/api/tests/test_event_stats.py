@@ -0,0 +1,219 @@
+import io
+import threading
+
+import pytest
+from datetime import timedelta
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from base import registration, stats
+from base.models import Event, EventStat, EventStatDelta
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(not stats.tracked(), reason="needs the event statistics triggers"),
+]
+
+
+def assert_counters_match():
+    assert stats.current() == stats.expected()
+
+
+def test_counters_follow_every_kind_of_write(make_event, api_client, auth_headers):
+    now = timezone.now()
+    first = make_event(eventType="Seminar", hosted_by="AI Lab", capacity=2)
+    second = make_event(eventType="Workshop", capacity=10, event_start_date=now - timedelta(days=3),
+                        event_end_date=now - timedelta(days=2))
+    assert_counters_match()
+
+    # Single and batch registrations, including waitlist promotion.
+    registration.register(first.eventID, 1)
+    registration.register_many(first.eventID, [2, 3, 4])
+    registration.unregister(first.eventID, 1)
+    registration.unregister_many(second.eventID, [9])
+    assert_counters_match()
+    stats.fold()
+    assert_counters_match()
+
+    # Field changes move the event between buckets.
+    first.refresh_from_db()
+    first.eventType, first.hosted_by = "Workshop", "Library"
+    first.event_start_date += timedelta(days=40)
+    first.event_end_date += timedelta(days=40)
+    first.save()
+    Event.objects.filter(eventID=second.eventID).update(capacity=25)
+    assert_counters_match()
+
+    # Bulk endpoints bypass model signals but not the triggers.
+    created = api_client.post("/api/events/bulk/create/", [{
+        "title": "Imported", "description": "d", "creator": "x", "eventType": "Class", "location": "L",
+        "capacity": 5, "hosted_by": "Registrar",
+        "event_start_date": now.isoformat(), "event_end_date": (now + timedelta(hours=1)).isoformat(),
+    }], format="json", **auth_headers(role="ADMIN"))
+    assert created.status_code == 201
+    api_client.delete("/api/events/bulk/delete/", [second.eventID], format="json", **auth_headers(role="ADMIN"))
+    first.delete()
+    assert_counters_match()
+    assert stats.current()[(stats.TOTAL, "")] == (1, 5, 0)
+
+
+def test_registrations_append_deltas_until_folded(api_client, make_event):
+    event = make_event(eventType="Seminar", hosted_by="AI Lab", capacity=5)
+    counters = set(EventStat.objects.values_list("dimension", "value", "events", "capacity", "registered"))
+
+    registration.register_many(event.eventID, [1, 2, 3])
+    registration.unregister(event.eventID, 2)
+    # The shared rows are untouched; each seat change is a delta row.
+    assert set(EventStat.objects.values_list("dimension", "value", "events", "capacity", "registered")) == counters
+    assert list(EventStatDelta.objects.values_list("registered_count", flat=True).order_by("id")) == [3, -1]
+    assert stats.pending()[(stats.HOST, "AI Lab")] == 2
+    assert api_client.get("/api/events/stats/").data["registered"] == 2
+    assert_counters_match()
+
+    assert stats.fold() == 2
+    assert not EventStatDelta.objects.exists()
+    assert EventStat.objects.get(dimension=stats.TYPE, value="Seminar").registered == 2
+    assert_counters_match()
+    assert stats.fold() == 0
+
+
+def test_deltas_of_moved_and_deleted_events_fold_cleanly(make_event):
+    moved = make_event(eventType="Seminar", capacity=5)
+    gone = make_event(eventType="Seminar", capacity=5)
+    registration.register_many(moved.eventID, [1, 2])
+    registration.register(gone.eventID, 1)
+    # Pending deltas stay filed under the old values; the full recount
+    # takes the whole registered_count out of those rows.
+    Event.objects.filter(eventID=moved.eventID).update(eventType="Workshop")
+    Event.objects.filter(eventID=gone.eventID).delete()
+    assert_counters_match()
+    stats.fold()
+    assert_counters_match()
+    assert stats.current()[(stats.TYPE, "Workshop")] == (1, 5, 2)
+
+
+def test_fold_command(make_event):
+    event = make_event(capacity=3)
+    registration.register(event.eventID, 1)
+    out = io.StringIO()
+    call_command("recompute_event_stats", "--fold", stdout=out)
+    assert "Folded 1 registration deltas" in out.getvalue()
+    assert not EventStatDelta.objects.exists()
+    call_command("recompute_event_stats", "--check", stdout=io.StringIO())
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="SQLite serializes all writers anyway")
+@pytest.mark.django_db(transaction=True)
+def test_registrations_on_other_events_do_not_wait_for_the_counters(make_event):
+    held, other = make_event(capacity=5), make_event(capacity=5)
+    registered, release = threading.Event(), threading.Event()
+
+    def hold_open():
+        try:
+            with transaction.atomic():
+                registration.register(held.eventID, 1)
+                registered.set()
+                release.wait(10)
+        finally:
+            registered.set()
+            connection.close()
+
+    holder = threading.Thread(target=hold_open)
+    holder.start()
+    try:
+        assert registered.wait(10)
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL lock_timeout = '1s'")
+            registration.register(other.eventID, 1)
+    finally:
+        release.set()
+        holder.join()
+    assert_counters_match()
+
+
+def test_event_count_reads_the_counter(api_client, make_event):
+    make_event()
+    make_event()
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get("/api/events/count/")
+    assert response.data == {"event_count": 2}
+    assert not any("base_event\"" in q["sql"] and "COUNT" in q["sql"] for q in ctx.captured_queries)
+
+
+def test_stats_endpoint(api_client, make_event):
+    now = timezone.now()
+    make_event(eventType="Seminar", hosted_by="AI Lab", capacity=4, registered_students=[1, 2, 3])
+    make_event(eventType="Seminar", hosted_by="Library", capacity=6, registered_students=[1])
+    make_event(eventType="Workshop", hosted_by="AI Lab", capacity=10,
+               event_start_date=now - timedelta(days=5), event_end_date=now - timedelta(days=4))
+    make_event(eventType="Social", hosted_by="Library", capacity=10,
+               event_start_date=now - timedelta(hours=1), event_end_date=now + timedelta(hours=1))
+    # Starts later today: only today's bucket needs a look at base_event.
+    make_event(eventType="Social", hosted_by="Library", capacity=0,
+               event_start_date=now + timedelta(seconds=30), event_end_date=now + timedelta(seconds=60))
+
+    data = api_client.get("/api/events/stats/").data
+    assert (data["event_count"], data["capacity"], data["registered"]) == (5, 30, 4)
+    assert data["fill_rate"] == round(4 / 30, 4)
+    assert (data["upcoming"], data["past"], data["ongoing"]) == (3, 1, 1)
+    assert data["by_type"][0] == {
+        "eventType": "Seminar", "event_count": 2, "capacity": 10, "registered": 4, "fill_rate": 0.4,
+    }
+    assert [row["hosted_by"] for row in data["by_host"]] == ["Library", "AI Lab"]
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="reads SQLite query plans")
+def test_stats_reads_do_not_scan_the_catalogue(api_client, make_event):
+    for _ in range(3):
+        make_event()
+    with CaptureQueriesContext(connection) as ctx:
+        api_client.get("/api/events/stats/")
+    for query in ctx.captured_queries:
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {query['sql']}")
+            plan = [row[-1] for row in cursor.fetchall()]
+        assert not any(step == "SCAN base_event" for step in plan), (query["sql"], plan)
+
+
+def test_recompute_command_repairs_drift(make_event):
+    make_event(capacity=7)
+    EventStat.objects.filter(dimension=stats.TOTAL).update(events=99)
+    with pytest.raises(CommandError):
+        call_command("recompute_event_stats", "--check", stdout=io.StringIO())
+
+    registration.register(Event.objects.get().eventID, 1)
+    call_command("recompute_event_stats", stdout=io.StringIO())
+    assert not EventStatDelta.objects.exists()
+    assert_counters_match()
+    call_command("recompute_event_stats", "--check", stdout=io.StringIO())
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="only SQLite stores timestamps as text")
+def test_check_reads_iso_t_z_timestamps(make_event):
+    event = make_event(capacity=4)
+    # As written by raw imports; SQLite's date functions read it, Django's don't.
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "UPDATE base_event SET event_start_date = %s, event_end_date = %s WHERE \"eventID\" = %s",
+            ["2026-03-01T10:00:00Z", "2026-03-01T13:30:00Z", event.eventID],
+        )
+    assert stats.expected()[(stats.START_DAY, "2026-03-01")] == (1, 4, 0)
+    assert stats.expected()[(stats.DURATION, "4")] == (1, 4, 0)
+    assert_counters_match()
+    call_command("recompute_event_stats", "--check", stdout=io.StringIO())
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite table rebuilds drop triggers")
+def test_repair_restores_dropped_triggers(make_event):
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TRIGGER {stats.STATS_TABLE}_ai")
+    make_event()
+    assert stats.current() != stats.expected()
+
+    stats.repair(connection)
+    assert_counters_match()
+    make_event()
+    assert_counters_match()
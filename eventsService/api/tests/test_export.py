@@ -0,0 +1,64 @@
+import json
+
+import pytest
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test.utils import CaptureQueriesContext
+
+from api.fieldsets import ALL_FIELDS
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def catalogue(make_event):
+    for i in range(5):
+        make_event(title=f"E{i}", eventType="Seminar" if i % 2 else "Workshop", registered_students=[i])
+
+
+def body(response):
+    assert isinstance(response, StreamingHttpResponse)
+    return b"".join(response.streaming_content)
+
+
+def test_json_export_matches_the_full_list(api_client, catalogue):
+    response = api_client.get("/api/events/export/")
+    assert response["Content-Type"] == "application/json"
+    exported = json.loads(body(response))
+
+    listed = api_client.get("/api/events/filters/", {"exclude": ""}).json()
+    assert exported == listed
+    assert set(exported[0]) == set(ALL_FIELDS)
+
+
+def test_ndjson_export_is_one_event_per_line(api_client, catalogue):
+    response = api_client.get("/api/events/export/ndjson/", {"fields": "eventID,title"})
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = body(response).decode().splitlines()
+    assert [json.loads(line)["title"] for line in lines] == [f"E{i}" for i in range(5)]
+
+
+def test_export_applies_the_multiple_filters(api_client, catalogue):
+    response = api_client.get("/api/events/export/", {"eventType": "Seminar", "fields": "title"})
+    assert json.loads(body(response)) == [{"title": "E1"}, {"title": "E3"}]
+
+
+def test_export_reads_in_chunks(api_client, catalogue, settings):
+    settings.EVENTS_API = {**settings.EVENTS_API, "EXPORT_CHUNK_SIZE": 2}
+    response = api_client.get("/api/events/export/ndjson/")
+    with CaptureQueriesContext(connection) as ctx:
+        lines = body(response).splitlines()
+    assert len(lines) == 5
+    # One streaming read of the events, plus one roster query per chunk of 2.
+    assert sum("base_registration" in q["sql"] for q in ctx.captured_queries) == 3
+    assert json.loads(lines[4])["registered_students"] == [4]
+
+
+def test_empty_export(api_client):
+    assert json.loads(body(api_client.get("/api/events/export/"))) == []
+    assert body(api_client.get("/api/events/export/ndjson/")) == b""
+
+
+def test_export_rejects_unknown_fields(api_client):
+    response = api_client.get("/api/events/export/", {"fields": "nope"})
+    assert response.status_code == 400
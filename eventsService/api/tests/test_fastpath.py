@@ -0,0 +1,63 @@
+import pytest
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from api import fastpath
+from api.fieldsets import ALL_FIELDS, LIST_FIELDS
+from api.serializers import EventSerializer
+from base.models import Event
+
+pytestmark = pytest.mark.django_db
+
+FIELDSETS = [
+    ALL_FIELDS,
+    LIST_FIELDS,
+    ("title", "registered_students"),
+    ("registered_students", "eventID"),
+    ("creator_id", "link", "zoom_link", "image_url", "updated_at"),
+]
+
+
+@pytest.fixture
+def varied_events(make_event):
+    make_event(
+        title="Ünïcödé — “quotes”  ",
+        creator_id=None,
+        link=None,
+        zoom_link="",
+        image_url="https://example.com/a.png",
+        registered_students=[5, 3, 9],
+        event_start_date=datetime(2030, 3, 10, 6, 30, 15, 123456, tzinfo=dt_timezone.utc),
+        event_end_date=datetime(2030, 3, 10, 9, 0, tzinfo=dt_timezone.utc),
+    )
+    make_event(title="No roster", link="https://example.com", event_end_date=timezone.now() + timedelta(days=2))
+    make_event(title="Third", registered_students=[1])
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+@pytest.mark.parametrize("fields", FIELDSETS, ids=lambda f: ",".join(f)[:40])
+@pytest.mark.parametrize("tz", ["UTC", "America/New_York"])
+def test_fast_path_renders_identical_json(varied_events, fields, tz):
+    queryset = Event.objects.order_by("event_end_date", "eventID")
+    with timezone.override(tz):
+        expected = EventSerializer(queryset, many=True, fields=fields).data
+        actual = fastpath.represent(fastpath.event_rows(queryset, fields, ["event_end_date"]), fields)
+    assert render(actual) == render(expected)
+
+
+def test_list_endpoint_matches_serializer_output(api_client, varied_events):
+    response = api_client.get("/api/events/", {"exclude": ""})
+    queryset = Event.objects.order_by("event_end_date", "eventID")
+    assert response.content == render(EventSerializer(queryset, many=True).data)
+
+
+def test_rosters_are_batched(varied_events, monkeypatch, django_assert_num_queries):
+    monkeypatch.setattr(fastpath, "ROSTER_BATCH_SIZE", 2)
+    rows = fastpath.event_rows(Event.objects.order_by("eventID"), ALL_FIELDS, [])
+    with django_assert_num_queries(3):  # the rows, then two roster batches
+        data = fastpath.represent(rows, ALL_FIELDS)
+    assert [e["registered_students"] for e in data] == [[5, 3, 9], [], [1]]
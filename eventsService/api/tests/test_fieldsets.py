@@ -0,0 +1,75 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.fieldsets import LIST_FIELDS
+
+pytestmark = pytest.mark.django_db
+
+
+def test_lists_default_to_the_compact_representation(api_client, make_event):
+    make_event(title="Compact", registered_students=[1, 2])
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get("/api/events/")
+
+    assert response.status_code == 200
+    assert set(response.data[0]) == set(LIST_FIELDS)
+    assert response.data[0]["registered_count"] == 2
+    event_query = next(q["sql"] for q in ctx.captured_queries if "ORDER BY" in q["sql"])
+    assert '"description"' not in event_query
+    assert not any("base_registration" in q["sql"] for q in ctx.captured_queries)
+
+
+def test_detail_keeps_every_field(api_client, make_event):
+    event = make_event(registered_students=[4])
+    response = api_client.get(f"/api/events/{event.eventID}/")
+    assert "description" in response.data
+    assert response.data["registered_students"] == [4]
+
+
+def test_fields_selects_exactly_those_columns(api_client, make_event):
+    make_event(title="Picked", description="long text")
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get("/api/events/", {"fields": "title,description"})
+
+    assert response.data == [{"title": "Picked", "description": "long text"}]
+    event_query = next(q["sql"] for q in ctx.captured_queries if "ORDER BY" in q["sql"])
+    assert '"location"' not in event_query
+
+
+def test_exclude_starts_from_the_full_representation(api_client, make_event):
+    make_event(registered_students=[7])
+    response = api_client.get("/api/events/", {"exclude": "description,zoom_link"})
+    row = response.data[0]
+    assert "description" not in row and "zoom_link" not in row
+    assert row["registered_students"] == [7]
+    assert "created_at" in row
+
+
+def test_roster_is_only_fetched_when_asked_for(api_client, make_event):
+    make_event(title="A", registered_students=[1, 2])
+    make_event(title="B", registered_students=[3])
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get("/api/events/", {"fields": "title,registered_students"})
+
+    assert [e["registered_students"] for e in response.data] == [[1, 2], [3]]
+    assert sum("base_registration" in q["sql"] for q in ctx.captured_queries) == 1
+
+
+def test_sparse_pages_still_carry_a_cursor(api_client, make_event):
+    for i in range(3):
+        make_event(title=f"E{i}")
+    first = api_client.get("/api/events/", {"fields": "title", "page_size": 2})
+    assert first.data["results"] == [{"title": "E0"}, {"title": "E1"}]
+
+    second = api_client.get(
+        "/api/events/", {"fields": "title", "page_size": 2, "cursor": first.data["next_cursor"]}
+    )
+    assert second.data["results"] == [{"title": "E2"}]
+
+
+@pytest.mark.parametrize("params", [{"fields": "title,nope"}, {"exclude": "bogus"}, {"fields": ","}])
+def test_bad_fieldsets(api_client, params):
+    response = api_client.get("/api/events/", params)
+    assert response.status_code == 400
+    assert "error" in response.data
@@ -0,0 +1,83 @@
+import pytest
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+pytestmark = pytest.mark.django_db
+
+URL = "/api/events/filters/"
+
+
+@pytest.fixture
+def catalogue(make_event):
+    now = timezone.now()
+    make_event(title="Past Seminar", eventType="Seminar", capacity=10, registered_students=list(range(10)),
+               event_start_date=now - timedelta(days=3), event_end_date=now - timedelta(days=2))
+    make_event(title="Robotics Workshop", eventType="Workshop", capacity=30, link="https://example.com",
+               event_start_date=now + timedelta(days=2), event_end_date=now + timedelta(days=2, hours=2))
+    make_event(title="Robotics Social", eventType="Social", capacity=100, zoom_link="https://zoom.us/j/1",
+               registered_students=[1], event_start_date=now + timedelta(days=1),
+               event_end_date=now + timedelta(days=1, hours=1))
+    make_event(title="Art Workshop", eventType="Workshop", capacity=5, registered_students=[1, 2, 3, 4, 5],
+               event_start_date=now + timedelta(days=10), event_end_date=now + timedelta(days=11))
+    return now
+
+
+def titles(response):
+    assert response.status_code == 200, response.data
+    data = response.data["results"] if isinstance(response.data, dict) else response.data
+    return [row["title"] for row in data]
+
+
+def test_predicates_combine(api_client, catalogue):
+    response = api_client.get(URL, {"eventType": "Workshop,Social", "when": "upcoming", "availability": "available"})
+    assert titles(response) == ["Robotics Workshop", "Robotics Social"]
+
+
+def test_date_window_and_sort(api_client, catalogue):
+    response = api_client.get(URL, {
+        "start_after": (catalogue - timedelta(days=5)).date().isoformat(),
+        "end_before": (catalogue + timedelta(days=3)).isoformat(),
+        "sort": "-event_start_date",
+    })
+    assert titles(response) == ["Robotics Workshop", "Robotics Social", "Past Seminar"]
+
+
+def test_full_text_term_ranks_and_filters(api_client, catalogue):
+    response = api_client.get(URL, {"q": "robot", "min_capacity": 50})
+    assert titles(response) == ["Robotics Social"]
+    assert set(titles(api_client.get(URL, {"q": "robot", "sort": "capacity"}))) == {"Robotics Workshop", "Robotics Social"}
+
+
+def test_links_and_seats_left(api_client, catalogue):
+    assert titles(api_client.get(URL, {"has_link": "true"})) == ["Robotics Workshop"]
+    assert titles(api_client.get(URL, {"has_zoom_link": "yes", "has_link": "false"})) == ["Robotics Social"]
+    assert titles(api_client.get(URL, {"availability": "full", "sort": "seats_left"})) == ["Past Seminar", "Art Workshop"]
+
+
+def test_pages_are_one_select(api_client, catalogue):
+    params = {"eventType": "Workshop,Social", "sort": "event_start_date", "page_size": 1}
+    first = api_client.get(URL, params)
+    assert titles(first) == ["Robotics Social"]
+
+    with CaptureQueriesContext(connection) as ctx:
+        second = api_client.get(URL, {**params, "cursor": first.data["next_cursor"]})
+    assert titles(second) == ["Robotics Workshop"]
+    page_queries = [q for q in ctx.captured_queries if "LIMIT" in q["sql"]]
+    assert len(page_queries) == 1
+
+
+@pytest.mark.parametrize("params", [
+    {"sort": "title"},
+    {"sort": "relevance"},
+    {"min_capacity": "lots"},
+    {"start_after": "next tuesday"},
+    {"when": "soon"},
+    {"availability": "maybe"},
+    {"has_link": "perhaps"},
+])
+def test_bad_parameters_are_rejected(api_client, catalogue, params):
+    response = api_client.get(URL, params)
+    assert response.status_code == 400
+    assert "error" in response.data
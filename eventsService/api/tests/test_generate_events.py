@@ -0,0 +1,53 @@
+import io
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Count, Q
+
+from base import stats
+from base.models import Event, Registration
+
+pytestmark = pytest.mark.django_db
+
+
+def generate(**options):
+    call_command("generate_events", stdout=io.StringIO(), **options)
+
+
+def snapshot():
+    return list(
+        Event.objects.order_by("eventID").values_list("title", "eventType", "capacity", "registered_count", "hosted_by")
+    )
+
+
+def test_catalogue_is_consistent():
+    generate(events=300, students=400, batch_size=70)
+    assert Event.objects.count() == 300
+
+    events = Event.objects.annotate(
+        registered=Count("registrations", filter=Q(registrations__status=Registration.REGISTERED)),
+        waitlisted=Count("registrations", filter=Q(registrations__status=Registration.WAITLISTED)),
+    )
+    for event in events:
+        assert event.registered == event.registered_count <= event.capacity
+        assert event.event_end_date > event.event_start_date
+        if event.waitlisted:
+            assert event.registered_count == event.capacity
+    assert events.filter(waitlisted__gt=0).exists()
+    if stats.tracked():
+        assert stats.current() == stats.expected()
+
+
+def test_same_seed_same_catalogue():
+    generate(events=50, seed=7)
+    first = snapshot()
+    generate(events=50, seed=7, clear=True)
+    assert snapshot() == first
+    generate(events=50, seed=8, clear=True)
+    assert snapshot() != first
+
+
+def test_fill_scale_zero_skips_registrations():
+    generate(events=20, fill_scale=0)
+    assert not Registration.objects.exists()
+    assert not Event.objects.filter(registered_count__gt=0).exists()
@@ -0,0 +1,93 @@
+import re
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+
+from api import metrics
+
+pytestmark = pytest.mark.django_db
+
+SAMPLE = re.compile(r'^(\w+)\{(.*)\} (\S+)$')
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def scrape(client):
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response["Content-Type"] == metrics.CONTENT_TYPE
+    samples = {}
+    for line in response.content.decode().splitlines():
+        if line.startswith("#"):
+            continue
+        name, labels, value = SAMPLE.match(line).groups()
+        samples[name, labels] = float(value)
+    return samples
+
+
+def test_records_latency_queries_serialization_and_size(api_client, make_event):
+    for _ in range(3):
+        make_event()
+    with CaptureQueriesContext(connection) as ctx:
+        body = api_client.get("/api/events/", {"exclude": ""}).content
+    queries = len(ctx.captured_queries)
+    samples = scrape(api_client)
+
+    assert samples["events_http_requests_total", 'method="GET",route="getEvents",status="200"'] == 1
+    assert samples["events_http_request_duration_seconds_count", 'method="GET",route="getEvents"'] == 1
+    assert samples["events_db_queries_per_request_sum", 'route="getEvents"'] == queries
+    assert samples["events_db_duration_seconds_sum", 'route="getEvents"'] > 0
+    assert samples["events_serialization_duration_seconds_count", 'route="getEvents"'] == 1
+    assert samples["events_http_response_size_bytes_sum", 'route="getEvents"'] == len(body)
+
+
+def test_histogram_buckets_are_cumulative(api_client, make_event):
+    make_event()
+    api_client.get("/api/events/")
+    api_client.get("/api/events/")
+    samples = scrape(api_client)
+    buckets = [value for (name, labels), value in samples.items()
+               if name == "events_db_queries_per_request_bucket" and 'route="getEvents"' in labels]
+    assert buckets == sorted(buckets)
+    assert samples["events_db_queries_per_request_bucket", 'route="getEvents",le="+Inf"'] == 2
+
+
+def test_async_views_count_their_queries(api_client, make_event):
+    event = make_event()
+    response = async_to_sync(AsyncClient().get)(f"/api/async/events/{event.eventID}/")
+    assert response.status_code == 200
+    samples = scrape(api_client)
+    assert samples["events_db_queries_per_request_sum", 'route="getEventAsync"'] >= 1
+    # Async views hand back pre-rendered JSON, so there is no render step to time.
+    assert ("events_serialization_duration_seconds_count", 'route="getEventAsync"') not in samples
+
+
+def test_sync_views_under_asgi_are_timed(api_client, make_event):
+    make_event()
+    response = async_to_sync(AsyncClient().get)("/api/events/")
+    assert response.status_code == 200
+    samples = scrape(api_client)
+    assert samples["events_serialization_duration_seconds_count", 'route="getEvents"'] == 1
+    assert samples["events_db_queries_per_request_sum", 'route="getEvents"'] >= 1
+
+
+def test_unknown_paths_share_one_label(api_client):
+    api_client.get("/nowhere/")
+    api_client.get("/elsewhere/")
+    samples = scrape(api_client)
+    assert samples["events_http_requests_total", 'method="GET",route="unmatched",status="404"'] == 2
+
+
+def test_metrics_can_be_turned_off(api_client, settings):
+    settings.EVENTS_API = {**settings.EVENTS_API, "METRICS": False}
+    api_client.get("/api/health/")
+    assert api_client.get("/metrics").status_code == 404
+    assert "route=" not in metrics.render()
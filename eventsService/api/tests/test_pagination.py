@@ -0,0 +1,101 @@
+import pytest
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api import pagination
+
+pytestmark = pytest.mark.django_db
+
+
+def collect_pages(api_client, url, **params):
+    titles, cursor, pages = [], None, 0
+    while True:
+        query = dict(params)
+        if cursor:
+            query["cursor"] = cursor
+        response = api_client.get(url, query)
+        assert response.status_code == 200
+        titles.extend(e["title"] for e in response.data["results"])
+        pages += 1
+        cursor = response.data["next_cursor"]
+        if cursor is None:
+            return titles, pages
+
+
+def test_unpaginated_requests_keep_list_shape(api_client, make_event):
+    make_event()
+    response = api_client.get("/api/events/")
+    assert response.status_code == 200
+    assert isinstance(response.data, list)
+
+
+def test_cursor_walks_every_event_once_in_order(api_client, make_event):
+    now = timezone.now()
+    # Duplicate end dates force the eventID tiebreaker to do its job.
+    for i in range(7):
+        make_event(title=f"E{i}", event_end_date=now + timedelta(days=i // 2))
+
+    titles, pages = collect_pages(api_client, "/api/events/", page_size=3)
+    assert titles == [f"E{i}" for i in range(7)]
+    assert pages == 3
+
+
+def test_descending_sort_pages(api_client, make_event):
+    now = timezone.now()
+    for i in range(5):
+        make_event(
+            title=f"P{i}",
+            event_start_date=now - timedelta(days=10),
+            event_end_date=now - timedelta(days=i + 1),
+        )
+
+    titles, _ = collect_pages(api_client, "/api/events/past/", page_size=2)
+    assert titles == ["P0", "P1", "P2", "P3", "P4"]
+
+
+def test_page_cost_is_constant(api_client, make_event):
+    for i in range(6):
+        make_event(title=f"E{i}")
+
+    first = api_client.get("/api/events/", {"page_size": 2})
+    with CaptureQueriesContext(connection) as ctx:
+        api_client.get("/api/events/", {"page_size": 2, "cursor": first.data["next_cursor"]})
+    # One keyset query for the page: the ETag comes from the write
+    # generation and the compact representation has no roster to prefetch.
+    assert len(ctx.captured_queries) == 1
+    page_query = ctx.captured_queries[0]["sql"]
+    assert "LIMIT 3" in page_query
+    assert "OFFSET" not in page_query
+
+
+def test_page_size_is_capped(api_client, make_event, settings):
+    settings.EVENTS_API = {**settings.EVENTS_API, "MAX_PAGE_SIZE": 2}
+    for _ in range(3):
+        make_event()
+    response = api_client.get("/api/events/", {"page_size": 100})
+    assert response.data["page_size"] == 2
+    assert len(response.data["results"]) == 2
+
+
+@pytest.mark.parametrize("params", [{"cursor": "not-a-cursor"}, {"page_size": "abc"}, {"page_size": 0}])
+def test_bad_pagination_params(api_client, params):
+    response = api_client.get("/api/events/", params)
+    assert response.status_code == 400
+    assert "error" in response.data
+
+
+@pytest.mark.parametrize("url, values", [
+    ("/api/events/by_capacity/1/", ["abc", 1]),
+    ("/api/events/available/", ["abc", 1]),
+    ("/api/events/search/?q=sample", [None, 1]),
+    ("/api/events/", ["2026-01-01T00:00:00+00:00", "x"]),
+    ("/api/events/", ["2026-01-01T00:00:00+00:00", [1]]),
+])
+def test_malformed_cursor_values_are_rejected(api_client, make_event, url, values):
+    make_event()
+    cursor = pagination.encode_cursor(values)
+    response = api_client.get(url, {"cursor": cursor, "page_size": 2})
+    assert response.status_code == 400
+    assert response.data == {"error": "Invalid cursor"}
@@ -0,0 +1,286 @@
+"""
+Query budgets for every named route in ``api/urls.py``.
+
+Each route is called once, with a cold response cache, against a catalogue
+larger than a page. Every statement it runs is counted, and every SELECT is
+re-run as ``SELECT COUNT(*)`` in the same transaction to find how many rows
+it returned; on SQLite a SELECT whose plan scans a table with nothing to
+stop it early is charged the whole table instead. A request over its query budget usually means an N+1; one over
+its row budget means a view pulled the whole table into Python (as
+``getFullEvents`` once did). When a change legitimately needs more, raise
+the budget in the same change so the reviewer sees it.
+
+Bulk routes get a batch well above one, so their budgets also show the
+query count does not grow with the batch. A new route fails
+``test_every_route_has_a_budget`` until it is added here.
+"""
+
+import re
+from typing import Any, Dict, NamedTuple, Optional
+
+import pytest
+from asgiref.sync import async_to_sync
+from datetime import timedelta
+from django.db import connection
+from django.test import AsyncClient
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+
+from api import urls
+from base import search
+
+pytestmark = pytest.mark.django_db
+
+CATALOGUE_SIZE = 120
+BATCH = 20
+PAGE_SIZE = 20
+# Every event (the catalogue, the target and the batch) and every
+# registration the fixture makes.
+EXPORT_ROWS = (CATALOGUE_SIZE + 1 + BATCH) + (CATALOGUE_SIZE + 3)
+
+
+class Budget(NamedTuple):
+    queries: int
+    rows: int
+    method: str = "get"
+    kwargs: Dict[str, str] = {}
+    params: Any = None
+    role: Optional[str] = "STUDENT"
+    status: int = 200
+    paged: bool = False
+
+
+def listing(queries=1, rows=PAGE_SIZE + 1, **kwargs):
+    # One page, plus the row that tells whether there is a next one. The
+    # ETag comes from the write generation, not a query.
+    return Budget(queries=queries, rows=rows, paged=True, **kwargs)
+
+
+def event_payload(title):
+    now = timezone.now()
+    return {
+        "title": title, "description": "Budget", "creator": "creator@example.com", "eventType": "Workshop",
+        "location": "Campus", "capacity": 30, "hosted_by": "CS Department",
+        "event_start_date": (now + timedelta(days=3)).isoformat(),
+        "event_end_date": (now + timedelta(days=3, hours=2)).isoformat(),
+    }
+
+
+# "target" is an event owned by user 1 with three registrations and a
+# waitlisted student; "batch" is BATCH other events owned by user 1.
+BUDGETS = {
+    # Lists are requested with ?page_size=, the only way to bound them: a
+    # plain request returns the whole matching set by contract.
+    "getEvents": listing(),
+    "getEventByCreatorId": listing(kwargs={"creator_id": 1}),
+    "getEventsByCreator": listing(kwargs={"creator": "creator@example.com"}),
+    "getEventsByType": listing(kwargs={"eventType": "Workshop"}),
+    "getEventsByLocation": listing(kwargs={"location": "Campus"}),
+    "getEventsByHost": listing(kwargs={"hosted_by": "CS"}),
+    "getEventsByCapacity": listing(kwargs={"min_capacity": 1}),
+    "getEventsByDateRange": listing(params="date_range"),
+    "getRecentEvents": listing(kwargs={"days": 30}),
+    "getUpcomingEvents": listing(),
+    "getPastEvents": listing(),
+    "getEventsWithLinks": listing(),
+    "getEventsWithZoomLinks": listing(),
+    "getFullEvents": listing(),
+    "getAvailableEvents": listing(),
+    "getEventsSortedByCreationDate": listing(),
+    "getEventsSortedByUpdateDate": listing(),
+    "getEventsSortedByStartDate": listing(),
+    "getEventsSortedByEndDate": listing(),
+    "getEventsByMultipleFilters": listing(params={"eventType": "Workshop", "availability": "available"}),
+    "getEventsByKeyword": listing(params={"keyword": "sample"}),
+    "searchEvents": listing(params={"q": "sample"}),
+    "getStudentEvents": listing(kwargs={"student_id": 1}),
+    # The duration bound (two buckets), the per-day counts (one row), then
+    # a page of the events overlapping a fixed six-day window.
+    "getCalendar": Budget(queries=3, rows=2 + 1 + PAGE_SIZE + 1, params="calendar_window", paged=True),
+    # Detail views: the event row (or validator) plus its roster.
+    "getEvent": Budget(queries=2, rows=4, kwargs="target"),
+    "getRegisteredStudents": Budget(queries=2, rows=4, kwargs="target"),
+    # Exports stream every event and its roster in chunks by design.
+    "exportEvents": Budget(queries=2, rows=EXPORT_ROWS),
+    "exportEventsNdjson": Budget(queries=2, rows=EXPORT_ROWS),
+    # Aggregates read the statistics table (and the unfolded registration
+    # deltas), never base_event rows.
+    "getEventCount": Budget(queries=1, rows=1),
+    "getEventStats": Budget(queries=6, rows=8),
+    # Writes. Registration changes lock the event row, adjust the counter and
+    # promote the waitlist, then return the fresh event.
+    "createEvent": Budget(queries=2, rows=0, method="post", params=event_payload("Created"), status=201),
+    "updateEvent": Budget(queries=11, rows=8, method="put", kwargs="target", params=event_payload("Updated")),
+    "deleteEvent": Budget(queries=4, rows=5, method="delete", kwargs="target", status=204),
+    "registerStudent": Budget(
+        queries=7, rows=1, method="post", kwargs="target", params={"student_id": 99}, status=202,
+    ),
+    "unregisterStudent": Budget(queries=12, rows=7, method="post", kwargs="target", params={"student_id": 1}),
+    # Batches of BATCH items: the counts must not grow with the batch.
+    "bulkCreateEvents": Budget(
+        queries=3, rows=0, method="post", params=[event_payload(f"Bulk {i}") for i in range(BATCH)], status=201,
+    ),
+    "bulkUpdateEvents": Budget(queries=5, rows=BATCH, method="patch", params="batch_updates"),
+    "bulkDeleteEvents": Budget(queries=6, rows=BATCH * 2, method="delete", params="batch_ids"),
+    "bulkRegisterStudents": Budget(
+        queries=7, rows=2, method="post", kwargs="target", role="STAFF",
+        params={"student_ids": list(range(100, 100 + BATCH))},
+    ),
+    "bulkUnregisterStudents": Budget(
+        queries=11, rows=8, method="post", kwargs="target", role="STAFF", params={"student_ids": [1, 2, 3, 99]},
+    ),
+    # Meta.
+    "apiOverview": Budget(queries=0, rows=0, role=None),
+    "healthCheck": Budget(queries=0, rows=0, role=None),
+    "apiInfo": Budget(queries=0, rows=0, role=None),
+    "welcome": Budget(queries=0, rows=0, role=None),
+    # Async twins.
+    "getEventsAsync": listing(role=None),
+    "getEventAsync": Budget(queries=2, rows=4, kwargs="target", role=None),
+    "getRegisteredStudentsAsync": Budget(queries=2, rows=4, kwargs="target", role=None),
+    "getEventCountAsync": Budget(queries=1, rows=1, role=None),
+    "getUpcomingEventsAsync": listing(role=None),
+    "getPastEventsAsync": listing(role=None),
+    "getEventsByTypeAsync": listing(kwargs={"eventType": "Workshop"}, role=None),
+    "getEventsByMultipleFiltersAsync": listing(
+        params={"eventType": "Workshop", "availability": "available"}, role=None,
+    ),
+    "searchEventsAsync": listing(params={"q": "sample"}, role=None),
+}
+
+
+# A table scan, covering index or not; FTS5 tables are reached through
+# their own index.
+FULL_SCAN = re.compile(r"^SCAN (?!\w+ VIRTUAL TABLE INDEX)(\w+)")
+
+
+class QueryLedger:
+    """
+    ``execute_wrapper`` that records each statement and the rows it read:
+    the rows it returned or, on SQLite, the whole table when its plan scans
+    one without a ``LIMIT`` to stop early. An aggregate over the catalogue
+    returns one row but reads them all.
+    """
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, execute, sql, params, many, context):
+        result = execute(sql, params, many, context)
+        rows = 0
+        if not many and sql.lstrip().upper().startswith("SELECT") and " FOR UPDATE" not in sql:
+            # A separate backend cursor: the caller has yet to fetch from
+            # its own, and this must not pass through the wrappers again.
+            cursor = context["connection"].create_cursor()
+            try:
+                cursor.execute(f"SELECT COUNT(*) FROM ({sql}) budget_rows", params)
+                rows = max(cursor.fetchone()[0], self._scanned(context["connection"], cursor, sql, params))
+            finally:
+                cursor.close()
+        self.statements.append((sql, rows))
+        return result
+
+    @staticmethod
+    def _scanned(connection, cursor, sql, params):
+        if connection.vendor != "sqlite":
+            return 0
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        steps = [row[-1] for row in cursor.fetchall()]
+        # Walking an index in the requested order stops at the LIMIT;
+        # sorting first, or having no LIMIT, reads everything.
+        if " LIMIT " in sql and "USE TEMP B-TREE FOR ORDER BY" not in steps:
+            return 0
+        tables = set(connection.introspection.table_names(cursor))
+        scanned = 0
+        for step in steps:
+            match = FULL_SCAN.match(step)
+            if match and match.group(1) in tables:
+                cursor.execute(f'SELECT COUNT(*) FROM "{match.group(1)}"')
+                scanned += cursor.fetchone()[0]
+        return scanned
+
+    @property
+    def rows(self):
+        return sum(rows for _, rows in self.statements)
+
+    def describe(self):
+        return "\n".join(f"[{rows} rows] {sql}" for sql, rows in self.statements)
+
+
+@pytest.fixture
+def seeded(make_event):
+    now = timezone.now()
+    for i in range(CATALOGUE_SIZE):
+        start = now + timedelta(days=i - CATALOGUE_SIZE // 2)
+        make_event(
+            title=f"Sample {i}", eventType=("Workshop", "Seminar")[i % 2], creator_id=2,
+            capacity=(2, 10)[i % 2], registered_students=[1, 2][: i % 3],
+            link="https://example.com" if i % 2 else "", zoom_link="" if i % 2 else "https://zoom.us/j/1",
+            event_start_date=start, event_end_date=start + timedelta(hours=2),
+        )
+    target = make_event(title="Target", capacity=3, registered_students=[1, 2, 3])
+    target.registrations.create(student_id=4, status="waitlisted")
+    batch = [make_event(title=f"Batch {i}").eventID for i in range(BATCH)]
+    # The search backend is detected once per process; charge that to no
+    # route in particular.
+    search.search_backend(connection.alias)
+    return {"now": now, "target": target.eventID, "batch": batch}
+
+
+def route_names():
+    return [pattern.name for pattern in urls.urlpatterns if isinstance(pattern, URLPattern) and pattern.name]
+
+
+def resolve(budget, seeded):
+    kwargs = {"eventID": seeded["target"]} if budget.kwargs == "target" else budget.kwargs
+    params = budget.params
+    if params == "date_range":
+        params = {
+            "start_date": (seeded["now"] - timedelta(days=10)).isoformat(),
+            "end_date": (seeded["now"] + timedelta(days=10)).isoformat(),
+        }
+    elif params == "calendar_window":
+        # Explicit bounds: a week view would count a different number of
+        # events depending on the weekday the suite runs on.
+        params = {
+            "start": (seeded["now"] - timedelta(days=3)).isoformat(),
+            "end": (seeded["now"] + timedelta(days=3)).isoformat(),
+        }
+    elif params == "batch_ids":
+        params = seeded["batch"]
+    elif params == "batch_updates":
+        params = [{"eventID": event_id, "capacity": 75} for event_id in seeded["batch"]]
+    if budget.paged:
+        params = {**(params or {}), "page_size": PAGE_SIZE}
+    return kwargs, params
+
+
+def test_every_route_has_a_budget():
+    assert sorted(route_names()) == sorted(BUDGETS)
+
+
+@pytest.mark.parametrize("name", sorted(BUDGETS))
+def test_route_stays_within_budget(name, api_client, auth_headers, seeded):
+    budget = BUDGETS[name]
+    kwargs, params = resolve(budget, seeded)
+    url = reverse(name, kwargs=kwargs)
+    headers = auth_headers(role=budget.role) if budget.role else {}
+    ledger = QueryLedger()
+
+    with connection.execute_wrapper(ledger):
+        if name.endswith("Async"):
+            response = async_to_sync(AsyncClient().get)(url, params or {})
+        elif budget.method == "get":
+            response = api_client.get(url, params or {}, **headers)
+        else:
+            response = getattr(api_client, budget.method)(url, params, format="json", **headers)
+        if response.streaming:
+            b"".join(response.streaming_content)
+
+    assert response.status_code == budget.status, getattr(response, "data", response)
+    assert len(ledger.statements) <= budget.queries, (
+        f"{name} ran {len(ledger.statements)} queries (budget {budget.queries}):\n{ledger.describe()}"
+    )
+    assert ledger.rows <= budget.rows, (
+        f"{name} fetched {ledger.rows} rows (budget {budget.rows}):\n{ledger.describe()}"
+    )
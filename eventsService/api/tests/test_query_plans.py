@@ -0,0 +1,158 @@
+"""
+Every list endpoint must be answerable from an index. Each route is called
+on its second page (so the keyset predicate is in play) and every SELECT it
+issues is run through ``EXPLAIN QUERY PLAN``. A table scan fails the test,
+covering index or not, as does a ``LIKE`` filter (checked row by row
+whatever index drives the walk) and sorting the whole match set to serve a
+``LIMIT``ed page (the roster prefetch sorts one page's registrations, which
+is fine).
+"""
+
+import re
+
+import pytest
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(connection.vendor != "sqlite", reason="reads SQLite query plans"),
+]
+
+# Substring matches (``icontains``) cannot use a B-tree index, so these
+# routes scan; full-text search is the indexed way to do that. Strict, so
+# the marker has to go once they stop scanning.
+SUBSTRING_SCAN = pytest.mark.xfail(
+    strict=True, reason="icontains substring match scans base_event; no B-tree index can serve it",
+)
+# Relevance order only exists once the matches are found, so ranked search
+# sorts its (index-selected) matches; it still must not scan.
+RANKED_ROUTES = {"getEventsByKeyword", "searchEvents"}
+# A student's events are found through the registration index and then put
+# in start-date order; that sort covers one student's registrations only.
+STUDENT_ROUTES = {"getStudentEvents"}
+
+LIST_ROUTES = [
+    ("getEvents", {}, {}),
+    ("getEventByCreatorId", {"creator_id": 1}, {}),
+    ("getEventsByCreator", {"creator": "creator@example.com"}, {}),
+    ("getEventsByType", {"eventType": "Workshop"}, {}),
+    ("getEventsByDateRange", {}, "date_range"),
+    ("getUpcomingEvents", {}, {}),
+    ("getPastEvents", {}, {}),
+    pytest.param("getEventsByLocation", {"location": "Campus"}, {}, marks=SUBSTRING_SCAN),
+    ("getEventsByCapacity", {"min_capacity": 1}, {}),
+    ("getRecentEvents", {"days": 30}, {}),
+    pytest.param("getEventsByHost", {"hosted_by": "CS"}, {}, marks=SUBSTRING_SCAN),
+    ("getEventsWithLinks", {}, {}),
+    ("getEventsWithZoomLinks", {}, {}),
+    ("getEventsByKeyword", {}, {"keyword": "sample"}),
+    ("searchEvents", {}, {"q": "sample"}),
+    ("getFullEvents", {}, {}),
+    ("getAvailableEvents", {}, {}),
+    ("getEventsSortedByCreationDate", {}, {}),
+    ("getEventsSortedByUpdateDate", {}, {}),
+    ("getEventsSortedByStartDate", {}, {}),
+    ("getEventsSortedByEndDate", {}, {}),
+    ("getEventsByMultipleFilters", {}, {"creator": "creator@example.com"}),
+    ("getStudentEvents", {"student_id": 1}, {}),
+]
+
+# Combinations on the unified query endpoint (api/filters.py).
+QUERY_CASES = {
+    "type_by_start": {"eventType": "Workshop", "sort": "event_start_date"},
+    "upcoming_by_start": {"when": "upcoming", "sort": "event_start_date"},
+    "ending_soonest_first": {"end_before": "date_range_end", "sort": "-event_end_date"},
+    "available_by_seats": {"availability": "available", "sort": "seats_left"},
+    "capacity_range": {"min_capacity": 1, "max_capacity": 10, "sort": "capacity"},
+    "creator_newest": {"creator_id": 1, "sort": "-created_at"},
+    "with_links": {"has_link": "true"},
+}
+
+# Any scan of a table, with or without a covering index, reads every row.
+# FTS5 tables are reached through their own index ("VIRTUAL TABLE INDEX").
+FULL_SCAN = re.compile(r"^SCAN (?!\w+ VIRTUAL TABLE INDEX)\w+")
+# A substring match is checked row by row, whatever index drives the walk.
+SUBSTRING_FILTER = re.compile(r"\bLIKE\b")
+
+
+def query_plan(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def plan_problems(sql, allow_sort=False):
+    problems = []
+    if SUBSTRING_FILTER.search(sql):
+        problems.append("LIKE filter: no index can serve a substring match")
+    for step in query_plan(sql):
+        if FULL_SCAN.match(step):
+            problems.append(step)
+        elif step == "USE TEMP B-TREE FOR ORDER BY" and " LIMIT " in sql and not allow_sort:
+            problems.append(step)
+    return problems
+
+
+@pytest.fixture
+def catalogue(make_event):
+    now = timezone.now()
+    for i in range(6):
+        start = now + timedelta(days=i - 3)
+        make_event(
+            title=f"Sample {i}",
+            capacity=2,
+            registered_students=[1, 2][: i % 3],
+            link="https://example.com" if i % 2 else "",
+            zoom_link="https://zoom.us/j/1" if i % 2 == 0 else "",
+            event_start_date=start,
+            event_end_date=start + timedelta(hours=2),
+        )
+    return now
+
+
+def second_page_plan_problems(api_client, auth_headers, url, params, allow_sort=False):
+    first = api_client.get(url, {**params, "page_size": 1}, **auth_headers())
+    assert first.status_code == 200, first.data
+    cursor = first.data["next_cursor"]
+    assert cursor, f"{url} {params} should have more than one page"
+
+    with CaptureQueriesContext(connection) as ctx:
+        second = api_client.get(url, {**params, "page_size": 1, "cursor": cursor}, **auth_headers())
+    assert second.status_code == 200
+
+    selects = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+    assert selects
+    failures = {sql: plan_problems(sql, allow_sort=allow_sort) for sql in selects}
+    return {sql: steps for sql, steps in failures.items() if steps}
+
+
+def describe(failures):
+    return "\n\n".join(f"{sql}\n  -> {steps}" for sql, steps in failures.items())
+
+
+@pytest.mark.parametrize(
+    "name,kwargs,params", LIST_ROUTES, ids=[getattr(route, "values", route)[0] for route in LIST_ROUTES],
+)
+def test_list_route_uses_indexes(api_client, auth_headers, catalogue, name, kwargs, params):
+    if params == "date_range":
+        params = {
+            "start_date": (catalogue - timedelta(days=10)).isoformat(),
+            "end_date": (catalogue + timedelta(days=10)).isoformat(),
+        }
+    url = reverse(name, kwargs=kwargs)
+    failures = second_page_plan_problems(api_client, auth_headers, url, params, allow_sort=name in RANKED_ROUTES | STUDENT_ROUTES)
+    assert not failures, describe(failures)
+
+
+@pytest.mark.parametrize("params", QUERY_CASES.values(), ids=list(QUERY_CASES))
+def test_unified_query_uses_indexes(api_client, auth_headers, catalogue, params):
+    params = {
+        key: (catalogue + timedelta(days=10)).isoformat() if value == "date_range_end" else value
+        for key, value in params.items()
+    }
+    failures = second_page_plan_problems(api_client, auth_headers, reverse("getEventsByMultipleFilters"), params)
+    assert not failures, describe(failures)
@@ -0,0 +1,151 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from base.models import Event, Registration
+
+pytestmark = pytest.mark.django_db
+
+
+def register(api_client, auth_headers, event, student_id, action="register"):
+    return api_client.post(
+        f"/api/events/{event.eventID}/{action}/",
+        data={"student_id": student_id},
+        format="json",
+        **auth_headers(role="STUDENT"),
+    )
+
+
+def test_duplicate_registration_is_rejected(api_client, make_event, auth_headers):
+    event = make_event(registered_students=[5])
+
+    response = register(api_client, auth_headers, event, 5)
+    assert response.status_code == 400
+    assert Registration.objects.filter(event=event, student_id=5).count() == 1
+
+
+def test_student_id_must_be_an_integer(api_client, make_event, auth_headers):
+    event = make_event()
+    response = register(api_client, auth_headers, event, "abc")
+    assert response.status_code == 400
+    assert not Registration.objects.exists()
+
+
+def test_roster_keeps_registration_order(api_client, make_event, auth_headers):
+    event = make_event()
+    for student_id in (9, 3, 7):
+        assert register(api_client, auth_headers, event, student_id).status_code == 200
+
+    response = api_client.get(f"/api/events/{event.eventID}/registered_students/")
+    assert response.data["registered_students"] == [9, 3, 7]
+    assert api_client.get(f"/api/events/{event.eventID}/").data["registered_students"] == [9, 3, 7]
+
+
+def test_registrations_are_removed_with_event(make_event):
+    event = make_event(registered_students=[1, 2])
+    event.delete()
+    assert not Registration.objects.exists()
+
+
+def test_full_event_waitlists_and_promotes_on_unregister(api_client, make_event, auth_headers):
+    event = make_event(capacity=1)
+    assert register(api_client, auth_headers, event, 1).status_code == 200
+
+    waitlisted = register(api_client, auth_headers, event, 2)
+    assert waitlisted.status_code == 202
+    assert waitlisted.data["status"] == "waitlisted"
+    assert waitlisted.data["waitlist_position"] == 1
+    assert register(api_client, auth_headers, event, 3).data["waitlist_position"] == 2
+
+    event.refresh_from_db()
+    assert event.registered_students == [1]
+    assert event.registered_count == 1
+
+    response = register(api_client, auth_headers, event, 1, action="unregister")
+    assert response.status_code == 200
+    assert response.data["registered_students"] == [2]
+    assert response.data["registered_count"] == 1
+
+
+def test_leaving_the_waitlist_keeps_the_seat_count(api_client, make_event, auth_headers):
+    event = make_event(capacity=1, registered_students=[1])
+    register(api_client, auth_headers, event, 2)
+
+    assert register(api_client, auth_headers, event, 2, action="unregister").status_code == 200
+    event.refresh_from_db()
+    assert event.registered_count == 1
+    assert not Registration.objects.filter(status=Registration.WAITLISTED).exists()
+
+
+def test_free_seats_do_not_jump_the_waitlist(api_client, make_event, auth_headers):
+    event = make_event(capacity=1, registered_students=[1])
+    register(api_client, auth_headers, event, 2)
+    # A seat freed without promoting anyone, e.g. a capacity change in the admin.
+    Event.objects.filter(pk=event.pk).update(capacity=2)
+
+    response = register(api_client, auth_headers, event, 3)
+    assert response.status_code == 202
+    assert response.data["waitlist_position"] == 2
+    event.refresh_from_db()
+    assert event.registered_students == [1]
+    assert event.registered_count == 1
+
+
+def test_capacity_increase_promotes_waitlist(api_client, make_event, auth_headers):
+    event = make_event(creator_id=1, capacity=1, registered_students=[1])
+    register(api_client, auth_headers, event, 2)
+    register(api_client, auth_headers, event, 3)
+
+    payload = {
+        "title": event.title,
+        "description": event.description,
+        "creator": event.creator,
+        "eventType": event.eventType,
+        "location": event.location,
+        "capacity": 2,
+        "hosted_by": event.hosted_by,
+        "event_start_date": event.event_start_date.isoformat(),
+        "event_end_date": event.event_end_date.isoformat(),
+    }
+    response = api_client.put(
+        f"/api/events/{event.eventID}/update/", data=payload, format="json", **auth_headers(user_id=1)
+    )
+    assert response.status_code == 200
+    assert response.data["registered_students"] == [1, 2]
+    assert response.data["registered_count"] == 2
+
+
+def test_register_unknown_event(api_client, auth_headers):
+    response = api_client.post(
+        "/api/events/999/register/", data={"student_id": 1}, format="json", **auth_headers()
+    )
+    assert response.status_code == 404
+
+
+def test_full_and_available_follow_registrations(api_client, make_event, auth_headers):
+    event = make_event(title="Tight", capacity=1)
+    assert {e["title"] for e in api_client.get("/api/events/available/").data} == {"Tight"}
+
+    register(api_client, auth_headers, event, 1)
+    assert {e["title"] for e in api_client.get("/api/events/full/").data} == {"Tight"}
+    assert api_client.get("/api/events/available/").data == []
+
+    register(api_client, auth_headers, event, 1, action="unregister")
+    assert api_client.get("/api/events/full/").data == []
+
+
+def test_full_events_filter_uses_seats_left_index(api_client, make_event):
+    for capacity in (1, 2, 3):
+        make_event(capacity=capacity, registered_students=[7])
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get("/api/events/full/", {"page_size": 10})
+    assert len(response.data["results"]) == 1
+
+    event_query = next(q["sql"] for q in ctx.captured_queries if "LIMIT" in q["sql"])
+    assert "LIMIT 11" in event_query
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {event_query}")
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+        assert "event_seats_left_idx" in plan
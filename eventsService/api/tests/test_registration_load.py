@@ -0,0 +1,93 @@
+"""
+Burst test for registration: fire many registrations at one event in
+parallel and check that the roster, the waitlist and ``registered_count``
+all agree afterwards.
+"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.db import connection
+from django.utils import timezone
+
+from base import registration
+from base.models import Event, Registration
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+CAPACITY = 10
+STUDENTS = 60
+WORKERS = 16
+
+
+def _in_thread(fn, *args):
+    try:
+        return fn(*args)
+    finally:
+        connection.close()
+
+
+def _make_event(capacity):
+    now = timezone.now()
+    return Event.objects.create(
+        title="Burst",
+        description="",
+        creator="load@example.com",
+        eventType="Workshop",
+        location="Campus",
+        capacity=capacity,
+        hosted_by="CS Department",
+        event_start_date=now + timedelta(days=1),
+        event_end_date=now + timedelta(days=2),
+    )
+
+
+def _assert_consistent(event):
+    event.refresh_from_db()
+    seated = Registration.objects.filter(event=event, status=Registration.REGISTERED).count()
+    assert seated == event.registered_count
+    assert seated <= event.capacity
+    return seated
+
+
+def test_parallel_registrations_never_oversubscribe():
+    event = _make_event(CAPACITY)
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = list(pool.map(lambda sid: _in_thread(registration.register, event.eventID, sid), range(STUDENTS)))
+
+    statuses = [r.status for r in results]
+    assert statuses.count(Registration.REGISTERED) == CAPACITY
+    assert statuses.count(Registration.WAITLISTED) == STUDENTS - CAPACITY
+    assert Registration.objects.filter(event=event).count() == STUDENTS
+    assert _assert_consistent(event) == CAPACITY
+
+
+def test_parallel_duplicate_registrations_keep_one_row():
+    event = _make_event(CAPACITY)
+
+    def attempt(_):
+        try:
+            return _in_thread(registration.register, event.eventID, 42)
+        except registration.AlreadyRegistered:
+            return None
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = list(pool.map(attempt, range(WORKERS)))
+
+    assert sum(r is not None for r in results) == 1
+    assert _assert_consistent(event) == 1
+
+
+def test_parallel_unregistrations_promote_without_lost_updates():
+    event = _make_event(CAPACITY)
+    for sid in range(STUDENTS):
+        registration.register(event.eventID, sid)
+
+    leaving = range(CAPACITY)
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        list(pool.map(lambda sid: _in_thread(registration.unregister, event.eventID, sid), leaving))
+
+    assert _assert_consistent(event) == CAPACITY
+    promoted = Registration.objects.filter(event=event, status=Registration.REGISTERED)
+    assert sorted(promoted.values_list("student_id", flat=True)) == list(range(CAPACITY, 2 * CAPACITY))
@@ -0,0 +1,74 @@
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from api import renderers
+from api.renderers import FastJSONParser, FastJSONRenderer
+
+SAMPLES = [
+    {"eventID": 1, "title": "Ünïcödé — “quotes” \u2028\u2029 </script>", "link": None, "capacity": 0},
+    {"event_start_date": datetime(2030, 3, 10, 6, 30, 15, 123456, tzinfo=dt_timezone.utc)},
+    {"event_end_date": datetime(2030, 3, 10, 9, 0, tzinfo=ZoneInfo("America/New_York"))},
+    {"naive": datetime(2030, 1, 1, 12, 0), "day": date(2030, 1, 1), "span": timedelta(hours=2)},
+    {"price": Decimal("12.50"), "token": uuid.UUID(int=7), "lazy": gettext_lazy("Event not found")},
+    {1: "int key", "nested": [{"a": [1, 2.5, True, False, None]}]},
+    {"huge": 2**70},
+    ReturnList([ReturnDict({"title": "serializer output"}, serializer=None)], serializer=None),
+    [],
+    "plain string",
+]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(renderers, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("data", SAMPLES, ids=range(len(SAMPLES)))
+def test_renderer_output_matches_drf(backend, data):
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_indent_is_honoured(backend):
+    data = {"a": [1, 2]}
+    media_type = "application/json; indent=4"
+    assert FastJSONRenderer().render(data, media_type) == JSONRenderer().render(data, media_type)
+
+
+def test_none_renders_empty_body(backend):
+    assert FastJSONRenderer().render(None) == b""
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b'{"student_id": 5, "title": "\\u00e9t\\u00e9"}', b"[1, 2.5, null]", b'"\\ud800"', "{\"t\": \"ü\"}".encode()],
+)
+def test_parser_matches_drf(backend, body):
+    assert FastJSONParser().parse(BytesIO(body)) == JSONParser().parse(BytesIO(body))
+
+
+@pytest.mark.parametrize("body", [b"{bad json", b"", b'{"n": NaN}'])
+def test_parser_rejects_what_drf_rejects(backend, body):
+    with pytest.raises(ParseError):
+        FastJSONParser().parse(BytesIO(body))
+
+
+@pytest.mark.django_db
+def test_api_uses_the_fast_renderer(api_client, make_event):
+    make_event(title="Rendered")
+    response = api_client.get("/api/events/")
+    assert isinstance(response.accepted_renderer, FastJSONRenderer)
+    assert response.content == JSONRenderer().render(response.data)
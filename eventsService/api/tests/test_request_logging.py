@@ -0,0 +1,109 @@
+import io
+import json
+import logging
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.functional import SimpleLazyObject
+
+from api.middleware import RequestLogMiddleware
+from eventsService.log import JSONFormatter, QueueStreamHandler
+
+pytestmark = pytest.mark.django_db
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def request_log():
+    handler = ListHandler()
+    logger = logging.getLogger("api.requests")
+    logger.addHandler(handler)
+    yield handler
+    logger.removeHandler(handler)
+
+
+def test_request_record_has_structured_fields(api_client, auth_headers, request_log):
+    api_client.get("/api/events/count/", **auth_headers(role="STAFF"))
+
+    (record,) = request_log.records
+    assert record.levelno == logging.INFO
+    assert (record.method, record.route, record.status, record.role) == ("GET", "getEventCount", 200, "STAFF")
+    assert record.path == "/api/events/count/"
+    assert record.latency_ms >= 0
+    assert record.sample_rate == 1.0
+
+
+def test_errors_are_logged_at_warning(api_client, request_log):
+    api_client.get("/api/events/999/")
+    (record,) = request_log.records
+    assert (record.levelno, record.status, record.role) == (logging.WARNING, 404, None)
+
+
+def test_sampling_skips_only_successful_requests(api_client, settings, request_log):
+    settings.EVENTS_API = {**settings.EVENTS_API, "REQUEST_LOG_SAMPLE_RATES": {"getEvent": 0.0, "getEvents": 0.0}}
+    api_client.get("/api/events/")
+    assert request_log.records == []
+
+    api_client.get("/api/events/999/")
+    assert [r.status for r in request_log.records] == [404]
+
+
+def test_lazy_session_user_is_not_resolved(request_log):
+    lookups = []
+    request = RequestFactory().get("/metrics")
+    request.user = SimpleLazyObject(lambda: lookups.append("user"))
+    RequestLogMiddleware(lambda r: HttpResponse()).log(request, HttpResponse(), 1.0)
+
+    (record,) = request_log.records
+    assert record.role is None
+    assert lookups == []
+
+
+def test_views_no_longer_print(api_client, auth_headers, make_event, capsys):
+    event = make_event(creator_id=3)
+    api_client.get("/api/events/3/creator_id/", **auth_headers(user_id=3))
+    api_client.delete(f"/api/events/{event.eventID}/delete/", **auth_headers(user_id=3))
+    assert capsys.readouterr().out == ""
+
+
+def test_json_formatter_includes_extra_fields():
+    record = logging.LogRecord("api.requests", logging.INFO, __file__, 1, "GET %s", ("getEvents",), None)
+    record.status = 200
+    entry = json.loads(JSONFormatter().format(record))
+    assert entry["message"] == "GET getEvents"
+    assert entry["status"] == 200
+    assert entry["level"] == "INFO"
+
+
+def test_queue_handler_writes_in_the_background():
+    stream = io.StringIO()
+    handler = QueueStreamHandler(stream)
+    handler.setFormatter(JSONFormatter())
+    logger = logging.Logger("queue-test")
+    logger.addHandler(handler)
+    for i in range(3):
+        logger.warning("line %s", i)
+    handler.close()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == ["line 0", "line 1", "line 2"]
+
+
+def test_queue_handler_drops_instead_of_blocking():
+    handler = QueueStreamHandler(io.StringIO(), maxsize=1)
+    handler.listener.stop()  # nothing drains the queue now
+    logger = logging.Logger("queue-test")
+    logger.addHandler(handler)
+    for i in range(3):
+        logger.warning("line %s", i)
+    assert handler.dropped == 2
+    handler.close()
@@ -0,0 +1,70 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from base.models import Event
+
+pytestmark = pytest.mark.django_db
+
+
+def titles(response):
+    return sorted(e["title"] for e in response.data)
+
+
+def test_repeat_request_is_served_from_cache(api_client, make_event):
+    make_event(title="Cached")
+    first = api_client.get("/api/events/")
+
+    with CaptureQueriesContext(connection) as ctx:
+        second = api_client.get("/api/events/")
+    assert len(ctx.captured_queries) == 0
+    assert second.data == first.data
+
+    health = api_client.get("/api/health/")
+    assert health.data["cache"] == {"hits": 1, "misses": 1}
+
+
+def test_query_param_order_shares_an_entry(api_client, make_event):
+    make_event(creator="alice", eventType="Seminar")
+    api_client.get("/api/events/filters/?creator=alice&eventType=Seminar")
+    with CaptureQueriesContext(connection) as ctx:
+        api_client.get("/api/events/filters/?eventType=Seminar&creator=alice")
+    assert len(ctx.captured_queries) == 0
+
+
+def test_errors_are_not_cached(api_client):
+    assert api_client.get("/api/events/by_keyword/").status_code == 400
+    assert api_client.get("/api/events/by_keyword/").status_code == 400
+    assert api_client.get("/api/health/").data["cache"]["hits"] == 0
+
+
+def test_mutations_invalidate(api_client, make_event, auth_headers):
+    event = make_event(title="One", creator_id=3, capacity=5)
+    assert titles(api_client.get("/api/events/")) == ["One"]
+    assert api_client.get("/api/events/count/").data["event_count"] == 1
+
+    make_event(title="Two")
+    assert titles(api_client.get("/api/events/")) == ["One", "Two"]
+    assert api_client.get("/api/events/count/").data["event_count"] == 2
+
+    api_client.post(
+        f"/api/events/{event.eventID}/register/", data={"student_id": 8}, format="json", **auth_headers()
+    )
+    roster = api_client.get(f"/api/events/{event.eventID}/registered_students/")
+    assert roster.data["registered_students"] == [8]
+
+    api_client.post(
+        f"/api/events/{event.eventID}/unregister/", data={"student_id": 8}, format="json", **auth_headers()
+    )
+    roster = api_client.get(f"/api/events/{event.eventID}/registered_students/")
+    assert roster.data["registered_students"] == []
+
+    api_client.delete(f"/api/events/{event.eventID}/delete/", **auth_headers(user_id=3))
+    assert titles(api_client.get("/api/events/")) == ["Two"]
+    assert not Event.objects.filter(pk=event.pk).exists()
+
+
+def test_permission_checks_still_run_on_cached_routes(api_client, make_event, auth_headers):
+    make_event(creator_id=7)
+    assert api_client.get("/api/events/7/creator_id/", **auth_headers(user_id=7)).status_code == 200
+    assert api_client.get("/api/events/7/creator_id/", **auth_headers(role="GUEST")).status_code == 403
@@ -0,0 +1,74 @@
+import pytest
+from django.db import connection
+
+from base.models import Event
+from base.search import search_backend
+
+pytestmark = pytest.mark.django_db
+
+requires_fts = pytest.mark.skipif(
+    connection.vendor != "sqlite", reason="exercises the SQLite FTS5 index"
+)
+
+
+def search(api_client, q, **params):
+    response = api_client.get("/api/events/search/", {"q": q, **params})
+    assert response.status_code == 200
+    return response
+
+
+@requires_fts
+def test_fts_backend_is_installed():
+    assert search_backend() == "fts5"
+
+
+def test_prefix_matching_for_type_ahead(api_client, make_event):
+    make_event(title="Robotics Club Meetup", description="Build robots")
+    make_event(title="Cooking Night", description="Food")
+
+    assert [e["title"] for e in search(api_client, "rob").data] == ["Robotics Club Meetup"]
+    assert [e["title"] for e in search(api_client, "robotics me").data] == ["Robotics Club Meetup"]
+    assert search(api_client, "robotics cooking").data == []
+
+
+@requires_fts
+def test_title_matches_rank_above_description_matches(api_client, make_event):
+    make_event(title="Career Fair", description="Meet employers")
+    make_event(title="Networking Lunch", description="Bring questions for the robotics career panel")
+    make_event(title="Robotics Showcase", description="Demos")
+
+    titles = [e["title"] for e in search(api_client, "robotics").data]
+    assert titles == ["Robotics Showcase", "Networking Lunch"]
+
+
+@requires_fts
+def test_index_follows_updates_and_deletes(api_client, make_event):
+    event = make_event(title="Chess Club")
+    Event.objects.filter(pk=event.pk).update(title="Go Club")
+    assert search(api_client, "chess").data == []
+    assert len(search(api_client, "go").data) == 1
+
+    event.delete()
+    assert search(api_client, "go").data == []
+
+
+def test_ranked_results_paginate(api_client, make_event):
+    for i in range(5):
+        make_event(title=f"Hackathon {i}", description="hackathon " * i)
+
+    seen, cursor = [], None
+    while True:
+        params = {"page_size": 2, **({"cursor": cursor} if cursor else {})}
+        page = search(api_client, "hack", **params).data
+        seen.extend(e["eventID"] for e in page["results"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert sorted(seen) == sorted(Event.objects.values_list("eventID", flat=True))
+    assert len(seen) == len(set(seen))
+
+
+def test_empty_query_lists_everything(api_client, make_event):
+    make_event()
+    make_event()
+    assert len(search(api_client, "").data) == 2
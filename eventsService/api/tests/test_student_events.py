@@ -0,0 +1,81 @@
+import pytest
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from base.models import Registration
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def schedule(make_event):
+    now = timezone.now()
+    later = make_event(title="Later", registered_students=[7], event_start_date=now + timedelta(days=9),
+                       event_end_date=now + timedelta(days=10))
+    sooner = make_event(title="Sooner", registered_students=[7, 8], event_start_date=now + timedelta(days=1),
+                        event_end_date=now + timedelta(days=2))
+    make_event(title="Other", registered_students=[8])
+    waiting = make_event(title="Waiting", capacity=1, registered_students=[8])
+    Registration.objects.create(event=waiting, student_id=7, status=Registration.WAITLISTED)
+    return later, sooner
+
+
+def titles(response):
+    assert response.status_code == 200, response.data
+    return [row["title"] for row in response.data]
+
+
+def test_lists_a_students_events_by_start_date(api_client, auth_headers, schedule):
+    response = api_client.get("/api/students/7/events/", **auth_headers(user_id=7))
+    assert titles(response) == ["Sooner", "Later"]
+
+
+@pytest.mark.parametrize("role", ["STAFF", "ADMIN"])
+def test_staff_can_read_any_student(api_client, auth_headers, schedule, role):
+    response = api_client.get("/api/students/7/events/", **auth_headers(role=role, user_id=1))
+    assert titles(response) == ["Sooner", "Later"]
+
+
+def test_students_cannot_read_each_other(api_client, auth_headers, schedule):
+    response = api_client.get("/api/students/7/events/", **auth_headers(user_id=8))
+    assert response.status_code == 403
+    assert api_client.get("/api/students/7/events/").status_code == 403
+
+
+def test_status_selects_roster_or_waitlist(api_client, auth_headers, schedule):
+    url = "/api/students/7/events/"
+    assert titles(api_client.get(url, {"status": "waitlisted"}, **auth_headers(user_id=7))) == ["Waiting"]
+    assert set(titles(api_client.get(url, {"status": "all"}, **auth_headers(user_id=7)))) == {"Sooner", "Later", "Waiting"}
+    assert api_client.get(url, {"status": "maybe"}, **auth_headers(user_id=7)).status_code == 400
+
+
+def test_pages_and_unknown_students(api_client, auth_headers, schedule):
+    first = api_client.get("/api/students/7/events/", {"page_size": 1}, **auth_headers(user_id=7))
+    assert [row["title"] for row in first.data["results"]] == ["Sooner"]
+    second = api_client.get(
+        "/api/students/7/events/", {"page_size": 1, "cursor": first.data["next_cursor"]}, **auth_headers(user_id=7)
+    )
+    assert [row["title"] for row in second.data["results"]] == ["Later"]
+    assert titles(api_client.get("/api/students/99/events/", **auth_headers(role="STAFF"))) == []
+
+
+def test_registration_changes_show_up(api_client, auth_headers, schedule):
+    later, _ = schedule
+    url = "/api/students/7/events/"
+    assert titles(api_client.get(url, **auth_headers(user_id=7))) == ["Sooner", "Later"]
+    api_client.post(f"/api/events/{later.eventID}/unregister/", {"student_id": 7}, format="json", **auth_headers())
+    assert titles(api_client.get(url, **auth_headers(user_id=7))) == ["Sooner"]
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="reads SQLite query plans")
+def test_lookup_starts_from_the_student_index(api_client, auth_headers, schedule):
+    with CaptureQueriesContext(connection) as ctx:
+        api_client.get("/api/students/7/events/", **auth_headers(user_id=7))
+    query = next(q["sql"] for q in ctx.captured_queries if "ORDER BY" in q["sql"])
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {query}")
+        plan = [row[-1] for row in cursor.fetchall()]
+    assert any("registration_student_idx" in step for step in plan), plan
+    assert not any(step.startswith("SCAN") for step in plan), plan
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import async_views, views
 urlpatterns = [
     path('events/', views.getEvents, name='getEvents'),
     path('events/<int:eventID>/', views.getEvent, name='getEvent'),
@@ -7,8 +7,13 @@ urlpatterns = [
     path('events/create/', views.createEvent, name='createEvent'),
     path('events/<int:eventID>/update/', views.updateEvent, name='updateEvent'),
     path('events/<int:eventID>/delete/', views.deleteEvent, name='deleteEvent'),
+    path('events/bulk/create/', views.bulkCreateEvents, name='bulkCreateEvents'),
+    path('events/bulk/update/', views.bulkUpdateEvents, name='bulkUpdateEvents'),
+    path('events/bulk/delete/', views.bulkDeleteEvents, name='bulkDeleteEvents'),
     path('events/<int:eventID>/register/', views.registerStudent, name='registerStudent'),
     path('events/<int:eventID>/unregister/', views.unregisterStudent, name='unregisterStudent'),
+    path('events/<int:eventID>/register/bulk/', views.bulkRegisterStudents, name='bulkRegisterStudents'),
+    path('events/<int:eventID>/unregister/bulk/', views.bulkUnregisterStudents, name='bulkUnregisterStudents'),
     path('events/<int:eventID>/registered_students/', views.getRegisteredStudents, name='getRegisteredStudents'),
     path('events/full/', views.getFullEvents, name='getFullEvents'),
     path('events/available/', views.getAvailableEvents, name='getAvailableEvents'),
@@ -16,9 +21,13 @@ urlpatterns = [
     path('events/sorted_by_update_date/', views.getEventsSortedByUpdateDate, name='getEventsSortedByUpdateDate'),
     path('events/sorted_by_start_date/', views.getEventsSortedByStartDate, name='getEventsSortedByStartDate'),
     path('events/sorted_by_end_date/', views.getEventsSortedByEndDate, name='getEventsSortedByEndDate'),
+    path('students/<int:student_id>/events/', views.getStudentEvents, name='getStudentEvents'),
     path('events/filters/', views.getEventsByMultipleFilters, name='getEventsByMultipleFilters'),
+    path('events/export/', views.exportEvents, name='exportEvents'),
+    path('events/export/ndjson/', views.exportEventsNdjson, name='exportEventsNdjson'),
     path('', views.apiOverview, name='apiOverview'),
     path('events/count/', views.getEventCount, name='getEventCount'),
+    path('events/stats/', views.getEventStats, name='getEventStats'),
     path('events/upcoming/', views.getUpcomingEvents, name='getUpcomingEvents'),
     path('events/past/', views.getPastEvents, name='getPastEvents'),
     path('events/search/', views.searchEvents, name='searchEvents'),
@@ -27,6 +36,7 @@ urlpatterns = [
     path('events/by_location/<str:location>/', views.getEventsByLocation, name='getEventsByLocation'),
     path('events/by_creator/<str:creator>/', views.getEventsByCreator, name='getEventsByCreator'),
     path('events/by_date_range/', views.getEventsByDateRange, name='getEventsByDateRange'),
+    path('events/calendar/', views.getCalendar, name='getCalendar'),
     path('events/by_capacity/<int:min_capacity>/', views.getEventsByCapacity, name='getEventsByCapacity'),
     path('events/recent/<int:days>/', views.getRecentEvents, name='getRecentEvents'),
     path('events/with_links/', views.getEventsWithLinks, name='getEventsWithLinks'),
@@ -35,4 +45,14 @@ urlpatterns = [
     path('health/', views.healthCheck, name='healthCheck'),
     path('info/', views.apiInfo, name='apiInfo'),
     path('welcome/', views.welcome, name='welcome'),
+    # ASGI-native read endpoints (see api/async_views.py).
+    path('async/events/', async_views.getEvents, name='getEventsAsync'),
+    path('async/events/<int:eventID>/', async_views.getEvent, name='getEventAsync'),
+    path('async/events/<int:eventID>/registered_students/', async_views.getRegisteredStudents, name='getRegisteredStudentsAsync'),
+    path('async/events/count/', async_views.getEventCount, name='getEventCountAsync'),
+    path('async/events/upcoming/', async_views.getUpcomingEvents, name='getUpcomingEventsAsync'),
+    path('async/events/past/', async_views.getPastEvents, name='getPastEventsAsync'),
+    path('async/events/by_type/<str:eventType>/', async_views.getEventsByType, name='getEventsByTypeAsync'),
+    path('async/events/filters/', async_views.getEventsByMultipleFilters, name='getEventsByMultipleFiltersAsync'),
+    path('async/events/search/', async_views.searchEvents, name='searchEventsAsync'),
 ]
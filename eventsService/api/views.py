@@ -1,22 +1,117 @@
+import logging
+
 from rest_framework.response import Response
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, parser_classes, permission_classes
 from rest_framework import permissions, status
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.exceptions import PermissionDenied
-from django.db import models
-from base.models import Event
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.views.decorators.http import require_safe
+from base import registration, stats
+from base.models import Event, Registration
+from base.search import search_events
 from .serializers import EventSerializer
-from .permissions import IsAdmin, IsStudent, IsStaff, IsOwnerOrAdmin
+from .permissions import IsAdmin, IsStudent, IsStaff, IsOwnerOrAdmin, IsSelfOrStaff
+from . import bulk, conditional, export, fastpath, fieldsets, filters, metrics, pagination, rosters, windows
+from .cache import cache_stats, cached_response
+from .renderers import CSVParser, FastJSONParser, NDJSONParser
+
+
+logger = logging.getLogger(__name__)
+
+def _student_id(request):
+    student_id = request.data.get('student_id')
+    if not student_id:
+        return None, Response({'error': 'Student ID is required'}, status=400)
+    try:
+        return int(student_id), None
+    except (TypeError, ValueError):
+        return None, Response({'error': 'Student ID must be an integer'}, status=400)
+
+
+def _student_ids(request):
+    try:
+        return rosters.student_ids(request), None
+    except rosters.RosterError as exc:
+        return None, Response({'error': str(exc)}, status=400)
+
+
+def _bulk_items(request):
+    try:
+        return bulk.items(request.data), None
+    except bulk.BulkError as exc:
+        return None, Response({'error': str(exc)}, status=400)
+
+
+def _bulk_response(request, action, results, success):
+    data, status_code = bulk.summary(results, success)
+    logger.info('Bulk %s %s events', action, data['succeeded'], extra={'user_id': request.user.id})
+    return Response(data, status=status_code)
+
+
+def _list_response(request, events, *ordering):
+    # Plain requests keep returning a bare list; ``?page_size=``/``?cursor=``
+    # switch to keyset pagination on ``ordering`` plus ``eventID``.
+    ordering = ordering or (pagination.TIEBREAKER,)
+    try:
+        fields = fieldsets.requested(request)
+    except fieldsets.FieldsetError as exc:
+        return Response({'error': str(exc)}, status=400)
+
+    etag, last_modified = conditional.list_validators(request)
+    not_modified = conditional.not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    # Lists skip the serializer: see api.fastpath for the equivalent output.
+    rows = fastpath.event_rows(events, fields, ordering)
+    if not pagination.is_requested(request):
+        data = fastpath.represent(rows.order_by(*pagination.order_by(ordering)), fields)
+        return conditional.set_validators(Response(data), etag, last_modified)
+
+    try:
+        page_size = pagination.get_page_size(request)
+        rows, next_cursor = pagination.paginate(
+            rows, ordering, page_size, request.query_params.get('cursor')
+        )
+    except pagination.PaginationError as exc:
+        return Response({'error': str(exc)}, status=400)
+
+    results = fastpath.represent(rows, fields)
+    response = Response({'results': results, 'next_cursor': next_cursor, 'page_size': page_size})
+    return conditional.set_validators(response, etag, last_modified)
+
+
+def _export(request, stream, content_type):
+    # The whole catalogue by default; ?fields=/?exclude= narrow it as usual.
+    try:
+        fields = fieldsets.requested(request, default=fieldsets.ALL_FIELDS)
+        events, _ = filters.build(request.query_params)
+    except (fieldsets.FieldsetError, filters.QueryError) as exc:
+        return Response({'error': str(exc)}, status=400)
+    return StreamingHttpResponse(stream(events, fields, [pagination.TIEBREAKER]), content_type=content_type)
+
 
 @api_view(['GET'])
+@cached_response
 def getEvents(request):
-    events = Event.objects.all().order_by('event_end_date')
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    events = Event.objects.all()
+    return _list_response(request, events, 'event_end_date')
 
 
 @api_view(['GET'])
 # @permission_classes([permissions.AllowAny])
+@cached_response
 def getEvent(request, eventID):
+    if conditional.is_conditional(request):
+        # Answer revalidation from the updated_at column alone.
+        updated_at = Event.objects.filter(eventID=eventID).values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            return Response({'error': 'Event not found'}, status=404)
+        not_modified = conditional.not_modified(request, *conditional.validators(request, updated_at))
+        if not_modified:
+            return not_modified
+
     try:
         event = Event.objects.get(eventID=eventID)
         
@@ -24,19 +119,17 @@ def getEvent(request, eventID):
         return Response({'error': 'Event not found'}, status=404)
     
     serializer = EventSerializer(event)
-    return Response(serializer.data)
+    return conditional.set_validators(Response(serializer.data), *conditional.validators(request, event.updated_at))
 
 @api_view(['GET'])
 @permission_classes([IsStudent])
 def getEventByCreatorId(request, creator_id):
-    print("creator_id:------ ", type(creator_id))
     try:
         event = Event.objects.filter(creator_id=creator_id)
     except Event.DoesNotExist:
         return Response({'error': 'Event not found'}, status=404)
     
-    serializer = EventSerializer(event, many=True)
-    return Response(serializer.data)
+    return _list_response(request, event, '-created_at')
 @api_view(['POST'])
 @permission_classes([IsStudent])
 def createEvent(request):
@@ -63,13 +156,15 @@ def updateEvent(request, eventID):
     serializer = EventSerializer(event, data=request.data)
     if serializer.is_valid():
         serializer.save()
-        return Response(serializer.data)
+        if 'capacity' in serializer.validated_data:
+            registration.fill_open_seats(eventID)
+            event.refresh_from_db()
+        return Response(EventSerializer(event).data)
     return Response(serializer.errors, status=400)
 
 @api_view(['DELETE'])
 @permission_classes([IsStudent])
 def deleteEvent(request, eventID):
-    print("eventid: ", eventID)
     try:
         event = Event.objects.get(eventID=eventID)
         perm = IsOwnerOrAdmin()
@@ -81,86 +176,201 @@ def deleteEvent(request, eventID):
         return Response({'error': 'Event not found'}, status=404)
     
     event.delete()
+    logger.info('Event %s deleted', eventID, extra={'event_id': eventID, 'user_id': request.user.id})
     return Response(status=204)
 
+@api_view(['POST'])
+@parser_classes([FastJSONParser, NDJSONParser])
+@permission_classes([IsStudent])
+def bulkCreateEvents(request):
+    items, error = _bulk_items(request)
+    if error:
+        return error
+    results = bulk.create(items, creator_id=request.user.id)
+    return _bulk_response(request, 'created', results, 201)
+
+@api_view(['PUT', 'PATCH'])
+@parser_classes([FastJSONParser, NDJSONParser])
+@permission_classes([IsStudent])
+def bulkUpdateEvents(request):
+    items, error = _bulk_items(request)
+    if error:
+        return error
+    results = bulk.update(items, request, partial=request.method == 'PATCH')
+    return _bulk_response(request, 'updated', results, 200)
+
+@api_view(['DELETE'])
+@parser_classes([FastJSONParser, NDJSONParser])
+@permission_classes([IsStudent])
+def bulkDeleteEvents(request):
+    items, error = _bulk_items(request)
+    if error:
+        return error
+    results = bulk.delete(items, request)
+    return _bulk_response(request, 'deleted', results, 200)
+
 @api_view(['POST'])
 @permission_classes([IsStudent])
 def registerStudent(request, eventID):
+    student_id, error = _student_id(request)
+    if error:
+        return error
+    
     try:
-        event = Event.objects.get(eventID=eventID)
+        entry = registration.register(eventID, student_id)
     except Event.DoesNotExist:
         return Response({'error': 'Event not found'}, status=404)
-    
-    student_id = request.data.get('student_id')
-    if not student_id:
-        return Response({'error': 'Student ID is required'}, status=400)
-    
-    if student_id in event.registered_students:
+    except registration.AlreadyRegistered:
         return Response({'error': 'Student already registered'}, status=400)
     
-    event.registered_students.append(student_id)
-    event.save()
+    if entry.status == Registration.WAITLISTED:
+        return Response(
+            {'status': entry.status, 'student_id': student_id, 'waitlist_position': registration.waitlist_position(entry)},
+            status=202,
+        )
     
+    event = Event.objects.get(eventID=eventID)
     serializer = EventSerializer(event)
     return Response(serializer.data)
 
 @api_view(['POST'])
 @permission_classes([IsStudent])
 def unregisterStudent(request, eventID):
+    student_id, error = _student_id(request)
+    if error:
+        return error
+    
     try:
-        event = Event.objects.get(eventID=eventID)
+        registration.unregister(eventID, student_id)
     except Event.DoesNotExist:
         return Response({'error': 'Event not found'}, status=404)
-    
-    student_id = request.data.get('student_id')
-    if not student_id:
-        return Response({'error': 'Student ID is required'}, status=400)
-    
-    if student_id not in event.registered_students:
+    except registration.NotRegistered:
         return Response({'error': 'Student not registered'}, status=400)
     
-    event.registered_students.remove(student_id)
-    event.save()
-    
+    event = Event.objects.get(eventID=eventID)
     serializer = EventSerializer(event)
     return Response(serializer.data)
 
-@api_view(['GET'])
-def getRegisteredStudents(request, eventID):
+@api_view(['POST'])
+@parser_classes([FastJSONParser, CSVParser, MultiPartParser, FormParser])
+@permission_classes([IsStaff])
+def bulkRegisterStudents(request, eventID):
+    student_ids, error = _student_ids(request)
+    if error:
+        return error
+
     try:
-        event = Event.objects.get(eventID=eventID)
+        result = registration.register_many(eventID, student_ids)
+    except Event.DoesNotExist:
+        return Response({'error': 'Event not found'}, status=404)
+    return Response(result._asdict())
+
+@api_view(['POST'])
+@parser_classes([FastJSONParser, CSVParser, MultiPartParser, FormParser])
+@permission_classes([IsStaff])
+def bulkUnregisterStudents(request, eventID):
+    student_ids, error = _student_ids(request)
+    if error:
+        return error
+
+    try:
+        result = registration.unregister_many(eventID, student_ids)
     except Event.DoesNotExist:
         return Response({'error': 'Event not found'}, status=404)
+    return Response(result._asdict())
+
+@api_view(['GET'])
+@cached_response
+def getRegisteredStudents(request, eventID):
+    updated_at = Event.objects.filter(eventID=eventID).values_list('updated_at', flat=True).first()
+    if updated_at is None:
+        return Response({'error': 'Event not found'}, status=404)
+    etag, last_modified = conditional.validators(request, updated_at)
+    not_modified = conditional.not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
     
-    return Response({'registered_students': event.registered_students})
+    students = (
+        Registration.objects.filter(event_id=eventID, status=Registration.REGISTERED)
+        .order_by('registered_at', 'id')
+        .values_list('student_id', flat=True)
+    )
+    response = Response({'registered_students': list(students)})
+    return conditional.set_validators(response, etag, last_modified)
 
 @api_view(['GET'])
+@permission_classes([IsSelfOrStaff])
+@cached_response
+def getStudentEvents(request, student_id):
+    # Served from registration_student_idx: cost follows the student's
+    # registrations, not the size of the catalogue.
+    status_filter = request.query_params.get('status', Registration.REGISTERED)
+    if status_filter not in (Registration.REGISTERED, Registration.WAITLISTED, 'all'):
+        return Response({'error': 'status must be registered, waitlisted or all'}, status=400)
+
+    lookup = {'registrations__student_id': student_id}
+    if status_filter != 'all':
+        lookup['registrations__status'] = status_filter
+    events = Event.objects.filter(**lookup)
+    return _list_response(request, events, 'event_start_date')
+
+@api_view(['GET'])
+@cached_response
 def getEventsByCreator(request, creator):
     events = Event.objects.filter(creator=creator)
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    return _list_response(request, events)
 
 @api_view(['GET'])
+@cached_response
 def getEventsByType(request, eventType):
     events = Event.objects.filter(eventType=eventType)
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    return _list_response(request, events, 'event_start_date')
 
 @api_view(['GET'])
+@cached_response
 def getEventsByDateRange(request):
     start_date = request.query_params.get('start_date')
     end_date = request.query_params.get('end_date')
     
     if not start_date or not end_date:
         return Response({'error': 'Start date and end date are required'}, status=400)
-    
+
+    if request.query_params.get('overlap', '').lower() in ('1', 'true', 'yes'):
+        # Events that overlap the range rather than lie inside it.
+        try:
+            start = windows.moment(start_date, 'start_date')
+            end = windows.moment(end_date, 'end_date', end=True)
+        except windows.CalendarError as exc:
+            return Response({'error': str(exc)}, status=400)
+        events = windows.overlapping(Event.objects.all(), start, end)
+        return _list_response(request, events, 'event_start_date')
+
     events = Event.objects.filter(event_start_date__gte=start_date, event_end_date__lte=end_date)
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    return _list_response(request, events, 'event_start_date')
+
+@api_view(['GET'])
+@cached_response
+def getCalendar(request):
+    try:
+        window = windows.requested(request.query_params)
+        fields = fieldsets.requested(request) if windows.include_events(request.query_params) else None
+        page_size = pagination.get_page_size(request)
+        events = windows.overlapping(Event.objects.all(), window.start, window.end)
+        return Response(windows.calendar(window, events, fields, page_size, request.query_params.get('cursor')))
+    except (windows.CalendarError, fieldsets.FieldsetError, pagination.PaginationError) as exc:
+        return Response({'error': str(exc)}, status=400)
 
 @api_view(['GET'])
 def healthCheck(request):
-    return Response({'status': 'API is running'}) 
+    return Response({'status': 'API is running', 'cache': cache_stats()}) 
+
+# Plain Django view: Prometheus scrapers send no JWT and expect text, not
+# DRF's content negotiation.
+@require_safe
+def getMetrics(request):
+    if not metrics.enabled():
+        raise Http404
+    return HttpResponse(metrics.render(), content_type=metrics.CONTENT_TYPE)
 
 @api_view(['GET'])
 def apiInfo(request):
@@ -172,135 +382,136 @@ def apiInfo(request):
     return Response(info)
 
 @api_view(['GET'])
+@cached_response
 def getEventCount(request):
-    count = Event.objects.count()
+    # Read from the trigger-maintained counter (see base.stats).
+    count = stats.event_count()
     return Response({'event_count': count})
 
 @api_view(['GET'])
+@cached_response
+def getEventStats(request):
+    return Response(stats.summary())
+
+@api_view(['GET'])
+@cached_response
 def getUpcomingEvents(request):
     from django.utils import timezone
     now = timezone.now()
-    events = Event.objects.filter(event_start_date__gte=now).order_by('event_start_date')
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    events = Event.objects.filter(event_start_date__gte=now)
+    return _list_response(request, events, 'event_start_date')
 
 @api_view(['GET'])
+@cached_response
 def getPastEvents(request):
     from django.utils import timezone
     now = timezone.now()
-    events = Event.objects.filter(event_end_date__lt=now).order_by('-event_end_date')
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    events = Event.objects.filter(event_end_date__lt=now)
+    return _list_response(request, events, '-event_end_date')
 
 @api_view(['GET'])
+@cached_response
 def getEventsByLocation(request, location):
     events = Event.objects.filter(location__icontains=location)
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    return _list_response(request, events)
 
 @api_view(['GET'])
+@cached_response
 def getEventsByCapacity(request, min_capacity):
     events = Event.objects.filter(capacity__gte=min_capacity)
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    return _list_response(request, events, 'capacity')
 
 @api_view(['GET'])
+@cached_response
 def getRecentEvents(request, days):
     from django.utils import timezone
     from datetime import timedelta
     now = timezone.now()
     past_date = now - timedelta(days=days)
-    events = Event.objects.filter(created_at__gte=past_date).order_by('-created_at')
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    events = Event.objects.filter(created_at__gte=past_date)
+    return _list_response(request, events, '-created_at')
 
 @api_view(['GET'])
+@cached_response
 def getEventsByHost(request, hosted_by):
     events = Event.objects.filter(hosted_by__icontains=hosted_by)
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    return _list_response(request, events)
 
 @api_view(['GET'])
+@cached_response
 def getEventsWithLinks(request):
-    events = Event.objects.exclude(link__isnull=True).exclude(link__exact='')
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    # ``> ''`` skips both NULL and blank, and matches the partial index.
+    events = Event.objects.filter(link__gt='')
+    return _list_response(request, events)
 
 @api_view(['GET'])
+@cached_response
 def getEventsWithZoomLinks(request):
-    events = Event.objects.exclude(zoom_link__isnull=True).exclude(zoom_link__exact='')
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)        
+    events = Event.objects.filter(zoom_link__gt='')
+    return _list_response(request, events)        
 
 @api_view(['GET'])
+@cached_response
 def getEventsByKeyword(request):
     keyword = request.query_params.get('keyword')
     if not keyword:
         return Response({'error': 'Keyword is required'}, status=400)
     
-    events = Event.objects.filter(models.Q(title__icontains=keyword) | models.Q(description__icontains=keyword))
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    events = search_events(Event.objects.all(), keyword)
+    return _list_response(request, events, 'search_rank')
 
 @api_view(['GET'])
+@cached_response
 def getFullEvents(request): 
-    full_events = [event for event in Event.objects.all() if len(event.registered_students) >= event.capacity]
-    serializer = EventSerializer(full_events, many=True)
-    return Response(serializer.data)
+    full_events = Event.objects.annotate(seats_left=filters.SEATS_LEFT).filter(seats_left__lte=0)
+    return _list_response(request, full_events, 'seats_left')
 
 @api_view(['GET'])
+@cached_response
 def getAvailableEvents(request):
-    available_events = [event for event in Event.objects.all() if len(event.registered_students) < event.capacity]
-    serializer = EventSerializer(available_events, many=True)
-    return Response(serializer.data)
+    available_events = Event.objects.annotate(seats_left=filters.SEATS_LEFT).filter(seats_left__gt=0)
+    return _list_response(request, available_events, 'seats_left')
 
 @api_view(['GET'])
+@cached_response
 def getEventsSortedByCreationDate(request):
-    events = Event.objects.all().order_by('-created_at')
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    events = Event.objects.all()
+    return _list_response(request, events, '-created_at')
 
 @api_view(['GET'])
+@cached_response
 def getEventsSortedByUpdateDate(request):
-    events = Event.objects.all().order_by('-updated_at')
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    events = Event.objects.all()
+    return _list_response(request, events, '-updated_at')
 
 @api_view(['GET'])
+@cached_response
 def getEventsSortedByStartDate(request):
-    events = Event.objects.all().order_by('event_start_date')
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    events = Event.objects.all()
+    return _list_response(request, events, 'event_start_date')
 
 @api_view(['GET'])
+@cached_response
 def getEventsSortedByEndDate(request):
-    events = Event.objects.all().order_by('event_end_date')
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    events = Event.objects.all()
+    return _list_response(request, events, 'event_end_date')
 
 @api_view(['GET'])
+@cached_response
 def getEventsByMultipleFilters(request):
-    creator = request.query_params.get('creator')
-    eventType = request.query_params.get('eventType')
-    location = request.query_params.get('location')
-    host = request.query_params.get('host')
-    min_capacity = request.query_params.get('min_capacity')
-    max_capacity = request.query_params.get('max_capacity')
-    events = Event.objects.all()
-    if creator:
-        events = events.filter(creator=creator)
-    if eventType:
-        events = events.filter(eventType=eventType)
-    if location:
-        events = events.filter(location__icontains=location)
-    if host:
-        events = events.filter(hosted_by__icontains=host)
-    if min_capacity:
-        events = events.filter(capacity__gte=min_capacity)
-    if max_capacity:
-        events = events.filter(capacity__lte=max_capacity)
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    try:
+        events, ordering = filters.build(request.query_params)
+    except filters.QueryError as exc:
+        return Response({'error': str(exc)}, status=400)
+    return _list_response(request, events, *ordering)
+
+@api_view(['GET'])
+def exportEvents(request):
+    return _export(request, export.json_array, 'application/json')
+
+@api_view(['GET'])
+def exportEventsNdjson(request):
+    return _export(request, export.ndjson, 'application/x-ndjson')
 
 @api_view(['GET'])
 def apiOverview(request):
@@ -321,8 +532,8 @@ def welcome(request):
     return Response({'message': 'Welcome to the Events Service API'})
 
 @api_view(['GET'])
+@cached_response
 def searchEvents(request):
     query = request.query_params.get('q', '')
-    events = Event.objects.filter(models.Q(title__icontains=query) | models.Q(description__icontains=query))
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    events = search_events(Event.objects.all(), query)
+    return _list_response(request, events, 'search_rank')
@@ -0,0 +1,241 @@
+"""
+Calendar windows: the events overlapping a span of time.
+
+An event overlaps ``[start, end)`` when it starts before ``end`` and ends
+after ``start``. Two open-ended range conditions on different columns give a
+B-tree nothing to seek on: ``event_end_date > start`` alone matches every
+later event. ``base.stats.longest_duration`` bounds how long any event runs,
+so an overlapping event must also start after ``start - longest``, and the
+query becomes one range scan of ``event_window_idx``
+(``event_start_date, event_end_date``). The index carries the end date, so
+the remaining condition is checked without reading the table.
+
+``/api/events/calendar/`` picks the window with either
+
+* ``view=month|week|day`` (default ``month``) and ``date`` (default today),
+  weeks starting on Monday, or
+* ``start`` and ``end``: ISO dates or datetimes; a date-only ``end``
+  includes that whole day.
+
+``tz`` names the timezone that dates and the per-day buckets are read in
+(default ``TIME_ZONE``). Windows are capped at
+``EVENTS_API['CALENDAR_MAX_DAYS']`` days.
+
+The per-day counts are one aggregate query, a filtered ``COUNT`` per day,
+so no event rows leave the database for them. The events themselves come a
+keyset page at a time (``page_size``/``cursor``, see ``api.pagination``) in
+start order; follow-up pages skip the counts.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone, tzinfo
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from base import stats
+
+from . import fastpath, pagination
+
+VIEWS = ('month', 'week', 'day')
+SPAN = ('event_start_date', 'event_end_date')
+DEFAULT_MAX_DAYS = 62
+
+# The duration buckets round to whole seconds.
+_SLACK = timedelta(seconds=1)
+_TRUE, _FALSE = ('1', 'true', 'yes'), ('0', 'false', 'no')
+
+
+class CalendarError(ValueError):
+    """Raised for a malformed, inverted or oversized calendar window."""
+
+
+class Window(NamedTuple):
+    start: datetime
+    end: datetime
+    tz: tzinfo
+
+    def days(self) -> List[date]:
+        first = self.start.astimezone(self.tz).date()
+        last = _last_day(self.end, self.tz)
+        return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+def max_days() -> int:
+    return int(getattr(settings, 'EVENTS_API', {}).get('CALENDAR_MAX_DAYS', DEFAULT_MAX_DAYS))
+
+
+def _last_day(end: datetime, tz: tzinfo) -> date:
+    # ``end`` is exclusive: an event ending at midnight is not on the next day.
+    return (end - timedelta(microseconds=1)).astimezone(tz).date()
+
+
+def _midnight(day: date, tz: tzinfo) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=tz)
+
+
+def _zone(params) -> tzinfo:
+    name = params.get('tz')
+    if not name:
+        return timezone.get_current_timezone()
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as exc:
+        raise CalendarError(f"tz must be an IANA timezone name, not {name!r}") from exc
+
+
+def moment(raw: str, name: str, tz: Optional[tzinfo] = None, end: bool = False) -> datetime:
+    """
+    Parse an ISO date or datetime in ``tz`` (default: the current timezone).
+    A date is midnight at the start of that day, or of the next day when it
+    closes a window (``end``).
+    """
+    tz = tz or timezone.get_current_timezone()
+    try:
+        # Dates first: parse_datetime also accepts a bare date, as midnight.
+        day = parse_date(raw)
+        if day is not None:
+            value = _midnight(day + timedelta(days=1) if end else day, tz)
+        else:
+            value = parse_datetime(raw)
+    except (ValueError, OverflowError):
+        value = None
+    if value is None:
+        raise CalendarError(f"{name} must be an ISO date or datetime")
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value, tz)
+    return value
+
+
+def _date(raw: str) -> date:
+    try:
+        day = parse_date(raw)
+    except ValueError:
+        day = None
+    if day is None:
+        raise CalendarError("date must be an ISO date")
+    return day
+
+
+def _view_window(view: str, day: date, tz: tzinfo) -> Tuple[datetime, datetime]:
+    if view == 'day':
+        first, after = day, day + timedelta(days=1)
+    elif view == 'week':
+        first = day - timedelta(days=day.weekday())
+        after = first + timedelta(days=7)
+    else:
+        first = day.replace(day=1)
+        after = (first + timedelta(days=32)).replace(day=1)
+    return _midnight(first, tz), _midnight(after, tz)
+
+
+def requested(params) -> Window:
+    """The window selected by the query parameters ``params``."""
+    tz = _zone(params)
+    if params.get('start') or params.get('end'):
+        if not (params.get('start') and params.get('end')):
+            raise CalendarError("start and end must be given together")
+        start = moment(params['start'], 'start', tz)
+        end = moment(params['end'], 'end', tz, end=True)
+    else:
+        view = params.get('view') or 'month'
+        if view not in VIEWS:
+            raise CalendarError(f"view must be one of: {', '.join(VIEWS)}")
+        day = _date(params['date']) if params.get('date') else timezone.localdate(timezone=tz)
+        try:
+            start, end = _view_window(view, day, tz)
+        except OverflowError as exc:
+            raise CalendarError("date is out of range") from exc
+
+    if end <= start:
+        raise CalendarError("end must be after start")
+    # Bound the span before anything walks its days.
+    if end - start > timedelta(days=max_days()):
+        raise CalendarError(f"A calendar window spans at most {max_days()} days")
+    try:
+        # The database sees UTC; the ends of the calendar do not convert.
+        start.astimezone(dt_timezone.utc), end.astimezone(dt_timezone.utc)
+        window = Window(start, end, tz)
+        days = len(window.days())
+    except OverflowError as exc:
+        raise CalendarError("start and end must be within the supported date range") from exc
+    if days > max_days():
+        raise CalendarError(f"A calendar window spans at most {max_days()} days")
+    return window
+
+
+def include_events(params) -> bool:
+    raw = (params.get('events') or 'true').lower()
+    if raw not in _TRUE + _FALSE:
+        raise CalendarError("events must be true or false")
+    return raw in _TRUE
+
+
+def overlapping(events: models.QuerySet, start: datetime, end: datetime) -> models.QuerySet:
+    """``events`` that overlap ``[start, end)``, as a bounded range on the start date."""
+    conditions = _overlaps(start, end)
+    longest = stats.longest_duration(events.db)
+    if longest is not None:
+        try:
+            conditions &= models.Q(event_start_date__gte=start.astimezone(dt_timezone.utc) - longest - _SLACK)
+        except OverflowError:
+            pass  # The bound would fall before year 1: nothing to cut off.
+    return events.filter(conditions)
+
+
+def _overlaps(start: datetime, end: datetime) -> models.Q:
+    # An event with no duration at ``start`` itself is inside the window.
+    return models.Q(event_start_date__lt=end) & (
+        models.Q(event_end_date__gt=start) | models.Q(event_start_date__gte=start)
+    )
+
+
+def day_counts(window: Window, events: models.QuerySet) -> List[Dict[str, object]]:
+    """
+    Events on each day of ``window`` (an event spanning days counts on each),
+    as one filtered ``COUNT`` per day over ``events``. The conditions read
+    only the start and end dates, so the query stays inside
+    ``event_window_idx``.
+    """
+    days = window.days()
+    bounds = [_midnight(day, window.tz) for day in days[1:]]
+    counts = {
+        f'd{index}': models.Count('pk', filter=_overlaps(start, end))
+        for index, (start, end) in enumerate(zip([window.start, *bounds], [*bounds, window.end]))
+    }
+    totals = events.order_by().aggregate(**counts)
+    return [{'date': day.isoformat(), 'count': totals[f'd{index}']} for index, day in enumerate(days)]
+
+
+def calendar(
+    window: Window,
+    events: models.QuerySet,
+    fields: Optional[Tuple[str, ...]],
+    page_size: int,
+    cursor: Optional[str] = None,
+) -> Dict[str, object]:
+    """
+    The calendar body for ``events`` (already narrowed by ``overlapping``):
+    the window, per-day counts and, unless ``fields`` is None, one keyset
+    page of the events in start order. A follow-up page (``cursor``) leaves
+    out the counts the first page carried.
+
+    Raises ``pagination.PaginationError`` for a malformed cursor.
+    """
+    data: Dict[str, object] = {
+        'start': window.start.isoformat(),
+        'end': window.end.isoformat(),
+        'timezone': str(window.tz),
+    }
+    if fields is None or cursor is None:
+        data['days'] = day_counts(window, events)
+    if fields is not None:
+        rows, next_cursor = pagination.paginate(fastpath.event_rows(events, fields, SPAN), SPAN, page_size, cursor)
+        data['events'] = fastpath.represent(rows, fields)
+        data['next_cursor'] = next_cursor
+    return data
@@ -1,6 +1,24 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class BaseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'base'
+
+    def ready(self):
+        from .invalidation import connect_signals
+
+        connect_signals()
+        post_migrate.connect(_repair_triggers, sender=self)
+
+
+def _repair_triggers(sender, using, **kwargs):
+    from django.db import connections
+
+    from . import search, stats
+
+    search.repair(connections[using])
+    stats.repair(connections[using])
+    # The migrations create or drop the index without going through base.search.
+    search.search_backend.cache_clear()
@@ -0,0 +1,18 @@
+from django.db import models
+
+
+class FullTextField(models.TextField):
+    """
+    Stand-in for an FTS5 table's hidden column of the same name, so the
+    ORM can express ``<table> MATCH <query>`` as ``field__match=query``.
+    """
+
+
+@FullTextField.register_lookup
+class Match(models.Lookup):
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', [*lhs_params, *rhs_params]
@@ -0,0 +1,80 @@
+"""
+Generation counter for everything derived from the events tables.
+
+Cached API responses embed the current generation in their keys. Any write
+to ``Event`` or ``Registration`` bumps the counter, which orphans every
+cached response in one step; the orphaned entries simply age out of the
+cache backend.
+"""
+
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+GENERATION_KEY = "events:generation"
+
+
+def events_cache():
+    alias = getattr(settings, "EVENTS_API", {}).get("RESPONSE_CACHE", "default")
+    return caches[alias]
+
+
+def current_generation() -> int:
+    cache = events_cache()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        # Seed from the clock rather than 1 so a counter that was evicted
+        # can never come back with a value older entries were keyed on.
+        cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+async def acurrent_generation() -> int:
+    """``current_generation`` for async views."""
+    cache = events_cache()
+    generation = await cache.aget(GENERATION_KEY)
+    if generation is None:
+        await cache.aadd(GENERATION_KEY, time.time_ns(), timeout=None)
+        generation = await cache.aget(GENERATION_KEY)
+    return generation
+
+
+def _bump() -> None:
+    cache = events_cache()
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, time.time_ns(), timeout=None)
+
+
+def invalidate_events() -> None:
+    """
+    Invalidate cached event data.
+
+    Bumps immediately and again once the surrounding transaction commits,
+    so a reader that re-cached the pre-commit state in between is orphaned
+    as well.
+    """
+    _bump()
+    transaction.on_commit(_bump)
+
+
+def _on_change(sender, **kwargs):
+    if kwargs.get("raw"):
+        return
+    invalidate_events()
+
+
+def connect_signals() -> None:
+    from django.db.models.signals import post_delete, post_save
+
+    from .models import Event, Registration
+
+    for model in (Event, Registration):
+        post_save.connect(_on_change, sender=model, dispatch_uid=f"invalidate_{model.__name__}_save")
+        post_delete.connect(_on_change, sender=model, dispatch_uid=f"invalidate_{model.__name__}_delete")
@@ -0,0 +1,214 @@
+"""
+Synthetic catalogues for benchmarks and load tests.
+
+The shape follows a campus calendar rather than uniform noise:
+
+- event types come with their own weights, capacities and durations
+  (conferences are rare, large and run for days);
+- start dates cluster around today, fall mostly on weekdays and in working
+  hours; ``--past-fraction`` of them are already over;
+- a few hosts and creators own most of the events (Zipf-like weights);
+- registration sizes are skewed: most events are lightly booked, a long
+  tail is nearly full, and a few are oversubscribed with a waitlist;
+- a small group of students accounts for most registrations, so
+  per-student lookups have both light and heavy users.
+
+The same ``--seed`` and options give the same catalogue. Dates are relative
+to the time the command runs, so "upcoming" and "past" keep their meaning.
+"""
+
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+from base.models import Event, Registration
+
+# eventType, weight, capacities, duration in hours (low, high)
+EVENT_TYPES = (
+    ('Workshop', 30, (15, 25, 40), (1, 3)),
+    ('Seminar', 22, (30, 50, 80), (1, 2)),
+    ('Class', 18, (20, 30, 45), (1, 3)),
+    ('Social', 14, (50, 100, 200), (2, 4)),
+    ('Meetup', 10, (10, 20, 30), (1, 2)),
+    ('Conference', 6, (200, 300, 500), (24, 72)),
+)
+HOSTS = (
+    'CS Department', 'Student Union', 'Career Center', 'AI Lab', 'Library', 'Math Department',
+    'Robotics Club', 'Office of Sustainability', 'Graduate School', 'Athletics', 'Music Department',
+    'Entrepreneurship Center',
+)
+LOCATIONS = (
+    'Campus Center', 'Worcester Hall', 'Library', 'Online via Zoom', 'Rec Center', 'Science Building',
+    'Student Union Ballroom', 'Downtown', 'Engineering Lab', 'Auditorium',
+)
+TOPICS = (
+    'machine learning', 'data science', 'robotics', 'career planning', 'resume writing', 'music', 'art history',
+    'physics', 'chemistry', 'biology', 'startups', 'design', 'ethics', 'security', 'cloud computing',
+    'quantum computing', 'networking', 'research methods', 'poetry', 'film', 'theatre', 'personal finance',
+    'marketing', 'public health', 'wellness', 'yoga', 'chess', 'hackathons', 'volunteering', 'sustainability',
+    'climate policy', 'law', 'medicine', 'open source', 'web development', 'statistics',
+)
+OPENERS = ('Intro to', 'Advanced', 'Hands-on', 'Weekly', 'Spring', 'Fall', 'Community', 'Graduate', 'Beginner')
+# Start hours 8:00-21:00, busiest around lunch and late afternoon.
+HOURS = tuple(range(8, 22))
+HOUR_WEIGHTS = (2, 4, 6, 6, 8, 7, 6, 6, 7, 8, 7, 5, 3, 2)
+
+
+def _zipf_weights(count, exponent=1.1):
+    return [1 / (rank ** exponent) for rank in range(1, count + 1)]
+
+
+class Command(BaseCommand):
+    help = "Add a synthetic catalogue of events and registrations (for benchmarks; not for production data)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=10000, help='Number of events to create.')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed; the same seed gives the same catalogue.')
+        parser.add_argument('--students', type=int, default=20000, help='Size of the student ID pool.')
+        parser.add_argument('--creators', type=int, default=500, help='Size of the creator ID pool.')
+        parser.add_argument(
+            '--fill-scale', type=float, default=1.0,
+            help='Multiplier on registration sizes; 0 creates no registrations.',
+        )
+        parser.add_argument('--past-fraction', type=float, default=0.4, help='Share of events that are already over.')
+        parser.add_argument('--past-days', type=int, default=365, help='How far back past events go.')
+        parser.add_argument('--future-days', type=int, default=180, help='How far ahead upcoming events go.')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Events per bulk insert.')
+        parser.add_argument('--clear', action='store_true', help='Delete every event and registration first.')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help='Database alias to fill.')
+
+    def handle(self, *args, **options):
+        database = options['database']
+        if options['events'] < 0 or options['batch_size'] < 1:
+            raise CommandError("--events must be >= 0 and --batch-size >= 1.")
+        if not connections[database].features.can_return_rows_from_bulk_insert:
+            raise CommandError("generate_events needs a database that returns IDs from bulk inserts.")
+
+        started = time.perf_counter()
+        if options['clear']:
+            self._clear(database)
+        connection = connections[database]
+        generator = _Catalogue(options)
+        # Registrations are plain rows that need no IDs back: one executemany
+        # skips building (and preparing) a model instance per row, which
+        # otherwise dominates the run.
+        insert = (
+            f'INSERT INTO {Registration._meta.db_table} (event_id, student_id, status, registered_at) '
+            f'VALUES (%s, %s, %s, %s)'
+        )
+        registered_at = connection.ops.adapt_datetimefield_value(timezone.now())
+        events = registrations = 0
+        while events < options['events']:
+            size = min(options['batch_size'], options['events'] - events)
+            with transaction.atomic(using=database):
+                created, rosters = generator.batch(size)
+                Event.objects.using(database).bulk_create(created)
+                rows = [
+                    (event.eventID, student_id, status, registered_at)
+                    for event, roster in zip(created, rosters)
+                    for student_id, status in roster
+                ]
+                with connection.cursor() as cursor:
+                    cursor.executemany(insert, rows)
+            events += size
+            registrations += len(rows)
+            if options['verbosity'] > 1:
+                self.stdout.write(f"  {events}/{options['events']} events")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {events} events and {registrations} registrations in {time.perf_counter() - started:.1f}s."
+        ))
+
+    def _clear(self, database):
+        # Raw deletes: the ORM collector would load every ID first. The
+        # search and statistics triggers still see each row.
+        with connections[database].cursor() as cursor:
+            cursor.execute(f'DELETE FROM {Registration._meta.db_table}')
+            cursor.execute(f'DELETE FROM {Event._meta.db_table}')
+
+
+class _Catalogue:
+    def __init__(self, options):
+        self.rng = random.Random(options['seed'])
+        self.options = options
+        self.now = timezone.now().replace(minute=0, second=0, microsecond=0)
+        self.types = EVENT_TYPES
+        self.type_weights = [weight for _, weight, _, _ in EVENT_TYPES]
+        self.host_weights = _zipf_weights(len(HOSTS))
+        self.creator_weights = _zipf_weights(options['creators'])
+
+    def batch(self, size):
+        events, rosters = [], []
+        for _ in range(size):
+            event = self._event()
+            roster = self._roster(event.capacity)
+            event.registered_count = sum(1 for _, status in roster if status == Registration.REGISTERED)
+            events.append(event)
+            rosters.append(roster)
+        return events, rosters
+
+    def _start(self):
+        rng, options = self.rng, self.options
+        # Density falls off away from today in both directions.
+        if rng.random() < options['past_fraction']:
+            days = -1 - int(options['past_days'] * rng.random() ** 1.5)
+        else:
+            days = int(options['future_days'] * rng.random() ** 1.5)
+        start = self.now + timedelta(days=days)
+        if start.weekday() >= 5 and rng.random() < 0.7:
+            start -= timedelta(days=start.weekday() - 4)
+        hour = rng.choices(HOURS, HOUR_WEIGHTS)[0]
+        return start.replace(hour=hour, minute=rng.choice((0, 15, 30, 45)))
+
+    def _event(self):
+        rng = self.rng
+        event_type, _, capacities, (low, high) = rng.choices(self.types, self.type_weights)[0]
+        topic = rng.choice(TOPICS)
+        start = self._start()
+        location = rng.choice(LOCATIONS)
+        online = location == 'Online via Zoom' or rng.random() < 0.1
+        creator_id = rng.choices(range(1, self.options['creators'] + 1), self.creator_weights)[0]
+        return Event(
+            creator_id=creator_id,
+            title=f"{rng.choice(OPENERS)} {topic.title()} {event_type}",
+            description=(
+                f"A {event_type.lower()} on {topic}. "
+                f"Topics include {rng.choice(TOPICS)}, {rng.choice(TOPICS)} and {rng.choice(TOPICS)}. "
+                f"Open to all students; {rng.choice(('no experience needed', 'bring a laptop', 'snacks provided', 'registration required'))}."
+            ),
+            creator=f"user{creator_id}@example.edu",
+            eventType=event_type,
+            location=location,
+            capacity=rng.choice(capacities),
+            image_url='',
+            link=f"https://events.example.edu/{rng.getrandbits(32):08x}" if rng.random() < 0.35 else '',
+            zoom_link=f"https://zoom.us/j/{rng.randint(10 ** 9, 10 ** 10 - 1)}" if online else '',
+            hosted_by=rng.choices(HOSTS, self.host_weights)[0],
+            event_start_date=start,
+            event_end_date=start + timedelta(hours=rng.randint(low, high)),
+        )
+
+    def _roster(self, capacity):
+        rng, options = self.rng, self.options
+        if rng.random() < 0.06:
+            # Oversubscribed: full, plus a waitlist of up to 30% of capacity.
+            registered, waitlisted = capacity, int(capacity * rng.uniform(0.0, 0.3))
+        else:
+            registered, waitlisted = min(capacity, int(capacity * rng.betavariate(0.7, 1.6))), 0
+        registered = min(capacity, int(registered * options['fill_scale']))
+        waitlisted = int(waitlisted * options['fill_scale'])
+        wanted = min(registered + waitlisted, options['students'])
+        students = {}
+        while len(students) < wanted:
+            # Low IDs are the heavy users.
+            students[1 + int(options['students'] * rng.random() ** 2.5)] = None
+        ordered = list(students)
+        rng.shuffle(ordered)
+        return [
+            (student_id, Registration.REGISTERED if i < registered else Registration.WAITLISTED)
+            for i, student_id in enumerate(ordered)
+        ]
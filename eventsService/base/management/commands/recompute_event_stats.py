@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from base import stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized event statistics (base_eventstat) from the events table."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help='Database alias to recompute.')
+        parser.add_argument(
+            '--check', action='store_true',
+            help='Only compare the stored counters with the events table; exit with an error on drift.',
+        )
+        parser.add_argument(
+            '--fold', action='store_true',
+            help='Only add the pending registration deltas to the counters (the cheap periodic job).',
+        )
+
+    def handle(self, *args, database, check, fold, **options):
+        if not stats.tracked(database):
+            raise CommandError(f"Event statistics are not maintained on the '{database}' database.")
+
+        if fold:
+            folded = stats.fold(database)
+            self.stdout.write(self.style.SUCCESS(f"Folded {folded} registration deltas."))
+            return
+
+        if check:
+            stored, actual = stats.current(database), stats.expected(database)
+            drifted = sorted(key for key in stored.keys() | actual.keys() if stored.get(key) != actual.get(key))
+            for dimension, value in drifted:
+                self.stdout.write(
+                    f"{dimension}={value!r}: stored {stored.get((dimension, value))}, actual {actual.get((dimension, value))}"
+                )
+            if drifted:
+                raise CommandError(f"{len(drifted)} counter row(s) out of date.")
+            self.stdout.write(self.style.SUCCESS("Event statistics are up to date."))
+            return
+
+        rows = stats.recompute(database)
+        self.stdout.write(self.style.SUCCESS(f"Recomputed {rows} event statistics rows."))
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from eventsService.database import JOURNAL_MODES, set_journal_mode
+
+
+class Command(BaseCommand):
+    help = (
+        "Switch a SQLite database file to a journal mode (default EVENTS_SQLITE_JOURNAL_MODE, 'wal'). "
+        "The mode is stored in the file, so this only needs running once per database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('mode', nargs='?', help=f"One of: {', '.join(JOURNAL_MODES)}.")
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help='Database alias to switch.')
+
+    def handle(self, *args, mode, database, **options):
+        connection = connections[database]
+        if connection.vendor != 'sqlite' or connection.is_in_memory_db():
+            raise CommandError(f"The '{database}' database is not a SQLite file.")
+        mode = (mode or getattr(settings, 'EVENTS_API', {}).get('SQLITE_JOURNAL_MODE') or '').lower()
+        try:
+            previous = set_journal_mode(connection, mode)
+        except ImproperlyConfigured as exc:
+            raise CommandError(str(exc)) from exc
+        if previous == mode:
+            self.stdout.write(f"Journal mode is already {mode}.")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Journal mode switched from {previous} to {mode}."))
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def _student_ids(raw):
+    seen = set()
+    for value in raw or []:
+        try:
+            student_id = int(value)
+        except (TypeError, ValueError):
+            continue
+        if student_id not in seen:
+            seen.add(student_id)
+            yield student_id
+
+
+def copy_registered_students(apps, schema_editor):
+    Event = apps.get_model('base', 'Event')
+    Registration = apps.get_model('base', 'Registration')
+    batch = []
+    rows = Event.objects.values_list('eventID', 'registered_students')
+    for event_id, students in rows.iterator(chunk_size=500):
+        for student_id in _student_ids(students):
+            batch.append(Registration(event_id=event_id, student_id=student_id))
+        if len(batch) >= 1000:
+            Registration.objects.bulk_create(batch)
+            batch = []
+    Registration.objects.bulk_create(batch)
+    # registered_at is auto_now_add, so bulk_create stamped every row with
+    # the migration time. Date the copies from their event instead; within
+    # an event the ids keep the order of the old list.
+    created_at = Event.objects.filter(eventID=models.OuterRef('event_id')).values('created_at')[:1]
+    Registration.objects.update(registered_at=models.Subquery(created_at))
+
+
+def restore_registered_students(apps, schema_editor):
+    Event = apps.get_model('base', 'Event')
+    Registration = apps.get_model('base', 'Registration')
+    rosters = {}
+    for event_id, student_id in Registration.objects.order_by('registered_at', 'id').values_list('event_id', 'student_id'):
+        rosters.setdefault(event_id, []).append(student_id)
+    for event_id, students in rosters.items():
+        Event.objects.filter(eventID=event_id).update(registered_students=students)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0003_event_creator_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Registration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('student_id', models.IntegerField()),
+                ('registered_at', models.DateTimeField(auto_now_add=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='registrations', to='base.event')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['event', 'registered_at'], name='registration_roster_idx')],
+                'constraints': [models.UniqueConstraint(fields=('event', 'student_id'), name='unique_event_student')],
+            },
+        ),
+        migrations.RunPython(copy_registered_students, restore_registered_students),
+        migrations.RemoveField(
+            model_name='event',
+            name='registered_students',
+        ),
+    ]
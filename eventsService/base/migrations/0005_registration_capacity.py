@@ -0,0 +1,46 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:35
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_registered_count(apps, schema_editor):
+    Event = apps.get_model('base', 'Event')
+    Registration = apps.get_model('base', 'Registration')
+    roster_size = (
+        Registration.objects.filter(event=models.OuterRef('pk'))
+        .order_by()
+        .values('event')
+        .annotate(n=models.Count('pk'))
+        .values('n')
+    )
+    Event.objects.update(registered_count=Coalesce(models.Subquery(roster_size), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0004_registration'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='registration',
+            name='registration_roster_idx',
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='registered_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='registration',
+            name='status',
+            field=models.CharField(choices=[('registered', 'Registered'), ('waitlisted', 'Waitlisted')], default='registered', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(fields=['event', 'status', 'registered_at'], name='registration_status_idx'),
+        ),
+        migrations.RunPython(backfill_registered_count, migrations.RunPython.noop),
+    ]
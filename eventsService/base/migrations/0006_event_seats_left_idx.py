@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:36
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0005_registration_capacity'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(django.db.models.expressions.CombinedExpression(models.F('capacity'), '-', models.F('registered_count')), name='event_seats_left_idx'),
+        ),
+    ]
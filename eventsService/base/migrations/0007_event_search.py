@@ -0,0 +1,94 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:43
+
+import base.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+# The SQL is copied from base.search as it stood when this migration was
+# written, so later changes to that module cannot rewrite history.
+
+SQLITE_INDEX = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS base_event_fts USING fts5(
+        title, description, content='base_event', content_rowid='eventID',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS base_event_fts_ai AFTER INSERT ON base_event BEGIN
+        INSERT INTO base_event_fts(rowid, title, description) VALUES (new.eventID, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS base_event_fts_ad AFTER DELETE ON base_event BEGIN
+        INSERT INTO base_event_fts(base_event_fts, rowid, title, description)
+        VALUES ('delete', old.eventID, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS base_event_fts_au AFTER UPDATE OF title, description ON base_event BEGIN
+        INSERT INTO base_event_fts(base_event_fts, rowid, title, description)
+        VALUES ('delete', old.eventID, old.title, old.description);
+        INSERT INTO base_event_fts(rowid, title, description) VALUES (new.eventID, new.title, new.description);
+    END
+    """,
+    "INSERT INTO base_event_fts(base_event_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)')",
+    "INSERT INTO base_event_fts(base_event_fts) VALUES ('rebuild')",
+]
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS base_event_fts_ai",
+    "DROP TRIGGER IF EXISTS base_event_fts_ad",
+    "DROP TRIGGER IF EXISTS base_event_fts_au",
+    "DROP TABLE IF EXISTS base_event_fts",
+]
+POSTGRES_INDEX = [
+    "CREATE INDEX IF NOT EXISTS base_event_search_gin ON base_event USING GIN ("
+    "(setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')))",
+]
+POSTGRES_DROP = ["DROP INDEX IF EXISTS base_event_search_gin"]
+
+
+def _execute(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def install_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            if not cursor.fetchone()[0]:
+                return
+        _execute(schema_editor, SQLITE_INDEX)
+    elif connection.vendor == 'postgresql':
+        _execute(schema_editor, POSTGRES_INDEX)
+
+
+def uninstall_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    _execute(schema_editor, {'sqlite': SQLITE_DROP, 'postgresql': POSTGRES_DROP}.get(vendor, []))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0006_event_seats_left_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSearchEntry',
+            fields=[
+                ('event', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='fts', serialize=False, to='base.event')),
+                ('document', base.fields.FullTextField(db_column='base_event_fts')),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'base_event_fts',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
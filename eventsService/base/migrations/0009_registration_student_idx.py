@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-17 21:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0008_event_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(fields=['student_id', 'status', 'event'], name='registration_student_idx'),
+        ),
+    ]
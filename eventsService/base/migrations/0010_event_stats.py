@@ -0,0 +1,312 @@
+# Generated by Django 5.2.8 on 2026-10-17 21:29
+
+from django.db import migrations, models
+
+# The SQL is copied from base.stats as it stood when this migration was
+# written (before the duration buckets), so later changes to that module
+# cannot rewrite history.
+
+SQLITE_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS base_eventstat_ai AFTER INSERT ON base_event BEGIN
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', new.eventType, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', new.hosted_by, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', date(new.event_start_date), +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', date(new.event_end_date), +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS base_eventstat_ad AFTER DELETE ON base_event BEGIN
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', old.eventType, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', old.hosted_by, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', date(old.event_start_date), -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', date(old.event_end_date), -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS base_eventstat_au AFTER UPDATE OF eventType, hosted_by, capacity, registered_count, event_start_date, event_end_date ON base_event BEGIN
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', old.eventType, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', old.hosted_by, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', date(old.event_start_date), -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', date(old.event_end_date), -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', new.eventType, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', new.hosted_by, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', date(new.event_start_date), +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', date(new.event_end_date), +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+    END
+    """,
+]
+
+POSTGRES_TRIGGERS = [
+    """
+    CREATE OR REPLACE FUNCTION base_eventstat_apply(e base_event, sign integer) RETURNS void AS $$
+    BEGIN
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', sign, sign * e.capacity, sign * e.registered_count)
+        ON CONFLICT (dimension, value) DO UPDATE SET
+            events = base_eventstat.events + EXCLUDED.events,
+            capacity = base_eventstat.capacity + EXCLUDED.capacity,
+            registered = base_eventstat.registered + EXCLUDED.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', e."eventType", sign, sign * e.capacity, sign * e.registered_count)
+        ON CONFLICT (dimension, value) DO UPDATE SET
+            events = base_eventstat.events + EXCLUDED.events,
+            capacity = base_eventstat.capacity + EXCLUDED.capacity,
+            registered = base_eventstat.registered + EXCLUDED.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', e.hosted_by, sign, sign * e.capacity, sign * e.registered_count)
+        ON CONFLICT (dimension, value) DO UPDATE SET
+            events = base_eventstat.events + EXCLUDED.events,
+            capacity = base_eventstat.capacity + EXCLUDED.capacity,
+            registered = base_eventstat.registered + EXCLUDED.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', to_char(e.event_start_date AT TIME ZONE 'UTC', 'YYYY-MM-DD'), sign, sign * e.capacity, sign * e.registered_count)
+        ON CONFLICT (dimension, value) DO UPDATE SET
+            events = base_eventstat.events + EXCLUDED.events,
+            capacity = base_eventstat.capacity + EXCLUDED.capacity,
+            registered = base_eventstat.registered + EXCLUDED.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', to_char(e.event_end_date AT TIME ZONE 'UTC', 'YYYY-MM-DD'), sign, sign * e.capacity, sign * e.registered_count)
+        ON CONFLICT (dimension, value) DO UPDATE SET
+            events = base_eventstat.events + EXCLUDED.events,
+            capacity = base_eventstat.capacity + EXCLUDED.capacity,
+            registered = base_eventstat.registered + EXCLUDED.registered;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION base_eventstat_track() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM base_eventstat_apply(OLD, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM base_eventstat_apply(NEW, 1);
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS base_eventstat_track ON base_event",
+    """
+    CREATE TRIGGER base_eventstat_track
+    AFTER INSERT OR DELETE OR UPDATE OF "eventType", "hosted_by", "capacity", "registered_count", "event_start_date", "event_end_date" ON base_event
+    FOR EACH ROW EXECUTE FUNCTION base_eventstat_track()
+    """,
+]
+
+SQLITE_RECOMPUTE = [
+    "DELETE FROM base_eventstat",
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'total', '', COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e HAVING COUNT(*) > 0
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'type', e.eventType, COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY e.eventType
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'host', e.hosted_by, COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY e.hosted_by
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'start_day', date(e.event_start_date), COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY date(e.event_start_date)
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'end_day', date(e.event_end_date), COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY date(e.event_end_date)
+    """,
+]
+
+POSTGRES_RECOMPUTE = [
+    "LOCK TABLE base_event IN SHARE MODE",
+    "DELETE FROM base_eventstat",
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'total', '', COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e HAVING COUNT(*) > 0
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'type', e."eventType", COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY e."eventType"
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'host', e.hosted_by, COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY e.hosted_by
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'start_day', to_char(e.event_start_date AT TIME ZONE 'UTC', 'YYYY-MM-DD'), COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY to_char(e.event_start_date AT TIME ZONE 'UTC', 'YYYY-MM-DD')
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'end_day', to_char(e.event_end_date AT TIME ZONE 'UTC', 'YYYY-MM-DD'), COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY to_char(e.event_end_date AT TIME ZONE 'UTC', 'YYYY-MM-DD')
+    """,
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS base_eventstat_ai",
+    "DROP TRIGGER IF EXISTS base_eventstat_ad",
+    "DROP TRIGGER IF EXISTS base_eventstat_au",
+]
+
+POSTGRES_DROP = [
+    "DROP TRIGGER IF EXISTS base_eventstat_track ON base_event",
+    "DROP FUNCTION IF EXISTS base_eventstat_track()",
+    "DROP FUNCTION IF EXISTS base_eventstat_apply(base_event, integer)",
+]
+
+
+def _execute(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def install_event_stats(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    _execute(schema_editor, {'sqlite': SQLITE_TRIGGERS, 'postgresql': POSTGRES_TRIGGERS}.get(vendor, []))
+    _execute(schema_editor, {'sqlite': SQLITE_RECOMPUTE, 'postgresql': POSTGRES_RECOMPUTE}.get(vendor, []))
+
+
+def uninstall_event_stats(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    _execute(schema_editor, {'sqlite': SQLITE_DROP, 'postgresql': POSTGRES_DROP}.get(vendor, []))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0009_registration_student_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(max_length=20)),
+                ('value', models.CharField(blank=True, max_length=200)),
+                ('events', models.IntegerField(default=0)),
+                ('capacity', models.BigIntegerField(default=0)),
+                ('registered', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('dimension', 'value'), name='unique_eventstat_dimension_value')],
+            },
+        ),
+        migrations.RunPython(install_event_stats, uninstall_event_stats),
+    ]
@@ -0,0 +1,423 @@
+from django.db import migrations
+
+# The SQL is copied from base.stats as it stood when this migration was
+# written, so later changes to that module cannot rewrite history.
+
+SQLITE_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS base_eventstat_ai AFTER INSERT ON base_event BEGIN
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', new.eventType, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', new.hosted_by, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', date(new.event_start_date), +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', date(new.event_end_date), +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('duration', CASE
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 1 * 3600 THEN '1'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 2 * 3600 THEN '2'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 4 * 3600 THEN '4'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 8 * 3600 THEN '8'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 24 * 3600 THEN '24'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 72 * 3600 THEN '72'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 168 * 3600 THEN '168'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 744 * 3600 THEN '744'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 8784 * 3600 THEN '8784'
+            ELSE 'longer' END, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS base_eventstat_ad AFTER DELETE ON base_event BEGIN
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', old.eventType, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', old.hosted_by, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', date(old.event_start_date), -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', date(old.event_end_date), -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('duration', CASE
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 1 * 3600 THEN '1'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 2 * 3600 THEN '2'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 4 * 3600 THEN '4'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 8 * 3600 THEN '8'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 24 * 3600 THEN '24'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 72 * 3600 THEN '72'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 168 * 3600 THEN '168'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 744 * 3600 THEN '744'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 8784 * 3600 THEN '8784'
+            ELSE 'longer' END, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS base_eventstat_au AFTER UPDATE OF eventType, hosted_by, capacity, registered_count, event_start_date, event_end_date ON base_event BEGIN
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', old.eventType, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', old.hosted_by, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', date(old.event_start_date), -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', date(old.event_end_date), -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('duration', CASE
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 1 * 3600 THEN '1'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 2 * 3600 THEN '2'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 4 * 3600 THEN '4'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 8 * 3600 THEN '8'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 24 * 3600 THEN '24'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 72 * 3600 THEN '72'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 168 * 3600 THEN '168'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 744 * 3600 THEN '744'
+            WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 8784 * 3600 THEN '8784'
+            ELSE 'longer' END, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', new.eventType, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', new.hosted_by, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', date(new.event_start_date), +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', date(new.event_end_date), +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('duration', CASE
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 1 * 3600 THEN '1'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 2 * 3600 THEN '2'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 4 * 3600 THEN '4'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 8 * 3600 THEN '8'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 24 * 3600 THEN '24'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 72 * 3600 THEN '72'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 168 * 3600 THEN '168'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 744 * 3600 THEN '744'
+            WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 8784 * 3600 THEN '8784'
+            ELSE 'longer' END, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+    END
+    """,
+]
+
+POSTGRES_TRIGGERS = [
+    """
+    CREATE OR REPLACE FUNCTION base_eventstat_apply(e base_event, sign integer) RETURNS void AS $$
+    BEGIN
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', sign, sign * e.capacity, sign * e.registered_count)
+        ON CONFLICT (dimension, value) DO UPDATE SET
+            events = base_eventstat.events + EXCLUDED.events,
+            capacity = base_eventstat.capacity + EXCLUDED.capacity,
+            registered = base_eventstat.registered + EXCLUDED.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', e."eventType", sign, sign * e.capacity, sign * e.registered_count)
+        ON CONFLICT (dimension, value) DO UPDATE SET
+            events = base_eventstat.events + EXCLUDED.events,
+            capacity = base_eventstat.capacity + EXCLUDED.capacity,
+            registered = base_eventstat.registered + EXCLUDED.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', e.hosted_by, sign, sign * e.capacity, sign * e.registered_count)
+        ON CONFLICT (dimension, value) DO UPDATE SET
+            events = base_eventstat.events + EXCLUDED.events,
+            capacity = base_eventstat.capacity + EXCLUDED.capacity,
+            registered = base_eventstat.registered + EXCLUDED.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', to_char(e.event_start_date AT TIME ZONE 'UTC', 'YYYY-MM-DD'), sign, sign * e.capacity, sign * e.registered_count)
+        ON CONFLICT (dimension, value) DO UPDATE SET
+            events = base_eventstat.events + EXCLUDED.events,
+            capacity = base_eventstat.capacity + EXCLUDED.capacity,
+            registered = base_eventstat.registered + EXCLUDED.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', to_char(e.event_end_date AT TIME ZONE 'UTC', 'YYYY-MM-DD'), sign, sign * e.capacity, sign * e.registered_count)
+        ON CONFLICT (dimension, value) DO UPDATE SET
+            events = base_eventstat.events + EXCLUDED.events,
+            capacity = base_eventstat.capacity + EXCLUDED.capacity,
+            registered = base_eventstat.registered + EXCLUDED.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('duration', CASE
+            WHEN e.event_end_date - e.event_start_date <= interval '1 hours' THEN '1'
+            WHEN e.event_end_date - e.event_start_date <= interval '2 hours' THEN '2'
+            WHEN e.event_end_date - e.event_start_date <= interval '4 hours' THEN '4'
+            WHEN e.event_end_date - e.event_start_date <= interval '8 hours' THEN '8'
+            WHEN e.event_end_date - e.event_start_date <= interval '24 hours' THEN '24'
+            WHEN e.event_end_date - e.event_start_date <= interval '72 hours' THEN '72'
+            WHEN e.event_end_date - e.event_start_date <= interval '168 hours' THEN '168'
+            WHEN e.event_end_date - e.event_start_date <= interval '744 hours' THEN '744'
+            WHEN e.event_end_date - e.event_start_date <= interval '8784 hours' THEN '8784'
+            ELSE 'longer' END, sign, sign * e.capacity, sign * e.registered_count)
+        ON CONFLICT (dimension, value) DO UPDATE SET
+            events = base_eventstat.events + EXCLUDED.events,
+            capacity = base_eventstat.capacity + EXCLUDED.capacity,
+            registered = base_eventstat.registered + EXCLUDED.registered;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION base_eventstat_track() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM base_eventstat_apply(OLD, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM base_eventstat_apply(NEW, 1);
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS base_eventstat_track ON base_event",
+    """
+    CREATE TRIGGER base_eventstat_track
+    AFTER INSERT OR DELETE OR UPDATE OF "eventType", "hosted_by", "capacity", "registered_count", "event_start_date", "event_end_date" ON base_event
+    FOR EACH ROW EXECUTE FUNCTION base_eventstat_track()
+    """,
+]
+
+SQLITE_RECOMPUTE = [
+    "DELETE FROM base_eventstat",
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'total', '', COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e HAVING COUNT(*) > 0
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'type', e.eventType, COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY e.eventType
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'host', e.hosted_by, COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY e.hosted_by
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'start_day', date(e.event_start_date), COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY date(e.event_start_date)
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'end_day', date(e.event_end_date), COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY date(e.event_end_date)
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'duration', CASE
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 1 * 3600 THEN '1'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 2 * 3600 THEN '2'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 4 * 3600 THEN '4'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 8 * 3600 THEN '8'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 24 * 3600 THEN '24'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 72 * 3600 THEN '72'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 168 * 3600 THEN '168'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 744 * 3600 THEN '744'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 8784 * 3600 THEN '8784'
+        ELSE 'longer' END, COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY CASE
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 1 * 3600 THEN '1'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 2 * 3600 THEN '2'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 4 * 3600 THEN '4'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 8 * 3600 THEN '8'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 24 * 3600 THEN '24'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 72 * 3600 THEN '72'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 168 * 3600 THEN '168'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 744 * 3600 THEN '744'
+        WHEN ROUND((julianday(e.event_end_date) - julianday(e.event_start_date)) * 86400) <= 8784 * 3600 THEN '8784'
+        ELSE 'longer' END
+    """,
+]
+
+POSTGRES_RECOMPUTE = [
+    "LOCK TABLE base_event IN SHARE MODE",
+    "DELETE FROM base_eventstat",
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'total', '', COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e HAVING COUNT(*) > 0
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'type', e."eventType", COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY e."eventType"
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'host', e.hosted_by, COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY e.hosted_by
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'start_day', to_char(e.event_start_date AT TIME ZONE 'UTC', 'YYYY-MM-DD'), COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY to_char(e.event_start_date AT TIME ZONE 'UTC', 'YYYY-MM-DD')
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'end_day', to_char(e.event_end_date AT TIME ZONE 'UTC', 'YYYY-MM-DD'), COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY to_char(e.event_end_date AT TIME ZONE 'UTC', 'YYYY-MM-DD')
+    """,
+    """
+    INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+    SELECT 'duration', CASE
+            WHEN e.event_end_date - e.event_start_date <= interval '1 hours' THEN '1'
+            WHEN e.event_end_date - e.event_start_date <= interval '2 hours' THEN '2'
+            WHEN e.event_end_date - e.event_start_date <= interval '4 hours' THEN '4'
+            WHEN e.event_end_date - e.event_start_date <= interval '8 hours' THEN '8'
+            WHEN e.event_end_date - e.event_start_date <= interval '24 hours' THEN '24'
+            WHEN e.event_end_date - e.event_start_date <= interval '72 hours' THEN '72'
+            WHEN e.event_end_date - e.event_start_date <= interval '168 hours' THEN '168'
+            WHEN e.event_end_date - e.event_start_date <= interval '744 hours' THEN '744'
+            WHEN e.event_end_date - e.event_start_date <= interval '8784 hours' THEN '8784'
+            ELSE 'longer' END, COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+    FROM base_event e GROUP BY CASE
+            WHEN e.event_end_date - e.event_start_date <= interval '1 hours' THEN '1'
+            WHEN e.event_end_date - e.event_start_date <= interval '2 hours' THEN '2'
+            WHEN e.event_end_date - e.event_start_date <= interval '4 hours' THEN '4'
+            WHEN e.event_end_date - e.event_start_date <= interval '8 hours' THEN '8'
+            WHEN e.event_end_date - e.event_start_date <= interval '24 hours' THEN '24'
+            WHEN e.event_end_date - e.event_start_date <= interval '72 hours' THEN '72'
+            WHEN e.event_end_date - e.event_start_date <= interval '168 hours' THEN '168'
+            WHEN e.event_end_date - e.event_start_date <= interval '744 hours' THEN '744'
+            WHEN e.event_end_date - e.event_start_date <= interval '8784 hours' THEN '8784'
+            ELSE 'longer' END
+    """,
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS base_eventstat_ai",
+    "DROP TRIGGER IF EXISTS base_eventstat_ad",
+    "DROP TRIGGER IF EXISTS base_eventstat_au",
+]
+
+POSTGRES_DROP = [
+    "DROP TRIGGER IF EXISTS base_eventstat_track ON base_event",
+    "DROP FUNCTION IF EXISTS base_eventstat_track()",
+    "DROP FUNCTION IF EXISTS base_eventstat_apply(base_event, integer)",
+]
+
+
+def _execute(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def reinstall_event_stats(apps, schema_editor):
+    # The SQLite triggers are created IF NOT EXISTS, so drop the old ones
+    # to pick up the duration buckets.
+    vendor = schema_editor.connection.vendor
+    _execute(schema_editor, {'sqlite': SQLITE_DROP, 'postgresql': POSTGRES_DROP}.get(vendor, []))
+    _execute(schema_editor, {'sqlite': SQLITE_TRIGGERS, 'postgresql': POSTGRES_TRIGGERS}.get(vendor, []))
+    _execute(schema_editor, {'sqlite': SQLITE_RECOMPUTE, 'postgresql': POSTGRES_RECOMPUTE}.get(vendor, []))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0010_event_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(reinstall_event_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,172 @@
+from importlib import import_module
+
+from django.db import migrations, models
+
+# The SQL is copied from base.stats as it stood when this migration was
+# written, so later changes to that module cannot rewrite history. Only the
+# update triggers change: a change to registered_count alone is appended to
+# base_eventstatdelta instead of upserting the shared counter rows.
+
+SQLITE_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS base_eventstat_au AFTER UPDATE OF eventType, hosted_by, capacity, event_start_date, event_end_date ON base_event
+    WHEN NOT (old.eventType IS new.eventType AND old.hosted_by IS new.hosted_by AND old.capacity IS new.capacity AND old.event_start_date IS new.event_start_date AND old.event_end_date IS new.event_end_date) BEGIN
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', old.eventType, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', old.hosted_by, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', date(old.event_start_date), -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', date(old.event_end_date), -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('duration', CASE WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 1 * 3600 THEN '1' WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 2 * 3600 THEN '2' WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 4 * 3600 THEN '4' WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 8 * 3600 THEN '8' WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 24 * 3600 THEN '24' WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 72 * 3600 THEN '72' WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 168 * 3600 THEN '168' WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 744 * 3600 THEN '744' WHEN ROUND((julianday(old.event_end_date) - julianday(old.event_start_date)) * 86400) <= 8784 * 3600 THEN '8784' ELSE 'longer' END, -1, -old.capacity, -old.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('total', '', +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('type', new.eventType, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('host', new.hosted_by, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('start_day', date(new.event_start_date), +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('end_day', date(new.event_end_date), +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+        INSERT INTO base_eventstat(dimension, value, events, capacity, registered)
+        VALUES ('duration', CASE WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 1 * 3600 THEN '1' WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 2 * 3600 THEN '2' WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 4 * 3600 THEN '4' WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 8 * 3600 THEN '8' WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 24 * 3600 THEN '24' WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 72 * 3600 THEN '72' WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 168 * 3600 THEN '168' WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 744 * 3600 THEN '744' WHEN ROUND((julianday(new.event_end_date) - julianday(new.event_start_date)) * 86400) <= 8784 * 3600 THEN '8784' ELSE 'longer' END, +1, +new.capacity, +new.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS base_eventstat_ar AFTER UPDATE OF registered_count ON base_event
+    WHEN new.registered_count IS NOT old.registered_count AND old.eventType IS new.eventType AND old.hosted_by IS new.hosted_by AND old.capacity IS new.capacity AND old.event_start_date IS new.event_start_date AND old.event_end_date IS new.event_end_date BEGIN
+        INSERT INTO base_eventstatdelta(eventType, hosted_by, event_start_date, event_end_date, registered_count)
+        VALUES (new.eventType, new.hosted_by, new.event_start_date, new.event_end_date,
+                new.registered_count - old.registered_count);
+    END
+    """,
+]
+
+POSTGRES_TRIGGERS = [
+    """
+    CREATE OR REPLACE FUNCTION base_eventstat_track() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND (OLD."eventType", OLD."hosted_by", OLD."capacity", OLD."event_start_date", OLD."event_end_date")
+                IS NOT DISTINCT FROM (NEW."eventType", NEW."hosted_by", NEW."capacity", NEW."event_start_date", NEW."event_end_date") THEN
+            IF NEW.registered_count IS DISTINCT FROM OLD.registered_count THEN
+                INSERT INTO base_eventstatdelta("eventType", "hosted_by", "event_start_date", "event_end_date", "registered_count")
+                VALUES (NEW."eventType", NEW.hosted_by, NEW.event_start_date, NEW.event_end_date,
+                        NEW.registered_count - OLD.registered_count);
+            END IF;
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM base_eventstat_apply(OLD, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM base_eventstat_apply(NEW, 1);
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS base_eventstat_track ON base_event",
+    """
+    CREATE TRIGGER base_eventstat_track
+    AFTER INSERT OR DELETE OR UPDATE OF "eventType", "hosted_by", "capacity", "event_start_date", "event_end_date", "registered_count" ON base_event
+    FOR EACH ROW EXECUTE FUNCTION base_eventstat_track()
+    """,
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS base_eventstat_au",
+    "DROP TRIGGER IF EXISTS base_eventstat_ar",
+]
+
+
+def _execute(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def install_deltas(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    _execute(schema_editor, {'sqlite': SQLITE_DROP}.get(vendor, []))
+    _execute(schema_editor, {'sqlite': SQLITE_TRIGGERS, 'postgresql': POSTGRES_TRIGGERS}.get(vendor, []))
+
+
+def uninstall_deltas(apps, schema_editor):
+    # Put back the 0011 triggers and rebuild the counters, which folds in
+    # any deltas before the table goes.
+    _execute(schema_editor, {'sqlite': SQLITE_DROP}.get(schema_editor.connection.vendor, []))
+    import_module('base.migrations.0011_event_stats_duration').reinstall_event_stats(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0011_event_stats_duration'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventStatDelta',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('eventType', models.CharField(max_length=50)),
+                ('hosted_by', models.CharField(max_length=100)),
+                ('event_start_date', models.DateTimeField()),
+                ('event_end_date', models.DateTimeField()),
+                ('registered_count', models.IntegerField()),
+            ],
+        ),
+        migrations.RunPython(install_deltas, uninstall_deltas),
+    ]
@@ -1,4 +1,7 @@
 from django.db import models
+from django.db.models import F, Q
+
+from .fields import FullTextField
 
 # Create your models here.
 class Event(models.Model):
@@ -10,15 +13,131 @@ class Event(models.Model):
     eventType = models.CharField(max_length=50)
     location = models.CharField(max_length=200)
     capacity = models.IntegerField()
+    registered_count = models.PositiveIntegerField(default=0)  # maintained by base.registration
     image_url = models.URLField(blank=True, null=True)
     link = models.URLField(blank=True, null=True)
     zoom_link = models.URLField(blank=True, null=True)
     hosted_by = models.CharField(max_length=100)
-    registered_students = models.JSONField(default=list)  # List of student IDs
     event_start_date = models.DateTimeField()
     event_end_date = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True) 
 
+    class Meta:
+        indexes = [
+            # Matches the ``seats_left`` filter used by the full/available views.
+            models.Index(F('capacity') - F('registered_count'), name='event_seats_left_idx'),
+            # One index per list view: the view's filter column(s) first,
+            # then its sort key, ending in the ``eventID`` tiebreaker the
+            # keyset paginator appends.
+            models.Index(fields=['event_start_date', 'event_end_date'], name='event_window_idx'),
+            models.Index(fields=['event_end_date', 'eventID'], name='event_end_idx'),
+            models.Index(fields=['created_at', 'eventID'], name='event_created_idx'),
+            models.Index(fields=['updated_at', 'eventID'], name='event_updated_idx'),
+            models.Index(fields=['eventType', 'event_start_date'], name='event_type_start_idx'),
+            models.Index(fields=['creator_id', 'created_at'], name='event_creator_id_idx'),
+            models.Index(fields=['creator', 'eventID'], name='event_creator_idx'),
+            models.Index(fields=['capacity', 'eventID'], name='event_capacity_idx'),
+            # Partial indexes: only the events that actually carry a link.
+            models.Index(fields=['eventID'], condition=Q(link__gt=''), name='event_link_idx'),
+            models.Index(fields=['eventID'], condition=Q(zoom_link__gt=''), name='event_zoom_link_idx'),
+        ]
+
+    @property
+    def registered_students(self):
+        # Served from ``prefetch_related('registrations')`` when the caller
+        # prefetched them, otherwise read straight off the registration index.
+        if self.pk is None:
+            return []
+        prefetched = getattr(self, '_prefetched_objects_cache', {})
+        if 'registrations' in prefetched:
+            return [r.student_id for r in prefetched['registrations'] if r.status == Registration.REGISTERED]
+        roster = self.registrations.filter(status=Registration.REGISTERED).order_by('registered_at', 'id')
+        return list(roster.values_list('student_id', flat=True))
+
+    def __repr__(self):
+        return f"Event({self.eventID}, {self.title}, {self.creator})"
+
+
+class Registration(models.Model):
+    REGISTERED = 'registered'
+    WAITLISTED = 'waitlisted'
+    STATUS_CHOICES = [(REGISTERED, 'Registered'), (WAITLISTED, 'Waitlisted')]
+
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='registrations')
+    student_id = models.IntegerField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=REGISTERED)
+    registered_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['event', 'student_id'], name='unique_event_student'),
+        ]
+        indexes = [
+            # Serves both the roster and the waitlist in arrival order.
+            models.Index(fields=['event', 'status', 'registered_at'], name='registration_status_idx'),
+            # Reverse lookup: the events one student is registered for.
+            models.Index(fields=['student_id', 'status', 'event'], name='registration_student_idx'),
+        ]
+
+    def __repr__(self):
+        return f"Registration({self.event_id}, {self.student_id}, {self.status})"
+
+
+class EventSearchEntry(models.Model):
+    """
+    Read-only view of the SQLite FTS5 table that ``base.search`` maintains
+    over event titles and descriptions. Joining it from ``Event`` (via
+    ``fts``) keeps searches a single ranked SQL query.
+    """
+
+    event = models.OneToOneField(
+        Event, primary_key=True, db_column='rowid', on_delete=models.DO_NOTHING, related_name='fts'
+    )
+    document = FullTextField(db_column='base_event_fts')
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'base_event_fts'
+
+
+class EventStat(models.Model):
+    """
+    One row of counters per dimension value (see ``base.stats``): the
+    catalogue total, an event type, a host, a UTC start/end day or a duration
+    bucket. Written only by database triggers, ``stats.fold`` and
+    ``stats.recompute``.
+    """
+
+    dimension = models.CharField(max_length=20)
+    value = models.CharField(max_length=200, blank=True)
+    events = models.IntegerField(default=0)
+    capacity = models.BigIntegerField(default=0)
+    registered = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['dimension', 'value'], name='unique_eventstat_dimension_value'),
+        ]
+
+    def __repr__(self):
+        return f"EventStat({self.dimension}, {self.value!r}, {self.events})"
+
+
+class EventStatDelta(models.Model):
+    """
+    A ``registered_count`` change not yet added to ``EventStat``, with the
+    event's dimension columns as they were when it happened. Appended by the
+    update trigger so registrations don't queue on the shared counter rows;
+    ``stats.fold`` moves them into the counters.
+    """
+
+    eventType = models.CharField(max_length=50)
+    hosted_by = models.CharField(max_length=100)
+    event_start_date = models.DateTimeField()
+    event_end_date = models.DateTimeField()
+    registered_count = models.IntegerField()
+
     def __repr__(self):
-        return f"Event({self.eventID}, {self.title}, {self.creator})"
\ No newline at end of file
+        return f"EventStatDelta({self.eventType!r}, {self.hosted_by!r}, {self.registered_count:+d})"
@@ -0,0 +1,212 @@
+"""
+Concurrency-safe registration for events.
+
+Seats are claimed with a conditional ``UPDATE ... SET registered_count =
+registered_count + 1 WHERE registered_count < capacity``, which the database
+applies atomically, so a burst of concurrent registrations can neither lose
+an update nor oversubscribe an event. Students who arrive once the event is
+full are waitlisted and promoted in arrival order when a seat frees up.
+
+Every operation starts by writing the event row, which takes the row lock
+on Postgres and the write lock on SQLite before anything is read, so the
+remaining reads inside the transaction cannot go stale.
+
+``register_many`` and ``unregister_many`` apply a whole class list under
+one lock, with a single ``INSERT`` or ``DELETE`` and one counter update.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, NamedTuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+
+from .invalidation import invalidate_events
+from .models import Event, Registration
+
+
+class RegistrationError(Exception):
+    pass
+
+
+class AlreadyRegistered(RegistrationError):
+    pass
+
+
+class NotRegistered(RegistrationError):
+    pass
+
+
+class BatchRegistration(NamedTuple):
+    added: List[int]
+    waitlisted: List[int]
+    skipped: List[int]
+
+
+class BatchUnregistration(NamedTuple):
+    removed: List[int]
+    skipped: List[int]
+    promoted: List[int]
+
+
+def _unique(student_ids: Iterable[int]) -> List[int]:
+    return list(dict.fromkeys(student_ids))
+
+
+def _lock_event(event_id: int) -> None:
+    if not Event.objects.filter(eventID=event_id).update(updated_at=timezone.now()):
+        raise Event.DoesNotExist(f"Event {event_id} does not exist")
+
+
+def _promote_waitlist(event_id: int) -> List[int]:
+    # Callers must already hold the event lock.
+    capacity, registered = Event.objects.values_list('capacity', 'registered_count').get(eventID=event_id)
+    free = capacity - registered
+    if free <= 0:
+        return []
+    waiting = (
+        Registration.objects.filter(event_id=event_id, status=Registration.WAITLISTED)
+        .order_by('registered_at', 'id')
+        .values_list('pk', 'student_id')[:free]
+    )
+    waiting = list(waiting)
+    if waiting:
+        Registration.objects.filter(pk__in=[pk for pk, _ in waiting]).update(status=Registration.REGISTERED)
+        Event.objects.filter(eventID=event_id).update(registered_count=F('registered_count') + len(waiting))
+        # Queryset updates bypass the post_save signals.
+        invalidate_events()
+    return [student_id for _, student_id in waiting]
+
+
+def register(event_id: int, student_id: int) -> Registration:
+    """
+    Register ``student_id`` for the event, or waitlist them if it is full
+    or anyone is already waiting (as ``register_many`` does).
+
+    Raises ``Event.DoesNotExist`` or ``AlreadyRegistered``.
+    """
+    if Registration.objects.filter(event_id=event_id, student_id=student_id).exists():
+        raise AlreadyRegistered(student_id)
+
+    now = timezone.now()
+    waiting = Registration.objects.filter(event_id=OuterRef('eventID'), status=Registration.WAITLISTED)
+    try:
+        with transaction.atomic():
+            seated = (
+                Event.objects.filter(eventID=event_id, registered_count__lt=F('capacity'))
+                .exclude(Exists(waiting))
+                .update(registered_count=F('registered_count') + 1, updated_at=now)
+            )
+            if not seated:
+                _lock_event(event_id)
+            return Registration.objects.create(
+                event_id=event_id,
+                student_id=student_id,
+                status=Registration.REGISTERED if seated else Registration.WAITLISTED,
+            )
+    except IntegrityError as exc:
+        # Lost a race with a concurrent request for the same student; the
+        # seat claimed above is rolled back together with the insert.
+        raise AlreadyRegistered(student_id) from exc
+
+
+def unregister(event_id: int, student_id: int) -> List[int]:
+    """
+    Remove ``student_id`` from the roster or the waitlist.
+
+    Returns the student IDs promoted off the waitlist into the freed seat.
+    Raises ``Event.DoesNotExist`` or ``NotRegistered``.
+    """
+    with transaction.atomic():
+        _lock_event(event_id)
+        registration = Registration.objects.filter(event_id=event_id, student_id=student_id).first()
+        if registration is None:
+            raise NotRegistered(student_id)
+        registration.delete()
+        if registration.status != Registration.REGISTERED:
+            return []
+        Event.objects.filter(eventID=event_id).update(registered_count=F('registered_count') - 1)
+        return _promote_waitlist(event_id)
+
+
+def register_many(event_id: int, student_ids: Iterable[int]) -> BatchRegistration:
+    """
+    Register a batch of students in one transaction.
+
+    Duplicates in the batch and students already on the roster or waitlist
+    are skipped. Free seats go to the remaining students in the order
+    given; the rest are waitlisted behind anyone already waiting. Raises
+    ``Event.DoesNotExist``.
+    """
+    student_ids = _unique(student_ids)
+    with transaction.atomic():
+        _lock_event(event_id)
+        existing = set(
+            Registration.objects.filter(event_id=event_id, student_id__in=student_ids)
+            .values_list('student_id', flat=True)
+        )
+        new = [student_id for student_id in student_ids if student_id not in existing]
+        capacity, registered = Event.objects.values_list('capacity', 'registered_count').get(eventID=event_id)
+        free = max(capacity - registered, 0)
+        if Registration.objects.filter(event_id=event_id, status=Registration.WAITLISTED).exists():
+            free = 0
+        added, waitlisted = new[:free], new[free:]
+        Registration.objects.bulk_create(
+            [Registration(event_id=event_id, student_id=student_id) for student_id in added]
+            + [Registration(event_id=event_id, student_id=student_id, status=Registration.WAITLISTED)
+               for student_id in waitlisted]
+        )
+        if added:
+            Event.objects.filter(eventID=event_id).update(registered_count=F('registered_count') + len(added))
+        if new:
+            # bulk_create and queryset updates bypass the post_save signals.
+            invalidate_events()
+    return BatchRegistration(added, waitlisted, [s for s in student_ids if s in existing])
+
+
+def unregister_many(event_id: int, student_ids: Iterable[int]) -> BatchUnregistration:
+    """
+    Remove a batch of students from the roster or the waitlist in one
+    transaction, then fill the freed seats from the waitlist. Students who
+    were not registered are skipped. Raises ``Event.DoesNotExist``.
+    """
+    student_ids = _unique(student_ids)
+    with transaction.atomic():
+        _lock_event(event_id)
+        entries = list(
+            Registration.objects.filter(event_id=event_id, student_id__in=student_ids)
+            .values_list('pk', 'student_id', 'status')
+        )
+        removed = {student_id for _, student_id, _ in entries}
+        seated = sum(1 for _, _, status in entries if status == Registration.REGISTERED)
+        promoted: List[int] = []
+        if entries:
+            Registration.objects.filter(pk__in=[pk for pk, _, _ in entries]).delete()
+            if seated:
+                Event.objects.filter(eventID=event_id).update(registered_count=F('registered_count') - seated)
+                promoted = _promote_waitlist(event_id)
+            invalidate_events()
+    return BatchUnregistration(
+        [s for s in student_ids if s in removed],
+        [s for s in student_ids if s not in removed],
+        promoted,
+    )
+
+
+def fill_open_seats(event_id: int) -> List[int]:
+    """Promote waitlisted students into any free seats, e.g. after a capacity increase."""
+    with transaction.atomic():
+        _lock_event(event_id)
+        return _promote_waitlist(event_id)
+
+
+def waitlist_position(registration: Registration) -> int:
+    ahead = Registration.objects.filter(
+        Q(registered_at__lt=registration.registered_at)
+        | Q(registered_at=registration.registered_at, pk__lt=registration.pk),
+        event_id=registration.event_id,
+        status=Registration.WAITLISTED,
+    )
+    return ahead.count() + 1
@@ -0,0 +1,141 @@
+"""
+Full-text search over event titles and descriptions.
+
+* SQLite: an FTS5 external-content table (``base_event_fts``) indexes
+  ``base_event`` and is kept in sync by triggers, so ORM saves, queryset
+  updates, bulk writes and raw SQL are all covered. Results are ranked by
+  bm25 with titles weighted above descriptions.
+* Postgres: a GIN index over a weighted ``tsvector`` expression, queried
+  with ``to_tsquery`` and ranked with ``ts_rank``.
+* Anything else (or an SQLite build without FTS5) falls back to the old
+  ``icontains`` scan.
+
+Every term is prefix-matched, so partial words typed into a search box
+match as the user types. The annotated ``search_rank`` sorts best-first in
+ascending order on every backend.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import List
+
+from django.db import connections, models
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = 'base_event_fts'
+PG_INDEX = 'base_event_search_gin'
+PG_VECTOR = (
+    "(setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B'))"
+)
+
+_SQLITE_INSTALL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description, content='base_event', content_rowid='eventID',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON base_event BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.eventID, new.title, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON base_event BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.eventID, old.title, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description ON base_event BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.eventID, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.eventID, new.title, new.description);
+    END""",
+    # Persist the ranking function: title matches count ten times as much.
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES ('rank', 'bm25(10.0, 1.0)')",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+_SQLITE_TRIGGERS = [f"{FTS_TABLE}_ai", f"{FTS_TABLE}_ad", f"{FTS_TABLE}_au"]
+
+
+def _sqlite_has_fts5(connection) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def install(connection) -> None:
+    """Create (or repair) the search index for ``connection``."""
+    if connection.vendor == 'sqlite':
+        if not _sqlite_has_fts5(connection):
+            return
+        with connection.cursor() as cursor:
+            for statement in _SQLITE_INSTALL:
+                cursor.execute(statement)
+    elif connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {PG_INDEX} ON base_event USING GIN ({PG_VECTOR})")
+    search_backend.cache_clear()
+
+
+def uninstall(connection) -> None:
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            for trigger in _SQLITE_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+        elif connection.vendor == 'postgresql':
+            cursor.execute(f"DROP INDEX IF EXISTS {PG_INDEX}")
+    search_backend.cache_clear()
+
+
+def repair(connection) -> None:
+    """
+    Re-create missing triggers. SQLite migrations that rebuild ``base_event``
+    (copy, drop, rename) silently drop its triggers, so this runs after
+    every ``migrate``.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger') AND name LIKE %s",
+            [f"{FTS_TABLE}%"],
+        )
+        present = {row[0] for row in cursor.fetchall()}
+    if FTS_TABLE in present and not set(_SQLITE_TRIGGERS) <= present:
+        install(connection)
+
+
+@functools.lru_cache(maxsize=None)
+def search_backend(alias: str = 'default'):
+    connection = connections[alias]
+    if connection.vendor == 'postgresql':
+        return 'postgres'
+    if connection.vendor == 'sqlite' and FTS_TABLE in connection.introspection.table_names():
+        return 'fts5'
+    return None
+
+
+def terms(text: str) -> List[str]:
+    return re.findall(r'\w+', (text or '').lower())
+
+
+def search_events(queryset, text: str):
+    """
+    Restrict ``queryset`` to events matching every term in ``text`` and
+    annotate ``search_rank`` (ascending = most relevant).
+    """
+    tokens = terms(text)
+    if not tokens:
+        return queryset.annotate(search_rank=models.Value(0.0))
+
+    backend = search_backend(queryset.db)
+    if backend == 'fts5':
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        return queryset.filter(fts__document__match=match).annotate(search_rank=models.F('fts__rank'))
+    if backend == 'postgres':
+        tsquery = ' & '.join(f'{token}:*' for token in tokens)
+        matches = RawSQL(f"{PG_VECTOR} @@ to_tsquery('english', %s)", [tsquery], output_field=models.BooleanField())
+        rank = RawSQL(f"-ts_rank({PG_VECTOR}, to_tsquery('english', %s))", [tsquery], output_field=models.FloatField())
+        return queryset.filter(matches).annotate(search_rank=rank)
+
+    condition = models.Q(title__icontains=text) | models.Q(description__icontains=text)
+    return queryset.filter(condition).annotate(search_rank=models.Value(0.0))
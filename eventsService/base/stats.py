@@ -0,0 +1,469 @@
+"""
+Materialized event statistics.
+
+``base_eventstat`` holds one row of counters (events, summed capacity,
+summed ``registered_count``) per dimension value: the catalogue total, each
+event type, each host, each UTC day that events start and end on, and each
+duration bucket.
+Database triggers on ``base_event`` keep the rows current. They see ORM
+saves, bulk writes, the queryset updates in ``base.registration`` and raw
+SQL alike, so a dashboard read touches a handful of counter rows instead of
+the whole catalogue.
+
+* SQLite: ``AFTER INSERT/UPDATE/DELETE`` triggers with ``UPSERT``s.
+* Postgres: one PL/pgSQL row trigger doing the same.
+* Anything else: no triggers; readers fall back to querying ``base_event``.
+
+The duration buckets give ``longest_duration``, an upper bound on how long
+any event runs. Calendar queries use it to turn "overlaps the window" into a
+bounded range scan on the start date (see ``api.windows``).
+
+Seats taken and freed change only ``registered_count``, and those updates
+leave the counters alone: the update trigger appends the difference to
+``base_eventstatdelta`` instead. Upserting the shared rows (the catalogue
+total above all) would hold their row locks until commit, so concurrent
+registrations on unrelated events would queue behind each other. ``fold``
+adds the pending deltas into the counters in one short transaction, run
+periodically with ``manage.py recompute_event_stats --fold``. Readers add
+whatever is still pending, so the figures are exact either way.
+``benchmarks/bench_stats.py`` measures the write cost and the contention.
+
+``recompute`` rebuilds the table from scratch. It runs after the migration
+that installs the triggers, and ``manage.py recompute_event_stats`` runs it
+on demand, e.g. from a periodic job as a guard against drift.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db import connections, models, transaction
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+STATS_TABLE = 'base_eventstat'
+DELTA_TABLE = 'base_eventstatdelta'
+
+TOTAL, TYPE, HOST, START_DAY, END_DAY, DURATION = 'total', 'type', 'host', 'start_day', 'end_day', 'duration'
+
+# Upper bounds, in hours, of the duration buckets; longer events are counted
+# under ``LONGER`` and leave durations unbounded.
+DURATION_BUCKETS = (1, 2, 4, 8, 24, 72, 168, 744, 8784)
+LONGER = 'longer'
+
+Counters = Tuple[int, int, int]
+
+
+def _duration_case(within: str) -> str:
+    whens = ' '.join(f"WHEN {within.format(hours=hours)} THEN '{hours}'" for hours in DURATION_BUCKETS)
+    return f"CASE {whens} ELSE '{LONGER}' END"
+
+
+# Whole seconds: julianday() differences carry float noise.
+_SQLITE_DURATION = _duration_case(
+    'ROUND((julianday({{row}}.event_end_date) - julianday({{row}}.event_start_date)) * 86400) <= {hours} * 3600'
+)
+_PG_DURATION = _duration_case("e.event_end_date - e.event_start_date <= interval '{hours} hours'")
+
+# (dimension, SQLite value expression over ``{row}``, Postgres expression over ``e``)
+_DIMENSIONS = [
+    (TOTAL, "''", "''"),
+    (TYPE, '{row}.eventType', 'e."eventType"'),
+    (HOST, '{row}.hosted_by', 'e.hosted_by'),
+    (START_DAY, 'date({row}.event_start_date)', "to_char(e.event_start_date AT TIME ZONE 'UTC', 'YYYY-MM-DD')"),
+    (END_DAY, 'date({row}.event_end_date)', "to_char(e.event_end_date AT TIME ZONE 'UTC', 'YYYY-MM-DD')"),
+    (DURATION, _SQLITE_DURATION, _PG_DURATION),
+]
+# Changing any of these moves an event between counter rows (or changes its
+# capacity), so the update trigger takes it out of the old rows and adds it to
+# the new ones. A change to ``registered_count`` alone is appended to
+# ``DELTA_TABLE`` instead and folded in later by ``fold``.
+_RECOUNTED_COLUMNS = ['eventType', 'hosted_by', 'capacity', 'event_start_date', 'event_end_date']
+_DELTA_COLUMNS = ['eventType', 'hosted_by', 'event_start_date', 'event_end_date', 'registered_count']
+
+
+def _sqlite_upserts(row: str, sign: str) -> str:
+    return '\n'.join(
+        f"""INSERT INTO {STATS_TABLE}(dimension, value, events, capacity, registered)
+        VALUES ('{dimension}', {value.format(row=row)}, {sign}1, {sign}{row}.capacity, {sign}{row}.registered_count)
+        ON CONFLICT(dimension, value) DO UPDATE SET
+            events = events + excluded.events,
+            capacity = capacity + excluded.capacity,
+            registered = registered + excluded.registered;"""
+        for dimension, value, _ in _DIMENSIONS
+    )
+
+
+_SQLITE_UNCHANGED = ' AND '.join(f"old.{column} IS new.{column}" for column in _RECOUNTED_COLUMNS)
+
+_SQLITE_INSTALL = [
+    f"""CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_ai AFTER INSERT ON base_event BEGIN
+        {_sqlite_upserts('new', '+')}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_ad AFTER DELETE ON base_event BEGIN
+        {_sqlite_upserts('old', '-')}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_au AFTER UPDATE OF {', '.join(_RECOUNTED_COLUMNS)} ON base_event
+    WHEN NOT ({_SQLITE_UNCHANGED}) BEGIN
+        {_sqlite_upserts('old', '-')}
+        {_sqlite_upserts('new', '+')}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_ar AFTER UPDATE OF registered_count ON base_event
+    WHEN new.registered_count IS NOT old.registered_count AND {_SQLITE_UNCHANGED} BEGIN
+        INSERT INTO {DELTA_TABLE}({', '.join(_DELTA_COLUMNS)})
+        VALUES (new.eventType, new.hosted_by, new.event_start_date, new.event_end_date,
+                new.registered_count - old.registered_count);
+    END""",
+]
+_SQLITE_TRIGGERS = [f"{STATS_TABLE}_ai", f"{STATS_TABLE}_ad", f"{STATS_TABLE}_au", f"{STATS_TABLE}_ar"]
+
+_PG_BUMPS = '\n'.join(
+    f"""    INSERT INTO {STATS_TABLE}(dimension, value, events, capacity, registered)
+    VALUES ('{dimension}', {value}, sign, sign * e.capacity, sign * e.registered_count)
+    ON CONFLICT (dimension, value) DO UPDATE SET
+        events = {STATS_TABLE}.events + EXCLUDED.events,
+        capacity = {STATS_TABLE}.capacity + EXCLUDED.capacity,
+        registered = {STATS_TABLE}.registered + EXCLUDED.registered;"""
+    for dimension, _, value in _DIMENSIONS
+)
+_PG_INSTALL = [
+    f"""CREATE OR REPLACE FUNCTION {STATS_TABLE}_apply(e base_event, sign integer) RETURNS void AS $$
+    BEGIN
+{_PG_BUMPS}
+    END
+    $$ LANGUAGE plpgsql""",
+    f"""CREATE OR REPLACE FUNCTION {STATS_TABLE}_track() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND ({', '.join(f'OLD."{c}"' for c in _RECOUNTED_COLUMNS)})
+                IS NOT DISTINCT FROM ({', '.join(f'NEW."{c}"' for c in _RECOUNTED_COLUMNS)}) THEN
+            IF NEW.registered_count IS DISTINCT FROM OLD.registered_count THEN
+                INSERT INTO {DELTA_TABLE}({', '.join(f'"{c}"' for c in _DELTA_COLUMNS)})
+                VALUES (NEW."eventType", NEW.hosted_by, NEW.event_start_date, NEW.event_end_date,
+                        NEW.registered_count - OLD.registered_count);
+            END IF;
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM {STATS_TABLE}_apply(OLD, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM {STATS_TABLE}_apply(NEW, 1);
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql""",
+    f"DROP TRIGGER IF EXISTS {STATS_TABLE}_track ON base_event",
+    f"""CREATE TRIGGER {STATS_TABLE}_track
+    AFTER INSERT OR DELETE OR UPDATE OF {', '.join(f'"{c}"' for c in [*_RECOUNTED_COLUMNS, 'registered_count'])} ON base_event
+    FOR EACH ROW EXECUTE FUNCTION {STATS_TABLE}_track()""",
+]
+
+
+def _values(connection) -> List[Tuple[str, str, str]]:
+    """``(dimension, value expression over e, grouping clause)`` for ``connection``."""
+    values = []
+    for dimension, sqlite_value, pg_value in _DIMENSIONS:
+        value = sqlite_value.format(row='e') if connection.vendor == 'sqlite' else pg_value
+        values.append((dimension, value, "HAVING COUNT(*) > 0" if dimension == TOTAL else f"GROUP BY {value}"))
+    return values
+
+
+def tracked(alias: str = 'default') -> bool:
+    """Whether ``alias`` keeps ``base_eventstat`` current with triggers."""
+    return connections[alias].vendor in ('sqlite', 'postgresql')
+
+
+def install(connection) -> None:
+    """Create (or repair) the triggers for ``connection``."""
+    statements = {'sqlite': _SQLITE_INSTALL, 'postgresql': _PG_INSTALL}.get(connection.vendor, [])
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def uninstall(connection) -> None:
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            for trigger in _SQLITE_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        elif connection.vendor == 'postgresql':
+            cursor.execute(f"DROP TRIGGER IF EXISTS {STATS_TABLE}_track ON base_event")
+            cursor.execute(f"DROP FUNCTION IF EXISTS {STATS_TABLE}_track()")
+            cursor.execute(f"DROP FUNCTION IF EXISTS {STATS_TABLE}_apply(base_event, integer)")
+
+
+def repair(connection) -> None:
+    """
+    Re-create missing triggers and rebuild the counters they missed. SQLite
+    migrations that rebuild ``base_event`` drop its triggers, so this runs
+    after every ``migrate``; it leaves a schema migrated back past the
+    delta table to the triggers its migrations installed.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger') AND name LIKE %s",
+            [f"{STATS_TABLE}%"],
+        )
+        present = {row[0] for row in cursor.fetchall()}
+    if {STATS_TABLE, DELTA_TABLE} <= present and not set(_SQLITE_TRIGGERS) <= present:
+        install(connection)
+        recompute(connection.alias)
+
+
+def expected(alias: str = 'default') -> Dict[Tuple[str, str], Counters]:
+    """Every counter row, computed from ``base_event`` directly."""
+    from .models import Event
+
+    events = Event.objects.using(alias)
+    sums = {
+        'n': models.Count('eventID'),
+        'cap': models.Sum('capacity', default=0),
+        'reg': models.Sum('registered_count', default=0),
+    }
+    rows: Dict[Tuple[str, str], Counters] = {}
+    total = events.aggregate(**sums)
+    if total['n']:
+        rows[(TOTAL, '')] = (total['n'], total['cap'], total['reg'])
+    groupings = [(TYPE, models.F('eventType')), (HOST, models.F('hosted_by'))]
+    if connections[alias].vendor == 'sqlite':
+        # Django's SQLite date functions reject text timestamps that SQLite
+        # itself reads, such as '2026-03-01T10:00:00Z' from raw imports, so
+        # group by the triggers' own date() and julianday() expressions.
+        sqlite_values = {dimension: sqlite_value for dimension, sqlite_value, _ in _DIMENSIONS}
+        groupings += [
+            (dimension, RawSQL(sqlite_values[dimension].format(row='base_event'), [], output_field=models.CharField()))
+            for dimension in (START_DAY, END_DAY, DURATION)
+        ]
+    else:
+        duration = models.ExpressionWrapper(
+            models.F('event_end_date') - models.F('event_start_date'), output_field=models.DurationField()
+        )
+        buckets = [
+            models.When(duration__lte=datetime.timedelta(hours=hours), then=models.Value(str(hours)))
+            for hours in DURATION_BUCKETS
+        ]
+        groupings += [
+            (START_DAY, TruncDate('event_start_date', tzinfo=datetime.timezone.utc)),
+            (END_DAY, TruncDate('event_end_date', tzinfo=datetime.timezone.utc)),
+            (DURATION, models.Case(*buckets, default=models.Value(LONGER))),
+        ]
+        events = events.annotate(duration=duration)
+    for dimension, expression in groupings:
+        for row in events.annotate(key=expression).values('key').annotate(**sums).order_by():
+            key = row['key'].isoformat() if isinstance(row['key'], datetime.date) else row['key']
+            rows[(dimension, key)] = (row['n'], row['cap'], row['reg'])
+    return rows
+
+
+def current(alias: str = 'default') -> Dict[Tuple[str, str], Counters]:
+    """The non-empty counter rows as stored, pending deltas included."""
+    from .models import EventStat
+
+    rows = {
+        (dimension, value): (n, cap, reg)
+        for dimension, value, n, cap, reg in EventStat.objects.using(alias).values_list(
+            'dimension', 'value', 'events', 'capacity', 'registered'
+        )
+    }
+    return {key: (n, cap, reg) for key, (n, cap, reg) in _with_pending(rows, alias).items() if n}
+
+
+def pending(alias: str = 'default', dimensions: Optional[List[str]] = None) -> Dict[Tuple[str, str], int]:
+    """
+    The ``registered`` changes waiting in ``DELTA_TABLE``, per counter row,
+    in one query.
+    """
+    connection = connections[alias]
+    if not tracked(alias):
+        return {}
+    selects = [
+        f"SELECT '{dimension}', {value}, SUM(e.registered_count) FROM {DELTA_TABLE} e {grouping}"
+        for dimension, value, grouping in _values(connection)
+        if dimensions is None or dimension in dimensions
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(' UNION ALL '.join(selects))
+        return {(dimension, value): delta for dimension, value, delta in cursor.fetchall() if delta}
+
+
+def _with_pending(rows: Dict[Tuple[str, str], Counters], alias: str, dimensions=None) -> Dict[Tuple[str, str], Counters]:
+    for key, delta in pending(alias, dimensions).items():
+        n, cap, reg = rows.get(key, (0, 0, 0))
+        rows[key] = (n, cap, reg + delta)
+    return rows
+
+
+def fold(alias: str = 'default') -> int:
+    """
+    Add the pending ``registered_count`` deltas to ``base_eventstat`` and
+    delete them; returns how many were folded. Only this short transaction
+    writes the shared rows for a registration, so run it every minute or so
+    (``manage.py recompute_event_stats --fold``).
+    """
+    connection = connections[alias]
+    if not tracked(alias):
+        return 0
+    upserts = [
+        (
+            dimension,
+            f"""INSERT INTO {STATS_TABLE}(dimension, value, events, capacity, registered)
+            SELECT '{dimension}', {value}, 0, 0, SUM(e.registered_count) FROM {{source}} e WHERE true {grouping}
+            ON CONFLICT (dimension, value) DO UPDATE SET registered = {STATS_TABLE}.registered + EXCLUDED.registered""",
+        )
+        for dimension, value, grouping in _values(connection)
+    ]
+    with transaction.atomic(using=alias), connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # One statement: the DELETE sees exactly the rows it moves, so
+            # deltas committed meanwhile wait for the next run.
+            folds = ',\n'.join(f"fold_{dimension} AS ({sql.format(source='moved')})" for dimension, sql in upserts)
+            cursor.execute(
+                f"WITH moved AS (DELETE FROM {DELTA_TABLE} RETURNING *),\n{folds}\nSELECT COUNT(*) FROM moved"
+            )
+            return cursor.fetchone()[0]
+        # SQLite: the transaction holds the write lock, so no delta can land
+        # between the upserts and the DELETE.
+        for _, sql in upserts:
+            cursor.execute(sql.format(source=DELTA_TABLE))
+        cursor.execute(f"DELETE FROM {DELTA_TABLE}")
+        return cursor.rowcount
+
+
+def recompute(alias: str = 'default') -> int:
+    """
+    Rebuild ``base_eventstat`` from ``base_event`` with the same value
+    expressions the triggers use, dropping the pending deltas it supersedes;
+    returns the number of counter rows.
+    """
+    connection = connections[alias]
+    if not tracked(alias):
+        return 0
+    with transaction.atomic(using=alias), connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # Hold off writers so no trigger fires between the read and the swap.
+            cursor.execute("LOCK TABLE base_event IN SHARE MODE")
+        # On SQLite the DELETE takes the write lock before anything is read.
+        cursor.execute(f"DELETE FROM {STATS_TABLE}")
+        cursor.execute(f"DELETE FROM {DELTA_TABLE}")
+        for dimension, value, grouping in _values(connection):
+            cursor.execute(
+                f"""INSERT INTO {STATS_TABLE}(dimension, value, events, capacity, registered)
+                SELECT %s, {value}, COUNT(*), COALESCE(SUM(e.capacity), 0), COALESCE(SUM(e.registered_count), 0)
+                FROM base_event e {grouping}""",
+                [dimension],
+            )
+        cursor.execute(f"SELECT COUNT(*) FROM {STATS_TABLE}")
+        return cursor.fetchone()[0]
+
+
+def longest_duration(alias: str = 'default') -> Optional[datetime.timedelta]:
+    """
+    An upper bound on ``event_end_date - event_start_date`` over every
+    event, from the duration buckets; ``None`` when there is none (an event
+    longer than the last bucket, or no triggers on this backend).
+    """
+    from .models import EventStat
+
+    if not tracked(alias):
+        return None
+    buckets = set(
+        EventStat.objects.using(alias).filter(dimension=DURATION, events__gt=0).values_list('value', flat=True)
+    )
+    if LONGER in buckets:
+        return None
+    return datetime.timedelta(hours=max((int(hours) for hours in buckets), default=0))
+
+
+def _fill_rate(capacity: int, registered: int) -> float:
+    return round(registered / capacity, 4) if capacity else 0.0
+
+
+def _breakdown(rows: Dict[Tuple[str, str], Counters], dimension: str, label: str) -> List[Dict[str, Any]]:
+    entries = [
+        {label: value, 'event_count': n, 'capacity': cap, 'registered': reg, 'fill_rate': _fill_rate(cap, reg)}
+        for (dim, value), (n, cap, reg) in rows.items()
+        if dim == dimension and n
+    ]
+    return sorted(entries, key=lambda entry: (-entry['event_count'], entry[label]))
+
+
+def _total(alias: str):
+    from .models import EventStat
+
+    return EventStat.objects.using(alias).filter(dimension=TOTAL).values_list('events', flat=True)
+
+
+def event_count(alias: str = 'default') -> int:
+    from .models import Event
+
+    if not tracked(alias):
+        return Event.objects.using(alias).count()
+    return _total(alias).first() or 0
+
+
+async def aevent_count(alias: str = 'default') -> int:
+    """``event_count`` for async views."""
+    from .models import Event
+
+    if not tracked(alias):
+        return await Event.objects.using(alias).acount()
+    return await _total(alias).afirst() or 0
+
+
+def _time_split(alias: str) -> Tuple[int, int]:
+    """
+    ``(upcoming, past)`` as the date views define them. Whole days come
+    from the day counters; only today's events are counted in
+    ``base_event``, through the start and end date indexes.
+    """
+    from .models import Event, EventStat
+
+    now = timezone.now()
+    events = Event.objects.using(alias)
+    if not tracked(alias):
+        return events.filter(event_start_date__gte=now).count(), events.filter(event_end_date__lt=now).count()
+
+    midnight = now.astimezone(datetime.timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    today = midnight.date().isoformat()
+    counters = EventStat.objects.using(alias)
+    later_days = counters.filter(dimension=START_DAY, value__gt=today).aggregate(n=models.Sum('events', default=0))
+    earlier_days = counters.filter(dimension=END_DAY, value__lt=today).aggregate(n=models.Sum('events', default=0))
+    upcoming = later_days['n'] + events.filter(
+        event_start_date__gte=now, event_start_date__lt=midnight + datetime.timedelta(days=1)
+    ).count()
+    past = earlier_days['n'] + events.filter(event_end_date__gte=midnight, event_end_date__lt=now).count()
+    return upcoming, past
+
+
+def summary(alias: str = 'default') -> Dict[str, Any]:
+    """Catalogue-wide aggregates for the dashboard."""
+    from .models import EventStat
+
+    if tracked(alias):
+        dimensions = [TOTAL, TYPE, HOST]
+        counters = EventStat.objects.using(alias).filter(dimension__in=dimensions)
+        rows = _with_pending({
+            (dimension, value): (n, cap, reg)
+            for dimension, value, n, cap, reg in counters.values_list(
+                'dimension', 'value', 'events', 'capacity', 'registered'
+            )
+        }, alias, dimensions)
+    else:
+        rows = expected(alias)
+    n, cap, reg = rows.get((TOTAL, ''), (0, 0, 0))
+    upcoming, past = _time_split(alias)
+    return {
+        'event_count': n,
+        'capacity': cap,
+        'registered': reg,
+        'fill_rate': _fill_rate(cap, reg),
+        'upcoming': upcoming,
+        'past': past,
+        'ongoing': max(n - upcoming - past, 0),
+        'by_type': _breakdown(rows, TYPE, 'eventType'),
+        'by_host': _breakdown(rows, HOST, 'hosted_by'),
+    }
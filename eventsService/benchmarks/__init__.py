@@ -0,0 +1,8 @@
+"""
+Standalone benchmarks for the events service.
+
+Each ``bench_*`` module is runnable from the ``eventsService`` directory,
+e.g. ``python -m benchmarks.bench_search --events 100000``. They build a
+throwaway SQLite database (``--db`` to reuse one between runs) so numbers
+never touch ``db.sqlite3``. They are not collected by pytest.
+"""
@@ -0,0 +1,161 @@
+"""
+Throughput and tail latency of the read API under concurrent load: the sync
+views under ASGI and WSGI versus the async views under ASGI.
+
+    python -m benchmarks.bench_asgi --events 10000 --concurrency 1,16,64 --duration 10
+
+Each server is a single ``uvicorn`` worker started as a subprocess with
+``benchmarks.settings``. The load generator is a small asyncio HTTP/1.1
+client that keeps ``--concurrency`` keep-alive connections busy for
+``--duration`` seconds and records the latency of every request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .common import arg_parser, configure, report, seed_events
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+SERVERS = (
+    # label, uvicorn app, extra args, path prefix
+    ("wsgi sync", "eventsService.wsgi:application", ["--interface", "wsgi"], "/api/"),
+    ("asgi sync", "eventsService.asgi:application", [], "/api/"),
+    ("asgi async", "eventsService.asgi:application", [], "/api/async/"),
+)
+ROUTES = (
+    "events/count/",
+    "events/?page_size=50",
+    "events/1/",
+)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app: str, extra: List[str], db_path: str) -> tuple:
+    port = free_port()
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "benchmarks.settings", "EVENTS_BENCH_DB": db_path}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--port", str(port), "--log-level", "warning", "--no-access-log", *extra],
+        cwd=PROJECT_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"uvicorn did not start for {app}")
+
+
+async def _request(reader, writer, raw: bytes) -> int:
+    writer.write(raw)
+    await writer.drain()
+    status_line = await reader.readline()
+    status = int(status_line.split()[1])
+    length, chunked = 0, False
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "transfer-encoding" and "chunked" in value.lower():
+            chunked = True
+    if chunked:
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(length)
+    return status
+
+
+async def _worker(port: int, raw: bytes, stop_at: float, samples: List[float], errors: List[int]) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            status = await _request(reader, writer, raw)
+            samples.append((time.perf_counter() - started) * 1000)
+            if status >= 400:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def load(
+    port: int, path: str, concurrency: int, duration: float, headers: Optional[Dict[str, str]] = None
+) -> Dict[str, float]:
+    extra = "".join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+    raw = f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: keep-alive\r\n{extra}\r\n".encode()
+    samples: List[float] = []
+    errors: List[int] = []
+    # Warm up each connection's worker thread and the query caches.
+    await _worker(port, raw, time.perf_counter() + min(1.0, duration / 5), [], [])
+    stop_at = time.perf_counter() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*(_worker(port, raw, stop_at, samples, errors) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    samples.sort()
+
+    def pct(p: float) -> float:
+        return samples[min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))]
+
+    return {
+        "requests": len(samples),
+        "errors": len(errors),
+        "rps": len(samples) / elapsed,
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+    }
+
+
+def main() -> None:
+    parser = arg_parser(__doc__)
+    parser.add_argument("--events", type=int, default=10000, help="events in the catalogue")
+    parser.add_argument("--concurrency", default="1,16,64", help="comma-separated connection counts")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load per case")
+    args = parser.parse_args()
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    db_path = configure(args.db)
+    seed_events(args.events)
+
+    rows = []
+    for label, app, extra, prefix in SERVERS:
+        process, port = start_server(app, extra, db_path)
+        try:
+            for route in ROUTES:
+                for concurrency in levels:
+                    result = asyncio.run(load(port, prefix + route, concurrency, args.duration))
+                    rows.append({"server": label, "route": route, "conns": concurrency, **result})
+        finally:
+            process.terminate()
+            process.wait()
+    report("Read API under concurrent load", rows, args.json_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Per-request cost of ``ExternalJWTAuthentication``.
+
+    python -m benchmarks.bench_auth --calls 2000
+
+``rebuild`` reproduces the old behaviour (a fresh TokenBackend and a full
+signature check on every request), ``cold`` keeps the shared backend but
+empties the verified-token cache before each call, and ``cached`` is the
+steady state for a client that keeps sending the same token.
+"""
+
+from __future__ import annotations
+
+from .common import arg_parser, configure, measure, report
+
+
+def main() -> None:
+    parser = arg_parser(__doc__)
+    parser.add_argument("--calls", type=int, default=2000, help="authentications per timed iteration")
+    args = parser.parse_args()
+
+    configure(args.db)
+
+    import time
+
+    from rest_framework.test import APIRequestFactory
+
+    from eventsService.authentication import ExternalJWTAuthentication, clear_token_cache, get_token_backend
+
+    token = get_token_backend().encode({"user_id": 42, "role": "STUDENT", "exp": int(time.time()) + 3600})
+    request = APIRequestFactory().get("/api/events/", HTTP_AUTHORIZATION=f"bearer {token}")
+
+    def rebuild():
+        get_token_backend.cache_clear()
+        clear_token_cache()
+        ExternalJWTAuthentication().authenticate(request)
+
+    def cold():
+        clear_token_cache()
+        ExternalJWTAuthentication().authenticate(request)
+
+    def cached():
+        ExternalJWTAuthentication().authenticate(request)
+
+    rows = []
+    for name, fn in (("rebuild", rebuild), ("cold", cold), ("cached", cached)):
+        def batch(fn=fn):
+            for _ in range(args.calls):
+                fn()
+
+        stats = measure(batch, repeat=args.repeat)
+        rows.append({"path": name, "us_per_request": stats["mean_ms"] * 1000 / args.calls, **stats})
+    report(f"JWT authentication, {args.calls} calls per iteration", rows, args.json_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Import throughput: one ``createEvent`` request per event versus the bulk
+endpoints.
+
+    python -m benchmarks.bench_bulk --sizes 100,1000,5000
+
+Every case starts from an empty table and imports the same synthetic term
+calendar through the full request stack (JWT authentication, parsing,
+validation, the write and the response). The bulk update and delete
+timings run against the events the bulk import just created.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from datetime import timedelta
+
+from .common import EVENT_TYPES, HOSTS, LOCATIONS, WORDS, arg_parser, configure, report
+
+
+def calendar(size: int, seed: int = 0):
+    from django.utils import timezone
+
+    rng = random.Random(seed)
+    now = timezone.now()
+    items = []
+    for _ in range(size):
+        start = now + timedelta(hours=rng.randint(0, 24 * 120))
+        items.append({
+            "title": " ".join(rng.choices(WORDS, k=3)).title(),
+            "description": " ".join(rng.choices(WORDS, k=20)),
+            "creator": "registrar@example.com",
+            "eventType": rng.choice(EVENT_TYPES),
+            "location": rng.choice(LOCATIONS),
+            "capacity": rng.choice([10, 25, 50, 100, 300]),
+            "hosted_by": rng.choice(HOSTS),
+            "event_start_date": start.isoformat(),
+            "event_end_date": (start + timedelta(hours=rng.randint(1, 3))).isoformat(),
+        })
+    return items
+
+
+def main() -> None:
+    parser = arg_parser(__doc__)
+    parser.add_argument("--sizes", default="100,1000,5000", help="comma-separated batch sizes")
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    configure(args.db)
+
+    from django.test import Client
+
+    from base.models import Event
+    from eventsService.authentication import get_token_backend
+
+    token = get_token_backend().encode({"user_id": 1, "role": "ADMIN", "exp": int(time.time()) + 3600})
+    client = Client(HTTP_AUTHORIZATION=f"bearer {token}")
+
+    def timed(label, size, fn):
+        started = time.perf_counter()
+        response = fn()
+        elapsed = time.perf_counter() - started
+        return {"events": size, "path": label, "seconds": elapsed, "events_per_s": size / elapsed}, response
+
+    rows = []
+    for size in sizes:
+        items = calendar(size)
+
+        Event.objects.all().delete()
+
+        def one_by_one():
+            for item in items:
+                response = client.post("/api/events/create/", item, content_type="application/json")
+                assert response.status_code == 201, response.content
+        rows.append(timed("createEvent x N", size, one_by_one)[0])
+
+        Event.objects.all().delete()
+        ndjson = "\n".join(json.dumps(item) for item in items)
+        row, response = timed("bulk create (ndjson)", size, lambda: client.post(
+            "/api/events/bulk/create/", ndjson, content_type="application/x-ndjson"))
+        assert response.status_code == 201, response.content
+        rows.append(row)
+
+        Event.objects.all().delete()
+        row, response = timed("bulk create (json)", size, lambda: client.post(
+            "/api/events/bulk/create/", items, content_type="application/json"))
+        assert response.status_code == 201, response.content
+        rows.append(row)
+
+        ids = [result["eventID"] for result in response.json()["results"]]
+        changes = [{"eventID": event_id, "capacity": 500} for event_id in ids]
+        row, response = timed("bulk update (patch)", size, lambda: client.patch(
+            "/api/events/bulk/update/", changes, content_type="application/json"))
+        assert response.status_code == 200, response.content
+        rows.append(row)
+
+        row, response = timed("bulk delete", size, lambda: client.delete(
+            "/api/events/bulk/delete/", ids, content_type="application/json"))
+        assert response.status_code == 200, response.content
+        rows.append(row)
+    report("Event import throughput", rows, args.json_path)
+
+
+if __name__ == "__main__":
+    main()
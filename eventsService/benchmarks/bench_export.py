@@ -0,0 +1,65 @@
+"""
+Peak memory of dumping the catalogue: ``getEvents`` versus the streaming export.
+
+    python -m benchmarks.bench_export --sizes 10000,50000,100000
+
+Peak Python allocations are measured with ``tracemalloc`` while each response
+is produced and consumed; streamed bodies are read chunk by chunk and
+discarded, the way a client writing to disk would.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+from .common import arg_parser, configure, report, seed_events
+
+
+def main() -> None:
+    parser = arg_parser(__doc__)
+    parser.add_argument("--sizes", default="10000,50000,100000", help="comma-separated event counts")
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    configure(args.db)
+
+    from django.test import Client
+
+    from base.models import Event
+
+    client = Client()
+
+    def consume(path):
+        response = client.get(path, {"exclude": ""})
+        if response.streaming:
+            return sum(len(chunk) for chunk in response.streaming_content)
+        return len(response.content)
+
+    rows = []
+    for size in sizes:
+        seed_events(size)
+        assert Event.objects.count() == size, "--db already holds more events than requested"
+        for label, path in (
+            ("getEvents", "/api/events/"),
+            ("export json", "/api/events/export/"),
+            ("export ndjson", "/api/events/export/ndjson/"),
+        ):
+            tracemalloc.start()
+            started = time.perf_counter()
+            nbytes = consume(path)
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            rows.append({
+                "events": size,
+                "path": label,
+                "body_mb": nbytes / 2**20,
+                "peak_mb": peak / 2**20,
+                "seconds": elapsed,
+            })
+    report("Catalogue dump: peak traced memory", rows, args.json_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+JSON rendering and parsing: DRF's stdlib ``JSONRenderer``/``JSONParser``
+versus the orjson-backed ``api.renderers`` classes.
+
+    python -m benchmarks.bench_renderers --events 10000
+
+The payload is the ``getEvents`` list (every field) for ``--events`` rows.
+Each pair of outputs is checked for equivalence before anything is timed.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+
+from .common import arg_parser, configure, measure, report, seed_events
+
+
+def main() -> None:
+    parser = arg_parser(__doc__)
+    parser.add_argument("--events", type=int, default=10_000)
+    args = parser.parse_args()
+
+    configure(args.db)
+    seed_events(args.events)
+
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from api import fastpath, renderers
+    from api.fieldsets import ALL_FIELDS, LIST_FIELDS
+    from base.models import Event
+
+    if renderers.orjson is None:
+        print("orjson is not installed; FastJSONRenderer is using the stdlib fallback")
+
+    rows = []
+    for label, fields in (("compact", LIST_FIELDS), ("all", ALL_FIELDS)):
+        queryset = Event.objects.order_by("event_end_date", "eventID")[: args.events]
+        data = fastpath.represent(fastpath.event_rows(queryset, fields, []), fields)
+        body = JSONRenderer().render(data)
+        assert renderers.FastJSONRenderer().render(data) == body
+        assert renderers.FastJSONParser().parse(BytesIO(body)) == JSONParser().parse(BytesIO(body))
+        megabytes = len(body) / 2**20
+
+        cases = (
+            ("render", "JSONRenderer", lambda: JSONRenderer().render(data)),
+            ("render", "FastJSONRenderer", lambda: renderers.FastJSONRenderer().render(data)),
+            ("parse", "JSONParser", lambda: JSONParser().parse(BytesIO(body))),
+            ("parse", "FastJSONParser", lambda: renderers.FastJSONParser().parse(BytesIO(body))),
+        )
+        for op, name, fn in cases:
+            stats = measure(fn, repeat=args.repeat)
+            rows.append({"fields": label, "op": op, "class": name, **stats, "mb_per_s": megabytes / (stats["mean_ms"] / 1000)})
+    report(f"JSON render/parse, {args.events} events", rows, args.json_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Search latency: FTS5 index (``base.search``) versus the old ``icontains`` scan.
+
+    python -m benchmarks.bench_search --events 100000
+
+Both paths fetch the first page of 50 results the way ``searchEvents`` does.
+"""
+
+from __future__ import annotations
+
+from .common import arg_parser, configure, measure, report, seed_events
+
+# Common title word, two-word phrase, prefix of a common word, a mid-frequency
+# and a rare description word, and a miss.
+QUERIES = ["robotics", "data science", "mach", "beltika", "kasagal", "zzz-no-match"]
+
+
+def main() -> None:
+    parser = arg_parser(__doc__)
+    parser.add_argument("--events", type=int, default=100_000)
+    args = parser.parse_args()
+
+    configure(args.db)
+    seed_events(args.events)
+
+    from django.db.models import Q
+
+    from base.models import Event
+    from base.search import search_backend, search_events
+
+    def icontains(q):
+        condition = Q(title__icontains=q) | Q(description__icontains=q)
+        return list(Event.objects.filter(condition).order_by("eventID")[:51])
+
+    def indexed(q):
+        return list(search_events(Event.objects.all(), q).order_by("search_rank", "eventID")[:51])
+
+    rows = []
+    for q in QUERIES:
+        for name, fn in (("icontains", icontains), (search_backend() or "fallback", indexed)):
+            stats = measure(lambda: fn(q), repeat=args.repeat)
+            rows.append({"query": q, "path": name, **stats})
+    report(f"searchEvents first page, {Event.objects.count()} events", rows, args.json_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+List serialization: ``EventSerializer(many=True)`` versus ``api.fastpath``.
+
+    python -m benchmarks.bench_serializers --sizes 1000,10000,100000
+
+Each case fetches the first ``size`` events ordered like ``getEvents`` and
+renders them to JSON, for both the compact list fieldset and every field.
+"""
+
+from __future__ import annotations
+
+from .common import arg_parser, configure, measure, report, seed_events
+
+
+def main() -> None:
+    parser = arg_parser(__doc__)
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated row counts")
+    parser.set_defaults(repeat=5)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    configure(args.db)
+    seed_events(max(sizes))
+
+    from rest_framework.renderers import JSONRenderer
+
+    from api import fastpath
+    from api.fieldsets import ALL_FIELDS, LIST_FIELDS
+    from api.serializers import EventSerializer
+    from base.models import Event
+
+    ordering = ["event_end_date", "eventID"]
+    renderer = JSONRenderer()
+
+    def drf(size, fields):
+        queryset = Event.objects.order_by(*ordering)[:size]
+        if fastpath.ROSTER in fields:
+            queryset = queryset.prefetch_related("registrations")
+        return renderer.render(EventSerializer(queryset, many=True, fields=fields).data)
+
+    def fast(size, fields):
+        rows = fastpath.event_rows(Event.objects.order_by(*ordering), fields, ordering)[:size]
+        return renderer.render(fastpath.represent(rows, fields))
+
+    rows = []
+    for size in sizes:
+        for label, fields in (("compact", LIST_FIELDS), ("all", ALL_FIELDS)):
+            for path, fn in (("serializer", drf), ("fastpath", fast)):
+                stats = measure(lambda: fn(size, fields), repeat=args.repeat, warmup=1)
+                rows.append({"events": size, "fields": label, "path": path, **stats})
+    report("Event list serialization + JSON render", rows, args.json_path)
+
+
+if __name__ == "__main__":
+    main()
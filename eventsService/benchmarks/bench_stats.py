@@ -0,0 +1,215 @@
+"""
+Write cost of the event statistics triggers (``base.stats``) on the
+registration path.
+
+    python -m benchmarks.bench_stats --events 10000 --repeat 500
+    python -m benchmarks.bench_stats --database-url postgres://localhost/events_bench --writers 1,8,32
+
+Every seat taken or freed changes ``registered_count``, which fires the
+update trigger: it appends one ``base_eventstatdelta`` row rather than
+upserting the shared counters (``fold`` does that later). Each operation is
+timed with the
+triggers installed and with them dropped, on the same catalogue, through
+``base.registration`` (the conditional seat claim, the roster row and the
+waitlist check, each in its own transaction). The last case runs the bare
+``registered_count`` update 100 times inside one open transaction, which
+isolates the triggers' own work from the commit and the ORM. The triggers
+are put back afterwards.
+
+The contention cases then start ``--writers`` threads, each with its own
+connection, that take and free seats on *different* events for
+``--seconds``. Nothing the application locks is shared between them; only
+the statistics are, so the throughput with the triggers on, against the
+same run with them off, shows how much the counters serialize concurrent
+registrations, and the stall case times one registration while another
+event's registration is held open: if the two share a locked counter row,
+the second waits out the first. Last, the deltas the run left behind are
+folded once. Run it on Postgres (``--database-url``, a scratch database:
+the catalogue is topped up in place); SQLite serializes every writer on the
+database lock whatever the triggers do.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from typing import Dict, List
+
+from .common import arg_parser, configure, measure, report, seed_events, summarize
+
+HOLD = 0.2  # seconds the stall case keeps its first registration uncommitted
+BUMP = "UPDATE base_event SET registered_count = registered_count + 1 WHERE \"eventID\" = %s"
+
+
+def main() -> None:
+    parser = arg_parser(__doc__)
+    parser.add_argument("--events", type=int, default=10000, help="events in the catalogue")
+    parser.add_argument("--batch", type=int, default=50, help="students per register_many call")
+    parser.add_argument("--writers", default="1,8,32", help="comma-separated concurrent writer counts")
+    parser.add_argument("--seconds", type=float, default=3.0, help="duration of each contention case")
+    parser.add_argument("--database-url", help="benchmark this database (e.g. a scratch Postgres) instead of SQLite")
+    args = parser.parse_args()
+    writer_counts = [int(n) for n in args.writers.split(",")]
+
+    configure(args.db, args.database_url)
+    seed_events(args.events)
+
+    from django.db import connection, transaction
+
+    from base import registration, stats
+    from base.models import Event, EventStatDelta
+
+    event = Event.objects.order_by("eventID").first()
+    # Never full, so every registration takes a seat and fires the trigger.
+    Event.objects.filter(pk=event.pk).update(capacity=10 ** 9)
+    students = itertools.count(10 ** 6)
+
+    def register_cycle() -> Dict[str, Dict[str, float]]:
+        seated: List[int] = []
+
+        def register():
+            student_id = next(students)
+            registration.register(event.pk, student_id)
+            seated.append(student_id)
+
+        def unregister():
+            registration.unregister(event.pk, seated.pop())
+
+        def bump():
+            with connection.cursor() as cursor:
+                for _ in range(100):
+                    cursor.execute(BUMP, [event.pk])
+
+        def register_many():
+            batch = [next(students) for _ in range(args.batch)]
+            registration.register_many(event.pk, batch)
+            registration.unregister_many(event.pk, batch)
+
+        timings = {"register": measure(register, repeat=args.repeat)}
+        # One unregister per registration made above, warm-up included.
+        timings["unregister"] = measure(unregister, repeat=args.repeat)
+        timings[f"register_many + unregister_many ({args.batch})"] = measure(register_many, repeat=args.repeat // 10 or 1)
+        # The counter update alone, inside one open transaction: the
+        # trigger's own work without the commit that dominates the above.
+        with transaction.atomic():
+            timings["100 x registered_count update, no commit"] = measure(bump, repeat=args.repeat // 10 or 1)
+            transaction.set_rollback(True)
+        return timings
+
+    def contend(writers: int) -> Dict[str, float]:
+        """Seats taken and freed by ``writers`` threads, one event each."""
+        barrier = threading.Barrier(writers)
+        samples: List[float] = []
+        errors: List[BaseException] = []
+
+        def writer(event_id: int) -> None:
+            own = itertools.count(10 ** 6)  # each writer has its event to itself
+            timings = []
+            try:
+                barrier.wait()
+                deadline = time.perf_counter() + args.seconds
+                while time.perf_counter() < deadline:
+                    student_id = next(own)
+                    for step in (registration.register, registration.unregister):
+                        started = time.perf_counter()
+                        step(event_id, student_id)
+                        timings.append((time.perf_counter() - started) * 1000)
+            except BaseException as exc:  # reported, not raised, so the run still finishes
+                errors.append(exc)
+            finally:
+                samples.extend(timings)
+                connection.close()
+
+        threads = [threading.Thread(target=writer, args=(pk,)) for pk in contended[:writers]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise RuntimeError(f"{len(errors)} writer(s) failed: {errors[0]!r}")
+        return {"ops_per_s": len(samples) / args.seconds, **summarize(samples)}
+
+    def stalled() -> Dict[str, float]:
+        """A registration timed while another event's is held uncommitted for HOLD seconds."""
+        holder_event, event_id = contended[0], contended[-1]
+        samples: List[float] = []
+        for student_id in range(10 ** 8, 10 ** 8 + 5):
+            holding = threading.Event()
+
+            def holder() -> None:
+                try:
+                    with transaction.atomic():
+                        registration.register(holder_event, student_id)
+                        holding.set()
+                        time.sleep(HOLD)
+                        transaction.set_rollback(True)
+                finally:
+                    holding.set()
+                    connection.close()
+
+            thread = threading.Thread(target=holder)
+            thread.start()
+            holding.wait()
+            started = time.perf_counter()
+            registration.register(event_id, student_id)
+            samples.append((time.perf_counter() - started) * 1000)
+            thread.join()
+            registration.unregister(event_id, student_id)
+        return summarize(samples)
+
+    contended = list(Event.objects.order_by("-eventID").values_list("pk", flat=True)[:max(writer_counts)])
+    Event.objects.filter(pk__in=contended).update(capacity=10 ** 9)
+
+    register_cycle()  # warm-up: the first pass pays for page cache and WAL growth
+    stats.uninstall(connection)
+    without = register_cycle()
+    contention_without = {n: contend(n) for n in writer_counts}
+    stall_without = stalled()
+    stats.install(connection)
+    stats.recompute()
+    with_triggers = register_cycle()
+    contention_with = {n: contend(n) for n in writer_counts}
+    stall_with = stalled()
+    assert stats.current() == stats.expected(), "counters drifted during the benchmark"
+    deltas = EventStatDelta.objects.count()
+    started = time.perf_counter()
+    stats.fold()
+    folded = [{"deltas": deltas, "fold_ms": (time.perf_counter() - started) * 1000}]
+    assert stats.current() == stats.expected(), "counters drifted while folding"
+
+    rows = []
+    for operation, baseline in without.items():
+        timed = with_triggers[operation]
+        for label, result in (("off", baseline), ("on", timed)):
+            rows.append({
+                "operation": operation, "triggers": label,
+                "mean_ms": result["mean_ms"], "p50_ms": result["p50_ms"], "p95_ms": result["p95_ms"],
+                "overhead_ms": result["mean_ms"] - baseline["mean_ms"],
+            })
+    contention = []
+    for writers in writer_counts:
+        baseline = contention_without[writers]
+        for label, result in (("off", baseline), ("on", contention_with[writers])):
+            contention.append({
+                "writers": writers, "triggers": label, "ops_per_s": result["ops_per_s"],
+                "p50_ms": result["p50_ms"], "p95_ms": result["p95_ms"], "p99_ms": result["p99_ms"],
+                "throughput": result["ops_per_s"] / baseline["ops_per_s"],
+            })
+    stall = [
+        {"triggers": label, "mean_ms": result["mean_ms"], "max_ms": result["p99_ms"]}
+        for label, result in (("off", stall_without), ("on", stall_with))
+    ]
+    vendor = connection.vendor
+    report(f"Statistics triggers on registration ({args.events} events, {vendor})", rows)
+    report(f"Registration while another event's is uncommitted for {HOLD * 1000:g} ms ({vendor})", stall)
+    report(f"Folding the registration deltas left by the run ({vendor})", folded)
+    report(
+        f"Concurrent registrations on distinct events ({vendor}, {args.seconds:g}s per case)",
+        contention, args.json_path,
+        meta={"vendor": vendor, "events": args.events, "sequential": rows, "stall": stall, "fold": folded},
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Shared plumbing for the benchmark scripts: Django setup, data and timing."""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+WORDS = (
+    "machine learning data science robotics seminar workshop career fair music art "
+    "history physics chemistry biology startup design ethics security cloud quantum "
+    "networking research poetry film theatre finance marketing health wellness yoga "
+    "chess hackathon volunteering sustainability climate policy law medicine"
+).split()
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "zen", "quar", "bel", "dor", "fin", "gal", "hex"]
+EVENT_TYPES = ["Workshop", "Seminar", "Social", "Class", "Conference", "Meetup"]
+HOSTS = ["CS Department", "Math Dept", "AI Lab", "Student Union", "Career Center", "Library"]
+LOCATIONS = ["Campus Center", "Worcester Hall", "Library", "Online via Zoom", "Downtown", "Rec Center"]
+
+
+def vocabulary(size: int = 5000) -> List[str]:
+    """Deterministic pseudo-words; sampled with Zipf weights to mimic prose."""
+    words = []
+    n = len(SYLLABLES)
+    for i in range(size):
+        parts, k = [], i
+        for _ in range(3):
+            parts.append(SYLLABLES[k % n])
+            k //= n
+        words.append("".join(parts) + str(i // (n ** 3) or ""))
+    return words
+
+
+def arg_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--db", help="SQLite file to use (created if missing); defaults to a temp file")
+    parser.add_argument("--repeat", type=int, default=30, help="timed iterations per case")
+    parser.add_argument("--json", dest="json_path", help="also write results to this JSON file")
+    return parser
+
+
+def configure(db_path: Optional[str] = None, database_url: Optional[str] = None) -> str:
+    """
+    Point Django at a scratch SQLite database and migrate it.
+
+    ``database_url`` (an ``EVENTS_DATABASE_URL``, e.g. a throwaway Postgres
+    database) replaces the SQLite file; it is only ever taken from the
+    command line, never from the environment the benchmark runs in.
+    """
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "eventsService.settings")
+    # Keep per-request log lines out of the timings and the report.
+    os.environ.setdefault("EVENTS_LOG_LEVEL", "WARNING")
+
+    import django
+    from django.conf import settings
+
+    # Before setup: the apps open the default connection while loading.
+    if database_url:
+        from eventsService import database
+
+        settings.DATABASES["default"].update(database.config({"EVENTS_DATABASE_URL": database_url}))
+        db_path = settings.DATABASES["default"]["NAME"]
+    else:
+        db_path = db_path or os.path.join(tempfile.mkdtemp(prefix="events-bench-"), "bench.sqlite3")
+        settings.DATABASES["default"]["NAME"] = db_path
+    django.setup()
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver", "localhost", "127.0.0.1"]
+    # Measure the views, not the response cache.
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+    if settings.DATABASES["default"]["ENGINE"].endswith("sqlite3"):
+        # What a deployment opts into with `manage.py set_journal_mode`.
+        call_command("set_journal_mode", stdout=io.StringIO())
+    return db_path
+
+
+def seed_events(count: int, seed: int = 0, batch_size: int = 2000) -> int:
+    """Top the events table up to ``count`` rows of synthetic data."""
+    from django.utils import timezone
+
+    from base.models import Event
+
+    existing = Event.objects.count()
+    rng = random.Random(seed + existing)
+    filler = vocabulary()
+    weights = [1 / rank for rank in range(1, len(filler) + 1)]
+    now = timezone.now()
+    batch: List[Event] = []
+    for _ in range(existing, count):
+        start = now + timedelta(hours=rng.randint(-24 * 365, 24 * 365))
+        batch.append(
+            Event(
+                creator_id=rng.randint(1, 500),
+                title=" ".join(rng.choices(WORDS, k=3)).title(),
+                description=" ".join(
+                    rng.choices(filler, weights=weights, k=rng.randint(10, 60)) + rng.choices(WORDS, k=2)
+                ),
+                creator=f"user{rng.randint(1, 500)}@example.com",
+                eventType=rng.choice(EVENT_TYPES),
+                location=rng.choice(LOCATIONS),
+                capacity=rng.choice([10, 25, 50, 100, 300]),
+                hosted_by=rng.choice(HOSTS),
+                event_start_date=start,
+                event_end_date=start + timedelta(hours=rng.randint(1, 6)),
+            )
+        )
+        if len(batch) >= batch_size:
+            Event.objects.bulk_create(batch)
+            batch = []
+    Event.objects.bulk_create(batch)
+    return count - existing
+
+
+def measure(fn: Callable[[], object], repeat: int = 30, warmup: int = 3) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Mean and percentiles of a list of millisecond timings."""
+    samples = sorted(samples)
+
+    def pct(p: float) -> float:
+        return samples[min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))]
+
+    return {
+        "n": len(samples),
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+    }
+
+
+def report(
+    title: str,
+    rows: Iterable[Dict[str, object]],
+    json_path: Optional[str] = None,
+    meta: Optional[Dict[str, object]] = None,
+) -> List[Dict[str, object]]:
+    rows = list(rows)
+    print(f"\n{title}")
+    if rows:
+        columns = list(rows[0])
+        widths = {c: max(len(c), *(len(_fmt(r[c])) for r in rows)) for c in columns}
+        print("  ".join(c.ljust(widths[c]) for c in columns))
+        for row in rows:
+            print("  ".join(_fmt(row[c]).ljust(widths[c]) for c in columns))
+    if json_path:
+        with open(json_path, "w") as fh:
+            payload = {"benchmark": title, **({"meta": meta} if meta else {}), "results": rows}
+            json.dump(payload, fh, indent=2)
+    return rows
+
+
+def _fmt(value: object) -> str:
+    return f"{value:.3f}" if isinstance(value, float) else str(value)
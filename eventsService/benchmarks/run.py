@@ -0,0 +1,239 @@
+"""
+Endpoint benchmark runner: throughput and p50/p95/p99 latency of the main
+routes, on a synthetic catalogue from ``manage.py generate_events``, through
+the Django test client and through ``uvicorn``.
+
+    python -m benchmarks.run --events 100000 --json results/$(git rev-parse --short HEAD).json
+    python -m benchmarks.run --compare results/abc1234.json results/def5678.json
+
+``--clients`` picks the paths: ``test`` calls the views in-process (no
+network, one request at a time; its rps is 1000 / mean latency), while
+``wsgi`` and ``asgi`` start a single ``uvicorn`` worker and keep
+``--concurrency`` connections busy for ``--duration`` seconds. Without
+``--db`` the catalogue is generated in a temporary database. A ``--db`` that
+is empty is filled, one holding ``--events`` events is reused, and one
+holding a different number is left alone unless ``--reset`` allows
+clearing and regenerating it. The JSON output records the commit, versions and dataset next to
+the results, so two files can be compared with ``--compare``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import platform
+import subprocess
+import time
+from typing import Dict, List, Optional
+
+from .bench_asgi import PROJECT_DIR, load, start_server
+from .common import arg_parser, configure, measure, report
+
+# route name, URL kwargs, query string. "busiest" is replaced by the event
+# with the largest roster, or the student with the most registrations.
+CASES = (
+    ("getEventCount", {}, {}),
+    ("getEventStats", {}, {}),
+    ("getEvents", {}, {"page_size": 50}),
+    ("getEvent", {"eventID": "busiest"}, {}),
+    ("getRegisteredStudents", {"eventID": "busiest"}, {}),
+    ("getUpcomingEvents", {}, {"page_size": 50}),
+    ("getEventsByType", {"eventType": "Workshop"}, {"page_size": 50}),
+    ("getAvailableEvents", {}, {"page_size": 50}),
+    ("getEventsByMultipleFilters", {}, {"eventType": "Seminar", "when": "upcoming", "availability": "available",
+                                        "sort": "event_start_date", "page_size": 50}),
+    ("searchEvents", {}, {"q": "robotics", "page_size": 50}),
+    ("getCalendar", {}, {"view": "month", "events": "false"}),
+    ("getStudentEvents", {"student_id": "busiest"}, {}),
+)
+SERVERS = {
+    "wsgi": ("eventsService.wsgi:application", ["--interface", "wsgi"]),
+    "asgi": ("eventsService.asgi:application", []),
+}
+
+
+def git_revision() -> Dict[str, object]:
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    try:
+        return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+class DatasetError(Exception):
+    """Raised when ``--db`` holds another catalogue and may not be cleared."""
+
+
+def prepare_dataset(events: int, seed: int, reset: bool = False) -> Dict[str, object]:
+    """
+    Make the database hold ``events`` generated events. An existing
+    catalogue of another size is only cleared when ``reset`` is true.
+    """
+    from django.core.management import call_command
+
+    from base.models import Event, Registration
+
+    existing = Event.objects.count()
+    generated = existing != events
+    if generated:
+        if existing and not reset:
+            raise DatasetError(
+                f"--db holds {existing} events, not {events}; pass --reset to clear and regenerate it"
+            )
+        call_command("generate_events", events=events, seed=seed, clear=bool(existing), verbosity=0)
+    return {
+        "events": events,
+        "registrations": Registration.objects.count(),
+        "seed": seed if generated else None,
+        "generated": generated,
+    }
+
+
+def resolve_paths() -> List[tuple]:
+    from django.db.models import Count
+    from django.urls import reverse
+    from django.utils.http import urlencode
+
+    from base.models import Event, Registration
+
+    busiest = {
+        "eventID": Event.objects.order_by("-registered_count", "eventID").values_list("eventID", flat=True).first(),
+        "student_id": (
+            Registration.objects.values("student_id").annotate(n=Count("id")).order_by("-n", "student_id")
+            .values_list("student_id", flat=True).first()
+        ),
+    }
+    paths = []
+    for name, kwargs, params in CASES:
+        kwargs = {key: busiest[key] if value == "busiest" else value for key, value in kwargs.items()}
+        query = f"?{urlencode(params)}" if params else ""
+        paths.append((name, reverse(name, kwargs=kwargs) + query))
+    return paths
+
+
+def token() -> str:
+    from eventsService.authentication import get_token_backend
+
+    return get_token_backend().encode({"user_id": 1, "role": "ADMIN", "exp": int(time.time()) + 24 * 3600})
+
+
+def run_test_client(paths: List[tuple], bearer: str, repeat: int) -> List[Dict[str, object]]:
+    from django.test import Client
+
+    client = Client(HTTP_AUTHORIZATION=f"bearer {bearer}")
+    rows = []
+    for name, path in paths:
+        status = client.get(path).status_code
+        if status >= 400:
+            rows.append({"client": "test", "route": name, "requests": 0, "errors": 1, "rps": 0.0,
+                         "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0})
+            continue
+        timings = measure(lambda: client.get(path), repeat=repeat)
+        rows.append({
+            "client": "test", "route": name, "requests": timings["n"], "errors": 0,
+            "rps": 1000 / timings["mean_ms"],
+            "p50_ms": timings["p50_ms"], "p95_ms": timings["p95_ms"], "p99_ms": timings["p99_ms"],
+        })
+    return rows
+
+
+def run_server(kind: str, db_path: str, paths: List[tuple], bearer: str, concurrency: int,
+               duration: float) -> List[Dict[str, object]]:
+    app, extra = SERVERS[kind]
+    process, port = start_server(app, extra, db_path)
+    rows = []
+    try:
+        for name, path in paths:
+            result = asyncio.run(load(port, path, concurrency, duration, {"Authorization": f"bearer {bearer}"}))
+            rows.append({"client": kind, "route": name, **result})
+    finally:
+        process.terminate()
+        process.wait()
+    return rows
+
+
+def compare(before_path: str, after_path: str) -> None:
+    with open(before_path) as fh:
+        before = json.load(fh)
+    with open(after_path) as fh:
+        after = json.load(fh)
+    baseline = {(row["client"], row["route"]): row for row in before["results"]}
+
+    def change(old: float, new: float) -> str:
+        return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+    rows = []
+    for row in after["results"]:
+        old = baseline.get((row["client"], row["route"]))
+        if old is None:
+            continue
+        rows.append({
+            "client": row["client"], "route": row["route"],
+            "rps_before": old["rps"], "rps_after": row["rps"], "rps_change": change(old["rps"], row["rps"]),
+            "p95_before": old["p95_ms"], "p95_after": row["p95_ms"],
+            "p95_change": change(old["p95_ms"], row["p95_ms"]),
+        })
+    revisions = [data.get("meta", {}).get("commit") or "?" for data in (before, after)]
+    report(f"Endpoint benchmark: {revisions[0][:10]} -> {revisions[1][:10]}", rows)
+
+
+def main() -> None:
+    parser = arg_parser(__doc__)
+    parser.add_argument("--events", type=int, default=10000, help="events in the catalogue")
+    parser.add_argument("--seed", type=int, default=0, help="generate_events seed")
+    parser.add_argument("--clients", default="test,asgi", help="comma-separated: test, wsgi, asgi")
+    parser.add_argument("--concurrency", type=int, default=16, help="connections per uvicorn case")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds of load per uvicorn case")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two JSON result files")
+    parser.add_argument("--reset", action="store_true",
+                        help="clear and regenerate a --db that holds a different number of events")
+    args = parser.parse_args()
+    if args.compare:
+        compare(*args.compare)
+        return
+    clients = [client.strip() for client in args.clients.split(",") if client.strip()]
+    unknown = set(clients) - {"test", *SERVERS}
+    if unknown:
+        parser.error(f"unknown clients: {', '.join(sorted(unknown))}")
+
+    db_path = configure(args.db)
+    try:
+        # The temporary database is ours to clear; a --db only with --reset.
+        dataset = prepare_dataset(args.events, args.seed, reset=args.reset or not args.db)
+    except DatasetError as exc:
+        parser.error(str(exc))
+    paths = resolve_paths()
+    bearer = token()
+
+    import django
+    from django.db import connection
+
+    rows: List[Dict[str, object]] = []
+    for client in clients:
+        if client == "test":
+            rows.extend(run_test_client(paths, bearer, args.repeat))
+        else:
+            rows.extend(run_server(client, db_path, paths, bearer, args.concurrency, args.duration))
+
+    database = connection.vendor
+    if database == "sqlite":
+        database += f" {connection.Database.sqlite_version}"
+    meta: Dict[str, Optional[object]] = {
+        **git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": database,
+        "machine": platform.machine(),
+        "dataset": dataset,
+        "settings": {"repeat": args.repeat, "concurrency": args.concurrency, "duration": args.duration},
+    }
+    report(f"Endpoints on {args.events} events", rows, args.json_path, meta)
+
+
+if __name__ == "__main__":
+    main()
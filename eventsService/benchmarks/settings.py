@@ -0,0 +1,18 @@
+"""
+Settings for benchmark servers started as subprocesses (see ``bench_asgi``).
+
+Mirrors what ``common.configure`` does in-process: the database comes from
+``EVENTS_BENCH_DB``, the response cache is disabled and request logging is
+kept off stdout.
+"""
+
+import os
+
+from eventsService.settings import *  # noqa: F401,F403
+from eventsService.settings import ALLOWED_HOSTS, DATABASES, LOGGING
+
+DEBUG = False
+ALLOWED_HOSTS = [*ALLOWED_HOSTS, "testserver", "localhost", "127.0.0.1"]
+DATABASES = {"default": {**DATABASES["default"], "NAME": os.environ["EVENTS_BENCH_DB"]}}
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+LOGGING = {**LOGGING, "loggers": {name: {**logger, "level": "ERROR"} for name, logger in LOGGING["loggers"].items()}}
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.request import Request
@@ -34,23 +42,88 @@ class ExternalJWTUser:
         return f"ExternalJWTUser(id={self.id}, email={self.email}, username={self.username}, role={self.role})"
 
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_CACHE_SIZE = 1024
+DEFAULT_TOKEN_CACHE_TTL = 300  # seconds, for tokens without an ``exp`` claim
+
+# sha256(token) -> (expires_at, user, payload), least recently used first.
+_verified_tokens: "OrderedDict[bytes, Tuple[float, ExternalJWTUser, dict]]" = OrderedDict()
+_verified_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_token_backend() -> TokenBackend:
+    """The process-wide TokenBackend, built once from ``SIMPLE_JWT``."""
+    signing_key = settings.SIMPLE_JWT.get("SIGNING_KEY", settings.SECRET_KEY)
+    algorithm = settings.SIMPLE_JWT.get("ALGORITHM", "HS256")
+    return TokenBackend(algorithm=algorithm, signing_key=signing_key)
+
+
+def _token_cache_setting(name: str, default: int) -> int:
+    return getattr(settings, "EVENTS_API", {}).get(name, default)
+
+
+def clear_token_cache() -> None:
+    with _verified_lock:
+        _verified_tokens.clear()
+
+
+@receiver(setting_changed)
+def _reset_on_setting_change(*, setting, **kwargs) -> None:
+    # A new key or algorithm must not keep accepting tokens verified under the old one.
+    if setting in ("SIMPLE_JWT", "SECRET_KEY"):
+        get_token_backend.cache_clear()
+        clear_token_cache()
+    elif setting == "EVENTS_API":
+        clear_token_cache()
+
+
+def _cached_token(key: bytes) -> Optional[Tuple[ExternalJWTUser, dict]]:
+    with _verified_lock:
+        entry = _verified_tokens.get(key)
+        if entry is None:
+            return None
+        expires_at, user, payload = entry
+        if expires_at <= time.time():
+            del _verified_tokens[key]
+            return None
+        _verified_tokens.move_to_end(key)
+    return user, dict(payload)
+
+
+def _cache_token(key: bytes, user: ExternalJWTUser, payload: dict) -> None:
+    size = _token_cache_setting("TOKEN_CACHE_SIZE", DEFAULT_TOKEN_CACHE_SIZE)
+    if size <= 0:
+        return
+    expires_at = time.time() + _token_cache_setting("TOKEN_CACHE_TTL", DEFAULT_TOKEN_CACHE_TTL)
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        # Never serve a token from the cache past its own expiry.
+        expires_at = min(expires_at, exp)
+    with _verified_lock:
+        _verified_tokens[key] = (expires_at, user, dict(payload))
+        _verified_tokens.move_to_end(key)
+        while len(_verified_tokens) > size:
+            _verified_tokens.popitem(last=False)
+
+
 class ExternalJWTAuthentication(BaseAuthentication):
     """
     Authenticate requests using the JWTs issued by the user-auth service.
     The token is decoded locally with the shared signing key, so no
-    additional network round-trip is required.
+    additional network round-trip is required. Verified tokens are kept in
+    a small in-process LRU cache (keyed by the token's SHA-256, never past
+    its ``exp``), so repeat requests skip the signature check.
     """
 
     keyword = "bearer"
 
     def __init__(self) -> None:
-        signing_key = settings.SIMPLE_JWT.get("SIGNING_KEY", settings.SECRET_KEY)
-        algorithm = settings.SIMPLE_JWT.get("ALGORITHM", "HS256")
-        self.token_backend = TokenBackend(algorithm=algorithm, signing_key=signing_key)
+        self.token_backend = get_token_backend()
 
     def authenticate(self, request: Request) -> Optional[Tuple[ExternalJWTUser, dict]]:
         auth_header = request.headers.get("Authorization")
-        print("53-auth_header: ", auth_header)
         if not auth_header:
             return None
 
@@ -62,8 +135,12 @@ class ExternalJWTAuthentication(BaseAuthentication):
         if scheme.lower() != self.keyword:
             return None
 
+        key = hashlib.sha256(token.encode()).digest()
+        cached = _cached_token(key)
+        if cached is not None:
+            return cached
+
         payload = self._decode_token(token)
-        print("payload: ",payload)
         raw_user_id = payload.get("user_id")
         if raw_user_id is None:
             raise AuthenticationFailed("Token payload missing user_id")
@@ -79,7 +156,8 @@ class ExternalJWTAuthentication(BaseAuthentication):
             username=payload.get("username"),
             role=payload.get("role")
         )
-        print("user: ", user)
+        logger.debug("Authenticated user %s (%s)", user.id, user.role)
+        _cache_token(key, user, payload)
         return (user, payload)
 
     def _decode_token(self, token: str) -> dict:
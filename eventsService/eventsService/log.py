@@ -0,0 +1,56 @@
+"""
+Logging building blocks referenced from ``settings.LOGGING``.
+
+``JSONFormatter`` writes one JSON object per record, including any
+``extra=`` fields. ``QueueStreamHandler`` formats a record on the calling
+thread, then hands it to a bounded queue that a background
+``QueueListener`` drains to the stream. A request thread therefore never
+waits on stdout. If the queue is full, the record is dropped and counted
+rather than blocking.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+# Attributes every LogRecord has; anything else on a record came from ``extra=``.
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRS)
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class QueueStreamHandler(QueueHandler):
+    def __init__(self, stream=None, maxsize: int = 10000) -> None:
+        super().__init__(queue.Queue(maxsize))
+        self.dropped = 0
+        # The record is already formatted by ``prepare``; write it as is.
+        self.listener = QueueListener(self.queue, logging.StreamHandler(stream))
+        self.listener.start()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        # Drain what is queued before the handler goes away (logging.shutdown).
+        if self.listener._thread is not None:
+            self.listener.stop()
+        super().close()
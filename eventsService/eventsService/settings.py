@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from . import database
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -51,13 +54,84 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'eventsService.authentication.ExternalJWTAuthentication',
     ],
+    # orjson-backed JSON with a stdlib fallback (see api/renderers.py).
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     # "DEFAULT_PERMISSION_CLASSES": [
     #     "rest_framework.permissions.IsAuthenticated",
     #     # "base.permissions.IsOwnerOrAdmin"
     # ],
 }
 
+# Tuning knobs for the events API (see api/pagination.py, api/cache.py,
+# api/metrics.py and eventsService/authentication.py).
+EVENTS_API = {
+    'PAGE_SIZE': 50,
+    'MAX_PAGE_SIZE': 200,
+    'RESPONSE_CACHE': 'default',  # alias in CACHES
+    'RESPONSE_CACHE_TIMEOUT': 60,
+    # Largest batch accepted by the /api/events/bulk/ endpoints (api/bulk.py).
+    'BULK_MAX_ITEMS': 5000,
+    # Verified-JWT cache in eventsService/authentication.py (0 disables it).
+    'TOKEN_CACHE_SIZE': 1024,
+    'TOKEN_CACHE_TTL': 300,
+    # Fraction of successful requests logged per route name (default 1.0);
+    # 4xx/5xx responses are always logged.
+    'REQUEST_LOG_SAMPLE_RATES': {
+        'healthCheck': 0.01,
+        'getEvents': 0.1,
+        'getEvent': 0.1,
+    },
+    # Per-route latency/query/size histograms served on /metrics (api/metrics.py).
+    'METRICS': True,
+    # Longest window /api/events/calendar/ serves, in days (api/windows.py).
+    'CALENDAR_MAX_DAYS': 62,
+    # Journal mode ``manage.py set_journal_mode`` switches SQLite files to
+    # (eventsService/database.py).
+    'SQLITE_JOURNAL_MODE': database.journal_mode(os.environ),
+}
+
+# JSON logs to stdout. Records are formatted on the request thread and
+# written by a background listener (see eventsService/log.py).
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'json': {'()': 'eventsService.log.JSONFormatter'},
+    },
+    'handlers': {
+        'queue': {
+            'class': 'eventsService.log.QueueStreamHandler',
+            'formatter': 'json',
+            'stream': 'ext://sys.stdout',
+        },
+    },
+    'loggers': {
+        name: {'handlers': ['queue'], 'level': os.environ.get('EVENTS_LOG_LEVEL', 'INFO'), 'propagate': False}
+        for name in ('api', 'base', 'eventsService')
+    },
+}
+
+# Swap the backend (e.g. django.core.cache.backends.redis.RedisCache) to
+# share the response cache between workers.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'events-service',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
+
 MIDDLEWARE = [
+    'api.metrics.MetricsMiddleware',
+    'api.middleware.RequestLogMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -91,12 +165,16 @@ WSGI_APPLICATION = 'eventsService.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.0/ref/settings/#databases
 
+# Chosen by EVENTS_DATABASE_URL (db.sqlite3 by default), with persistent
+# connections, SQLite pragmas and the optional Postgres pool described in
+# eventsService/database.py.
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database.config(os.environ, default_sqlite=BASE_DIR / 'db.sqlite3'),
 }
+if DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    # A file-backed test database (instead of shared-cache :memory:) so
+    # concurrent test threads wait on SQLite's lock rather than failing.
+    DATABASES['default']['TEST'] = {'NAME': BASE_DIR / 'test_db.sqlite3'}
 
 
 # Password validation
@@ -16,8 +16,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from api import views as api_views
+
 urlpatterns = [
     # path('admin/', admin.site.urls),
     path('api/', include('api.urls')),
+    path('metrics', api_views.getMetrics, name='metrics'),
     # path('api-auth/', include('rest_framework.urls'))
 ]